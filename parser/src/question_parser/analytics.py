@@ -0,0 +1,295 @@
+"""Vectorized analytics over exported quiz answers.
+
+Requires NumPy (`pip install quiz-builder-parser[analytics]`).
+
+Exports are NDJSON with one respondent per line, in the shape the web app
+persists its quiz state:
+
+    {"answers": [{"questionId": 1, "selectedLabel": "B"}, ...]}
+
+Answers are loaded into an int8 matrix of respondents x questions holding
+label codes (index into LABEL_CHOICES), with UNANSWERED for skipped questions.
+"""
+
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import chain, islice, repeat
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from question_parser.defaults import LABEL_CHOICES, QUESTION_ID_START
+from question_parser.models import Quiz
+
+# Code stored for questions a respondent did not answer
+UNANSWERED = -1
+
+# Respondents per chunk when streaming an export
+DEFAULT_CHUNK_SIZE = 100_000
+
+_LABEL_CODES = {label: code for code, label in enumerate(LABEL_CHOICES)}
+
+ResponseMatrix = npt.NDArray[np.int8]
+
+
+def iter_response_chunks(
+    source: str | Path | Iterable[str],
+    num_questions: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[ResponseMatrix]:
+    """Stream an answer export as response matrices of at most chunk_size rows.
+
+    Only one chunk is held in memory at a time, so exports larger than
+    memory can be processed. Answers to unknown question ids or with unknown
+    labels are dropped, as are malformed ones (null or non-string labels,
+    non-integer ids). Malformed lines, such as invalid JSON or a value that
+    is not an object with a list of answers, are skipped and add no row.
+
+    Args:
+        source: Path to an NDJSON export, or an iterable of its lines
+        num_questions: Number of questions in the quiz
+        chunk_size: Maximum respondents per chunk
+
+    Yields:
+        int8 arrays of shape (respondents, num_questions)
+    """
+    if isinstance(source, str | Path):
+        with open(source, encoding="utf-8") as export:
+            yield from iter_response_chunks(export, num_questions, chunk_size)
+        return
+
+    lines = (line for line in source if line.strip())
+    while chunk := list(islice(lines, chunk_size)):
+        yield _chunk_to_matrix(chunk, num_questions)
+
+
+def load_responses(source: str | Path | Iterable[str], num_questions: int) -> ResponseMatrix:
+    """Load a whole answer export into one response matrix.
+
+    Args:
+        source: Path to an NDJSON export, or an iterable of its lines
+        num_questions: Number of questions in the quiz
+
+    Returns:
+        int8 array of shape (respondents, num_questions)
+    """
+    chunks = list(iter_response_chunks(source, num_questions))
+    if not chunks:
+        return np.empty((0, num_questions), dtype=np.int8)
+    return np.concatenate(chunks)
+
+
+def _chunk_to_matrix(lines: list[str], num_questions: int) -> ResponseMatrix:
+    """Convert export lines into a response matrix with one fancy-indexed assignment.
+
+    Each line is decoded once, and its answers are flattened into row,
+    column and label code arrays by table lookups, without a Python loop
+    over the answers of well-formed lines. Answers without an integer
+    question id in the quiz or a known string label get no cell, and lines
+    that are not JSON objects with a list of answers get no row.
+    """
+    records = [answers for answers in map(_line_answers, lines) if answers is not None]
+    matrix = np.full((len(records), num_questions), UNANSWERED, dtype=np.int8)
+
+    answers = _only(list(chain.from_iterable(records)), dict, {})
+    if not answers:
+        return matrix
+
+    # Exact types: bool is an int subclass, but true and false are not ids
+    ids = _only(list(map(dict.get, answers, repeat("questionId"))), int)
+    labels = _only(list(map(dict.get, answers, repeat("selectedLabel"))), str)
+    column_of = {QUESTION_ID_START + column: column for column in range(num_questions)}
+
+    rows = np.repeat(np.arange(len(records)), [len(record) for record in records])
+    columns = np.fromiter(map(column_of.get, ids, repeat(-1)), dtype=np.intp, count=len(ids))
+    codes = np.fromiter(
+        map(_LABEL_CODES.get, labels, repeat(UNANSWERED)), dtype=np.int8, count=len(labels)
+    )
+
+    valid = (columns >= 0) & (codes >= 0)
+    matrix[rows[valid], columns[valid]] = codes[valid]
+    return matrix
+
+
+def _only(values: list[Any], kind: type, default: Any = None) -> list[Any]:
+    """Replace values whose type is not exactly kind with default.
+
+    Returns values itself when there is nothing to replace, which is the
+    case for well-formed exports.
+    """
+    if set(map(type, values)) <= {kind}:
+        return values
+    return [value if type(value) is kind else default for value in values]
+
+
+def _line_answers(line: str) -> list[Any] | None:
+    """Return the answers recorded on one export line, or None if it is malformed."""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict):
+        return None
+    answers = record.get("answers", [])
+    return answers if isinstance(answers, list) else None
+
+
+class AnswerAnalytics:
+    """Per-question statistics accumulated over response matrices.
+
+    Feed chunks with `add` (or use `analyze_export`); every statistic is
+    kept as running sums, so results are identical whether the export is
+    added in one piece or streamed.
+
+    Attributes:
+        quiz: The quiz the answers belong to
+        respondents: Number of respondents added so far
+        choice_counts: int64 array (questions x labels) of how often each label was chosen
+    """
+
+    def __init__(self, quiz: Quiz, answer_key: Mapping[int, str] | None = None) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            quiz: The quiz the answers belong to
+            answer_key: Correct label per question id; needed for discrimination
+
+        Raises:
+            ValueError: If the answer key names unknown questions or labels
+        """
+        self.quiz = quiz
+        num_questions = len(quiz.questions)
+        self.respondents = 0
+        self.choice_counts = np.zeros((num_questions, len(LABEL_CHOICES)), dtype=np.int64)
+
+        self._key: npt.NDArray[np.int8] | None = None
+        if answer_key is not None:
+            self._key = _key_to_codes(answer_key, num_questions)
+
+        # Running sums for item-rest correlations; x is 1 for a correct answer
+        # and T is the respondent's total score
+        self._sum_x = np.zeros(num_questions, dtype=np.float64)
+        self._sum_xt = np.zeros(num_questions, dtype=np.float64)
+        self._sum_t = 0.0
+        self._sum_tt = 0.0
+
+    def add(self, responses: ResponseMatrix) -> None:
+        """Add a response matrix of shape (respondents, questions)."""
+        num_questions, num_labels = self.choice_counts.shape
+        if responses.ndim != 2 or responses.shape[1] != num_questions:
+            raise ValueError(
+                f"Expected responses with {num_questions} columns, got shape {responses.shape}"
+            )
+
+        answered = responses >= 0
+        flat = np.nonzero(answered)[1] * num_labels + responses[answered]
+        self.choice_counts += np.bincount(flat, minlength=num_questions * num_labels).reshape(
+            num_questions, num_labels
+        )
+        self.respondents += responses.shape[0]
+
+        if self._key is not None:
+            correct = (responses == self._key).astype(np.float64)
+            totals = correct.sum(axis=1)
+            self._sum_x += correct.sum(axis=0)
+            self._sum_xt += totals @ correct
+            self._sum_t += totals.sum()
+            self._sum_tt += totals @ totals
+
+    def response_counts(self) -> npt.NDArray[np.int64]:
+        """Return the number of respondents who answered each question."""
+        counts: npt.NDArray[np.int64] = self.choice_counts.sum(axis=1)
+        return counts
+
+    def choice_distribution(self) -> npt.NDArray[np.float64]:
+        """Return the share of each label among answers, per question (rows sum to 1).
+
+        Questions nobody answered have a row of zeros.
+        """
+        counts = self.response_counts()[:, np.newaxis]
+        return np.divide(
+            self.choice_counts,
+            counts,
+            out=np.zeros(self.choice_counts.shape, dtype=np.float64),
+            where=counts > 0,
+        )
+
+    def difficulty(self) -> npt.NDArray[np.float64]:
+        """Return the share of respondents answering each question correctly.
+
+        Raises:
+            ValueError: If no answer key was given
+        """
+        self._require_key()
+        if self.respondents == 0:
+            return np.zeros_like(self._sum_x)
+        return self._sum_x / self.respondents
+
+    def discrimination(self) -> npt.NDArray[np.float64]:
+        """Return the item-rest point-biserial correlation of each question.
+
+        Correlates getting the question right with the score on the other
+        questions. Undefined correlations (no variance) are NaN.
+
+        Raises:
+            ValueError: If no answer key was given
+        """
+        self._require_key()
+        n = self.respondents
+        # Rest score R = T - x, and x*x == x for 0/1 scores
+        sum_r = self._sum_t - self._sum_x
+        sum_rr = self._sum_tt - 2 * self._sum_xt + self._sum_x
+        sum_xr = self._sum_xt - self._sum_x
+
+        covariance = n * sum_xr - self._sum_x * sum_r
+        variance_x = n * self._sum_x - self._sum_x**2
+        variance_r = n * sum_rr - sum_r**2
+        denominator = np.sqrt(variance_x * variance_r)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result: npt.NDArray[np.float64] = np.where(
+                denominator > 0, covariance / denominator, np.nan
+            )
+        return result
+
+    def _require_key(self) -> None:
+        if self._key is None:
+            raise ValueError("An answer key is required for this statistic")
+
+
+def _key_to_codes(answer_key: Mapping[int, str], num_questions: int) -> npt.NDArray[np.int8]:
+    """Convert an answer key into one label code per question column."""
+    codes = np.full(num_questions, UNANSWERED - 1, dtype=np.int8)
+    for question_id, label in answer_key.items():
+        column = question_id - QUESTION_ID_START
+        if not 0 <= column < num_questions:
+            raise ValueError(f"Answer key has unknown question {question_id}")
+        if label not in LABEL_CHOICES:
+            raise ValueError(f"Answer key has invalid label {label!r} for question {question_id}")
+        codes[column] = LABEL_CHOICES.index(label)
+    return codes
+
+
+def analyze_export(
+    source: str | Path | Iterable[str],
+    quiz: Quiz,
+    answer_key: Mapping[int, str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AnswerAnalytics:
+    """Stream an answer export through AnswerAnalytics in bounded memory.
+
+    Args:
+        source: Path to an NDJSON export, or an iterable of its lines
+        quiz: The quiz the answers belong to
+        answer_key: Correct label per question id; needed for discrimination
+        chunk_size: Maximum respondents held in memory at once
+
+    Returns:
+        The accumulated statistics
+    """
+    analytics = AnswerAnalytics(quiz, answer_key)
+    for chunk in iter_response_chunks(source, len(quiz.questions), chunk_size):
+        analytics.add(chunk)
+    return analytics
@@ -0,0 +1,254 @@
+"""Throughput and memory benchmarks with a regression gate against stored baselines."""
+
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+from question_parser.batch import BatchMode, convert_batch
+from question_parser.extractor import DocxExtractor
+from question_parser.normalize import TextNormalizer
+from question_parser.parser import QuestionParser
+from question_parser.profiling import profile_conversion
+from question_parser.synthetic import synthetic_docx
+
+# Default synthetic corpus and gate settings
+DEFAULT_QUESTIONS = 2000
+DEFAULT_SEED = 0
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.10
+
+# Number of documents the corpus is split into for the batch benchmarks
+BATCH_FILES = 8
+
+_MEGABYTE = 1024 * 1024
+
+
+class Metric(BaseModel):
+    """A single benchmark measurement.
+
+    Attributes:
+        value: Measured value
+        unit: Unit of the value (ex: questions/s)
+        higher_is_better: Whether an increase is an improvement
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    value: float
+    unit: str
+    higher_is_better: bool
+
+
+class Corpus(BaseModel):
+    """Description of the synthetic corpus a benchmark ran against.
+
+    Attributes:
+        questions: Number of questions in the document
+        seed: Seed used to generate the document
+        size_bytes: Size of the generated DOCX file
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    questions: int
+    seed: int
+    size_bytes: int
+
+
+class BenchmarkResult(BaseModel):
+    """Metrics from one benchmark run, stored as the baseline JSON.
+
+    Attributes:
+        corpus: The corpus the metrics were measured on
+        metrics: Measurements keyed by metric name
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    corpus: Corpus
+    metrics: dict[str, Metric]
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Serialize to JSON string with pretty formatting."""
+        return super().model_dump_json(indent=2, **kwargs)
+
+
+class Regression(BaseModel):
+    """A metric that got worse than the baseline by more than the threshold.
+
+    Attributes:
+        metric: Metric name
+        baseline: Baseline value
+        current: Value from the new run
+        change: Relative change from the baseline (ex: -0.3 is 30% lower)
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    metric: str
+    baseline: float
+    current: float
+    change: float
+
+
+def run_benchmark(
+    num_questions: int = DEFAULT_QUESTIONS,
+    seed: int = DEFAULT_SEED,
+    repeat: int = DEFAULT_REPEAT,
+) -> BenchmarkResult:
+    """Benchmark a synthetic corpus.
+
+    Measures a full DOCX to JSON conversion, a validation-only check of the
+    DOCX, streaming paragraph extraction with and without text normalization,
+    plus parsing of the extracted paragraphs with per-object and bulk
+    validation, and batch conversion of the corpus split into BATCH_FILES
+    documents on thread and process pools. Throughput uses the
+    fastest of `repeat` timed runs. Peak memory comes from a separate run
+    under tracemalloc, which would otherwise skew timings.
+
+    Args:
+        num_questions: Number of questions in the synthetic document
+        seed: Seed used to generate the document
+        repeat: Number of timed runs
+
+    Returns:
+        The measured metrics
+    """
+    data = synthetic_docx(num_questions, seed=seed)
+
+    extractor = DocxExtractor()
+    parser = QuestionParser()
+    bulk_parser = QuestionParser(bulk_validation=True)
+    convert = _best_time(lambda: parser.parse(extractor.extract(data)).model_dump_json(), repeat)
+
+    check = _best_time(lambda: parser.check(extractor.iter_paragraphs(data)), repeat)
+
+    normalizing_extractor = DocxExtractor(TextNormalizer())
+    num_paragraphs = len(list(extractor.iter_paragraphs(data)))
+    extract = _best_time(lambda: list(extractor.iter_paragraphs(data)), repeat)
+    extract_normalized = _best_time(
+        lambda: list(normalizing_extractor.iter_paragraphs(data)), repeat
+    )
+
+    paragraphs = extractor.extract(data)
+    parse = _best_time(lambda: parser.parse(paragraphs), repeat)
+    parse_bulk = _best_time(lambda: bulk_parser.parse(paragraphs), repeat)
+
+    batch_thread = _time_batch(num_questions, seed, "thread", repeat)
+    batch_process = _time_batch(num_questions, seed, "process", repeat)
+
+    _, memory = profile_conversion(data, top=0)
+
+    return BenchmarkResult(
+        corpus=Corpus(questions=num_questions, seed=seed, size_bytes=len(data)),
+        metrics={
+            "convert.questions_per_second": Metric(
+                value=num_questions / convert, unit="questions/s", higher_is_better=True
+            ),
+            "convert.megabytes_per_second": Metric(
+                value=len(data) / _MEGABYTE / convert, unit="MB/s", higher_is_better=True
+            ),
+            "convert.peak_memory_bytes": Metric(
+                value=memory.peak_bytes, unit="bytes", higher_is_better=False
+            ),
+            "check.questions_per_second": Metric(
+                value=num_questions / check, unit="questions/s", higher_is_better=True
+            ),
+            "extract.paragraphs_per_second": Metric(
+                value=num_paragraphs / extract, unit="paragraphs/s", higher_is_better=True
+            ),
+            "extract_normalized.paragraphs_per_second": Metric(
+                value=num_paragraphs / extract_normalized,
+                unit="paragraphs/s",
+                higher_is_better=True,
+            ),
+            "parse.questions_per_second": Metric(
+                value=num_questions / parse, unit="questions/s", higher_is_better=True
+            ),
+            "parse_bulk.questions_per_second": Metric(
+                value=num_questions / parse_bulk, unit="questions/s", higher_is_better=True
+            ),
+            "batch_thread.questions_per_second": Metric(
+                value=num_questions / batch_thread, unit="questions/s", higher_is_better=True
+            ),
+            "batch_process.questions_per_second": Metric(
+                value=num_questions / batch_process, unit="questions/s", higher_is_better=True
+            ),
+        },
+    )
+
+
+def _time_batch(num_questions: int, seed: int, mode: BatchMode, repeat: int) -> float:
+    """Time batch conversion of the corpus split into BATCH_FILES documents."""
+    sizes = [num_questions // BATCH_FILES] * BATCH_FILES
+    for index in range(num_questions % BATCH_FILES):
+        sizes[index] += 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index, size in enumerate(size for size in sizes if size):
+            path = Path(directory) / f"quiz-{index}.docx"
+            path.write_bytes(synthetic_docx(size, seed=seed + index))
+            paths.append(path)
+        return _best_time(lambda: convert_batch(paths, mode=mode), repeat)
+
+
+def _best_time(func: Callable[[], object], repeat: int) -> float:
+    """Return the fastest wall-clock time of `repeat` calls to func, in seconds."""
+    best = float("inf")
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def find_regressions(
+    baseline: BenchmarkResult,
+    current: BenchmarkResult,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """Compare a run against a baseline.
+
+    Metrics missing from either run are skipped, so adding a metric does not
+    fail the gate until a new baseline is recorded.
+
+    Args:
+        baseline: Stored baseline run
+        current: New run to check
+        threshold: Largest allowed relative regression (ex: 0.1 for 10%)
+
+    Returns:
+        Metrics that regressed by more than the threshold
+
+    Raises:
+        ValueError: If the runs used different corpora
+    """
+    if (baseline.corpus.questions, baseline.corpus.seed) != (
+        current.corpus.questions,
+        current.corpus.seed,
+    ):
+        raise ValueError(
+            f"Corpus mismatch: baseline used {baseline.corpus.questions} questions "
+            f"(seed {baseline.corpus.seed}), current run used {current.corpus.questions} "
+            f"(seed {current.corpus.seed})"
+        )
+
+    regressions: list[Regression] = []
+    for name, old in baseline.metrics.items():
+        new = current.metrics.get(name)
+        if new is None or old.value == 0:
+            continue
+
+        change = (new.value - old.value) / old.value
+        worse = -change if old.higher_is_better else change
+        if worse > threshold:
+            regressions.append(
+                Regression(metric=name, baseline=old.value, current=new.value, change=change)
+            )
+
+    return regressions
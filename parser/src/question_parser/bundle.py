@@ -0,0 +1,102 @@
+"""Content-hashed, precompressed quiz bundles for static hosting.
+
+A bundle directory holds the quiz JSON under a name derived from its
+contents, precompressed siblings, and a small manifest pointing at them:
+
+    quiz.3f5a9c0e1b2d4f68.json
+    quiz.3f5a9c0e1b2d4f68.json.gz
+    quiz.3f5a9c0e1b2d4f68.json.br   (only if the brotli package is installed)
+    quiz-manifest.json
+
+Hashed files never change once written, so they can be served with
+long-lived cache headers; only the manifest needs revalidating. Compression
+happens once, when the bundle is written.
+"""
+
+import gzip
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+try:
+    import brotli  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Name of the manifest the web app fetches to find the current quiz file
+MANIFEST_NAME = "quiz-manifest.json"
+
+# Hex digits of the content hash used in file names
+HASH_LENGTH = 16
+
+
+class BundleManifest(BaseModel):
+    """Pointer from the web app to the current quiz file.
+
+    Attributes:
+        file: Name of the quiz JSON, relative to the manifest
+        sha256: Hex SHA-256 digest of the uncompressed quiz JSON
+        size: Size of the uncompressed quiz JSON in bytes
+        encodings: Precompressed variants written next to the file, e.g. ["br", "gzip"]
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    file: str
+    sha256: str
+    size: int
+    encodings: list[str]
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Serialize to JSON string with pretty formatting."""
+        return super().model_dump_json(indent=2, **kwargs)
+
+
+def write_bundle(json_text: str, directory: str | Path, name: str = "quiz") -> BundleManifest:
+    """Write quiz JSON as a content-hashed bundle.
+
+    The hashed files are written before the manifest, and the manifest is
+    replaced atomically, so a client never sees a manifest pointing at a
+    missing file. Files from earlier bundles are left in place for clients
+    that still reference them.
+
+    Args:
+        json_text: The quiz JSON
+        directory: Directory to write to; created if missing
+        name: Prefix of the quiz file names
+
+    Returns:
+        The manifest that was written
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    data = json_text.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    file_name = f"{name}.{digest[:HASH_LENGTH]}.json"
+
+    _write_atomic(directory / file_name, data)
+    encodings: list[str] = []
+    if brotli is not None:
+        _write_atomic(directory / f"{file_name}.br", brotli.compress(data, quality=11))
+        encodings.append("br")
+    # mtime=0 keeps the gzip output identical for identical input
+    _write_atomic(directory / f"{file_name}.gz", gzip.compress(data, compresslevel=9, mtime=0))
+    encodings.append("gzip")
+
+    manifest = BundleManifest(file=file_name, sha256=digest, size=len(data), encodings=encodings)
+    _write_atomic(directory / MANIFEST_NAME, manifest.model_dump_json().encode("utf-8"))
+    return manifest
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temporary sibling, so readers never see it half-written."""
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as f:
+        f.write(data)
+    # Temporary files are private; bundles are meant to be served
+    os.chmod(f.name, 0o644)
+    os.replace(f.name, path)
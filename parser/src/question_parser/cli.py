@@ -4,49 +4,652 @@ from pathlib import Path
 
 import click
 
-from question_parser.errors import QuestionParserError
+from question_parser.batch import default_workers
+from question_parser.benchmark import (
+    DEFAULT_QUESTIONS,
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    BenchmarkResult,
+    find_regressions,
+    run_benchmark,
+)
+from question_parser.bundle import MANIFEST_NAME, write_bundle
+from question_parser.defaults import QUESTION_ID_START
+from question_parser.diff import diff_files, format_diff
+from question_parser.errors import ParsingError, QuestionParserError
 from question_parser.extractor import DocxExtractor
+from question_parser.loader import load_quiz
+from question_parser.loadtest import (
+    http_target,
+    in_process_target,
+    parse_server,
+    run_load_test,
+    synthetic_payloads,
+)
+from question_parser.merge import merge_quizzes
+from question_parser.normalize import TextNormalizer
 from question_parser.parser import QuestionParser
+from question_parser.partial import IndexCache, parse_question_range
+from question_parser.profiling import profile_conversion
+from question_parser.streaming import QuizWriter, convert_bounded
+from question_parser.variants import VariantGenerator
+
+# Multipliers for size suffixes accepted by --max-memory
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def _parse_size(ctx: click.Context, param: click.Parameter, value: str | None) -> int | None:
+    """Convert a size such as 512K, 64M or 1G (or plain bytes) to a number of bytes."""
+    if value is None:
+        return None
+
+    text = value.strip().upper().removesuffix("B")
+    number, unit = text, ""
+    if text[-1:] in _SIZE_UNITS:
+        number, unit = text[:-1], text[-1]
+    try:
+        size = int(number) * _SIZE_UNITS[unit]
+    except ValueError:
+        raise click.BadParameter(f"{value!r} is not a size such as 512K, 64M or 1G") from None
+    if size <= 0:
+        raise click.BadParameter(f"{value!r} is not a positive size")
+    return size
+
+
+def _parse_range(
+    ctx: click.Context, param: click.Parameter, value: str | None
+) -> tuple[int, int] | None:
+    """Convert a question range such as 500-520, or a single id such as 7, to (start, end)."""
+    if value is None:
+        return None
+
+    start, _, end = value.partition("-")
+    try:
+        bounds = int(start), int(end or start)
+    except ValueError:
+        raise click.BadParameter(f"{value!r} is not a range such as 500-520") from None
+    if not QUESTION_ID_START <= bounds[0] <= bounds[1]:
+        raise click.BadParameter(
+            f"{value!r} must start at {QUESTION_ID_START} or later and not end before it starts"
+        )
+    return bounds
 
 
-@click.command()
-@click.argument("input_file", type=click.Path(exists=True, path_type=Path))
+class DefaultCommandGroup(click.Group):
+    """Command group that falls back to a default command.
+
+    Keeps `question-parser quiz.docx` working alongside named subcommands.
+    """
+
+    default_command = "parse"
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        """Insert the default command when the first argument names no subcommand."""
+        if args and args[0] not in self.commands and args[0] not in ctx.help_option_names:
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup)
+def main() -> None:
+    """Parse DOCX quiz files into structured JSON.
+
+    Runs the parse command when no command is given.
+    """
+
+
+@main.command()
+@click.argument("input_file", type=click.Path(exists=True, allow_dash=True, path_type=Path))
 @click.option(
     "--output",
     "-o",
     type=click.Path(path_type=Path),
     help="Output file path (default: stdout)",
 )
-def main(input_file: Path, output: Path | None) -> None:
+@click.option(
+    "--memory-report",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write per-stage peak memory and top allocation sites as JSON to this path",
+)
+@click.option(
+    "--bundle",
+    type=click.Path(file_okay=False, path_type=Path),
+    help=f"Write content-hashed, precompressed quiz files and {MANIFEST_NAME} to this directory",
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Only report problems, without converting; exits 1 if there are any",
+)
+@click.option(
+    "--normalize",
+    is_flag=True,
+    help="Normalize Unicode, drop invisible characters, make smart punctuation ASCII "
+    "and fold whitespace in every paragraph",
+)
+@click.option(
+    "--max-memory",
+    callback=_parse_size,
+    help="Stream the conversion, keeping buffers within this budget (e.g. 256M)",
+)
+@click.option(
+    "--questions",
+    "question_range",
+    callback=_parse_range,
+    help="Only parse this range of questions (e.g. 500-520), stopping once it is read. "
+    "Ids are kept, so the output is a preview, not a loadable quiz",
+)
+@click.option(
+    "--index-cache",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="With --questions, keep question indexes here and seek straight to the range",
+)
+@click.pass_context
+def parse(
+    ctx: click.Context,
+    input_file: Path,
+    output: Path | None,
+    memory_report: Path | None,
+    bundle: Path | None,
+    check: bool,
+    normalize: bool,
+    max_memory: int | None,
+    question_range: tuple[int, int] | None,
+    index_cache: Path | None,
+) -> None:
     """Parse a DOCX quiz file and output structured JSON.
 
-    INPUT_FILE: Path to the DOCX file containing quiz questions
+    INPUT_FILE: Path to the DOCX file containing quiz questions, or - to read stdin
     """
+    normalizer = TextNormalizer() if normalize else None
+    if index_cache and not question_range:
+        raise click.UsageError("--index-cache requires --questions")
+    if question_range:
+        if check or memory_report or bundle or max_memory is not None:
+            raise click.UsageError(
+                "--questions cannot be combined with --check, --memory-report, --bundle "
+                "or --max-memory"
+            )
+        _parse_range_only(input_file, output, question_range, index_cache, normalizer)
+        return
+
+    if check:
+        if output or memory_report or bundle or max_memory is not None:
+            raise click.UsageError(
+                "--check cannot be combined with --output, --memory-report, --bundle "
+                "or --max-memory"
+            )
+        if not _check(input_file, normalizer):
+            ctx.exit(1)
+        return
+
+    if bundle and output:
+        raise click.UsageError("--bundle cannot be combined with --output")
+    if max_memory is not None:
+        if memory_report or bundle:
+            raise click.UsageError(
+                "--max-memory cannot be combined with --memory-report or --bundle"
+            )
+        _parse_bounded(input_file, output, max_memory, normalizer)
+        return
+
+    source = _read_source(input_file)
     try:
-        # Extract paragraphs from DOCX
-        extractor = DocxExtractor()
-        paragraphs = extractor.extract(input_file)
+        if memory_report:
+            json_output, report = profile_conversion(source, normalizer=normalizer)
+            memory_report.write_text(report.model_dump_json())
+            click.echo(f"Memory report written to {memory_report}", err=True)
+        else:
+            # Extract paragraphs from DOCX, with their positions for error messages
+            extractor = DocxExtractor(normalizer)
+            paragraphs, positions = extractor.extract_with_positions(source)
 
-        # Parse paragraphs into Quiz
-        parser = QuestionParser()
-        quiz = parser.parse(paragraphs)
+            # Parse paragraphs into Quiz
+            parser = QuestionParser()
+            quiz, _ = parser.parse_with_sources(paragraphs, positions)
 
-        # Output JSON
-        json_output = quiz.model_dump_json()
+            # Output JSON
+            json_output = quiz.model_dump_json()
 
-        if output:
+        if bundle:
+            manifest = write_bundle(json_output, bundle)
+            click.echo(f"Quiz bundle written to {bundle / manifest.file}", err=True)
+        elif output:
             output.write_text(json_output)
             click.echo(f"Quiz written to {output}", err=True)
         else:
             click.echo(json_output)
 
     except QuestionParserError as e:
-        click.echo(f"Error: {e.message}", err=True)
+        click.echo(f"Error: {_describe_error(e)}", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        raise click.Abort() from e
+
+
+def _describe_error(error: QuestionParserError) -> str:
+    """Error message with its paragraph number in the document, counted from 1, if known."""
+    if isinstance(error, ParsingError):
+        return _locate(error.message, error.paragraph)
+    return error.message
+
+
+def _locate(message: str, paragraph: int | None) -> str:
+    """Append a source position to a message as a paragraph number counted from 1."""
+    if paragraph is None:
+        return message
+    return f"{message} (paragraph {paragraph + 1})"
+
+
+def _check(input_file: Path, normalizer: TextNormalizer | None) -> bool:
+    """Report every problem in a document, returning whether there were none."""
+    try:
+        with click.open_file(str(input_file), "rb") as source:
+            paragraphs = DocxExtractor(normalizer).iter_paragraphs_with_positions(source)
+            result = QuestionParser().check_with_positions(paragraphs)
+    except ValueError as e:
+        click.echo(f"{input_file}: {e}")
+        return False
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        raise click.Abort() from e
+
+    for problem, paragraph in zip(result.problems, result.paragraphs, strict=True):
+        click.echo(f"{input_file}: {_locate(problem, paragraph)}")
+    if result.ok:
+        click.echo(f"{input_file}: OK, {result.questions} questions")
+    return result.ok
+
+
+def _parse_bounded(
+    input_file: Path, output: Path | None, max_memory: int, normalizer: TextNormalizer | None
+) -> None:
+    """Convert with bounded memory, streaming stdin instead of reading it whole."""
+    try:
+        with (
+            click.open_file(str(input_file), "rb") as source,
+            click.open_file(str(output) if output else "-", "w", encoding="utf-8") as stream,
+        ):
+            convert_bounded(source, stream, max_memory, normalizer)
+            if not output:
+                stream.write("\n")
+
+    except QuestionParserError as e:
+        click.echo(f"Error: {_describe_error(e)}", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        raise click.Abort() from e
+
+    if output:
+        click.echo(f"Quiz written to {output}", err=True)
+
+
+def _parse_range_only(
+    input_file: Path,
+    output: Path | None,
+    question_range: tuple[int, int],
+    index_cache: Path | None,
+    normalizer: TextNormalizer | None,
+) -> None:
+    """Parse a range of questions, written in the quiz JSON layout with their original ids.
+
+    Unless the range starts at QUESTION_ID_START, the output is a preview:
+    Quiz validation and the quiz JSON reader reject it.
+    """
+    start, end = question_range
+    source = _read_source(input_file)
+    cache = IndexCache(index_cache) if index_cache else None
+    try:
+        questions = parse_question_range(source, start, end, cache, normalizer)
+        with click.open_file(str(output) if output else "-", "w", encoding="utf-8") as stream:
+            with QuizWriter(stream, first_id=start) as writer:
+                for question in questions:
+                    writer.write(question)
+            if not output:
+                stream.write("\n")
+
+    except QuestionParserError as e:
+        click.echo(f"Error: {_describe_error(e)}", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        raise click.Abort() from e
+
+    if output:
+        click.echo(f"Questions {start}-{questions[-1].id} written to {output}", err=True)
+
+
+def _read_source(input_file: Path) -> bytes | Path:
+    """Return the DOCX bytes from stdin for "-", otherwise the path itself."""
+    if str(input_file) == "-":
+        with click.open_file("-", "rb") as stdin:
+            data: bytes = stdin.read()
+        return data
+    return input_file
+
+
+@main.command()
+@click.argument("baseline", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "--threshold",
+    type=float,
+    default=DEFAULT_THRESHOLD,
+    show_default=True,
+    help="Largest allowed relative regression per metric (0.1 = 10%)",
+)
+@click.option(
+    "--questions",
+    type=click.IntRange(min=1),
+    help=f"Questions in the synthetic corpus (default: baseline's, else {DEFAULT_QUESTIONS})",
+)
+@click.option(
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=DEFAULT_REPEAT,
+    show_default=True,
+    help="Timed runs per metric; the fastest is kept",
+)
+@click.option("--update", is_flag=True, help="Record this run as the new baseline")
+@click.pass_context
+def bench(
+    ctx: click.Context,
+    baseline: Path,
+    threshold: float,
+    questions: int | None,
+    repeat: int,
+    update: bool,
+) -> None:
+    """Benchmark a synthetic corpus and compare it against a stored baseline.
+
+    Exits non-zero when any metric regresses beyond the threshold.
+
+    BASELINE: Baseline JSON file, written on the first run or with --update
+    """
+    stored = None
+    if baseline.exists() and not update:
+        stored = BenchmarkResult.model_validate_json(baseline.read_text())
+
+    if questions is None:
+        questions = stored.corpus.questions if stored else DEFAULT_QUESTIONS
+    seed = stored.corpus.seed if stored else 0
+
+    result = run_benchmark(questions, seed=seed, repeat=repeat)
+    for name, metric in result.metrics.items():
+        click.echo(f"{name}: {metric.value:,.2f} {metric.unit}")
+
+    if stored is None:
+        baseline.write_text(result.model_dump_json())
+        click.echo(f"Baseline written to {baseline}", err=True)
+        return
+
+    try:
+        regressions = find_regressions(stored, result, threshold)
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.Abort() from e
+
+    for regression in regressions:
+        click.echo(
+            f"Regression: {regression.metric} {regression.baseline:,.2f} -> "
+            f"{regression.current:,.2f} ({regression.change:+.1%})",
+            err=True,
+        )
+    if regressions:
+        ctx.exit(1)
+
+
+@main.command()
+@click.argument("input_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--count",
+    "-n",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of variants to generate",
+)
+@click.option("--seed", type=int, default=0, show_default=True, help="Seed shared by all variants")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["ndjson", "json"]),
+    default="ndjson",
+    show_default=True,
+    help="One variant per line, or a single JSON document",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Output file path (default: stdout)",
+)
+def variants(
+    input_file: Path, count: int, seed: int, output_format: str, output: Path | None
+) -> None:
+    """Generate shuffled quiz variants with answer-key mappings.
+
+    The same seed always produces the same variants.
+
+    INPUT_FILE: DOCX file or quiz JSON to generate variants of
+    """
+    try:
+        quiz = load_quiz(input_file)
+    except QuestionParserError as e:
+        click.echo(f"Error: {_describe_error(e)}", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        raise click.Abort() from e
+
+    generator = VariantGenerator(quiz, seed=seed)
+    with click.open_file(str(output) if output else "-", "w", encoding="utf-8") as stream:
+        if output_format == "json":
+            generator.write_json(stream, count)
+        else:
+            generator.write_ndjson(stream, count)
+
+    if output:
+        click.echo(f"{count} variants written to {output}", err=True)
+
+
+@main.command()
+@click.argument("old", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("new", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Compact text report, or the full change report as JSON",
+)
+@click.pass_context
+def diff(ctx: click.Context, old: Path, new: Path, output_format: str) -> None:
+    """Show which questions and choices changed between two quiz versions.
+
+    Renumbered and reordered questions are matched by content. Exits with
+    status 1 when the versions differ, like diff.
+
+    OLD, NEW: DOCX files or quiz JSON to compare
+    """
+    try:
+        changes = diff_files(old, new)
+    except QuestionParserError as e:
+        click.echo(f"Error: {_describe_error(e)}", err=True)
         raise click.Abort() from e
     except Exception as e:
         click.echo(f"Unexpected error: {e}", err=True)
         raise click.Abort() from e
 
+    click.echo(changes.model_dump_json() if output_format == "json" else format_diff(changes))
+    if changes.has_changes:
+        ctx.exit(1)
+
+
+@main.command()
+@click.argument(
+    "inputs", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    "--output",
+    "-o",
+    required=True,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Output file path for the merged quiz JSON",
+)
+@click.option(
+    "--provenance",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Where to write the source of every question (default: OUTPUT with "
+    ".provenance.json suffix)",
+)
+@click.option(
+    "--parallel",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Inputs parsed at a time; 0 uses every CPU",
+)
+@click.option(
+    "--normalize",
+    is_flag=True,
+    help="Normalize the paragraph text of DOCX inputs (see parse --normalize)",
+)
+def merge(
+    inputs: tuple[Path, ...],
+    output: Path,
+    provenance: Path | None,
+    parallel: int,
+    normalize: bool,
+) -> None:
+    """Merge quiz documents into one bank, renumbering questions from the start.
+
+    Questions are streamed from each input in order and written as they are
+    read. The output only replaces OUTPUT once every input merged.
+
+    INPUTS: DOCX files or quiz JSON, in the order their questions should appear
+    """
+    if provenance is None:
+        provenance = output.with_suffix(".provenance.json")
+    normalizer = TextNormalizer() if normalize else None
+
+    # Merged into a hidden sibling and moved into place, so a failed merge
+    # never leaves a truncated bank behind
+    partial = output.with_name(f".{output.name}.partial")
+    try:
+        with open(partial, "w", encoding="utf-8") as stream:
+            report = merge_quizzes(
+                inputs, stream, workers=parallel or default_workers(), normalizer=normalizer
+            )
+        partial.replace(output)
+    except QuestionParserError as e:
+        click.echo(f"Error: {_describe_error(e)}", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        raise click.Abort() from e
+    finally:
+        partial.unlink(missing_ok=True)
+    provenance.write_text(report.model_dump_json())
+
+    click.echo(
+        f"{report.questions} questions from {len(report.sources)} files written to {output}",
+        err=True,
+    )
+
+
+@main.command()
+@click.option(
+    "--target",
+    type=click.Choice(["in-process", "http"]),
+    default="in-process",
+    show_default=True,
+    help="Call the parser directly, or POST to an HTTP parse endpoint",
+)
+@click.option(
+    "--url",
+    help="Parse endpoint for --target http (default: start a local stand-in server)",
+)
+@click.option(
+    "--size",
+    "sizes",
+    type=click.IntRange(min=1),
+    multiple=True,
+    default=[50],
+    show_default=True,
+    help="Questions per synthetic payload; repeat to mix sizes",
+)
+@click.option(
+    "--requests",
+    "-n",
+    type=click.IntRange(min=1),
+    default=200,
+    show_default=True,
+    help="Total number of requests",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Requests in flight at a time",
+)
+@click.option("--seed", type=int, default=0, show_default=True, help="Seed for the payloads")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Also write the report as JSON to this path",
+)
+def loadtest(
+    target: str,
+    url: str | None,
+    sizes: tuple[int, ...],
+    requests: int,
+    concurrency: int,
+    seed: int,
+    output: Path | None,
+) -> None:
+    """Measure parse throughput and latency under concurrent load.
+
+    Runs entirely on this machine with synthetic DOCX payloads, and reports
+    requests per second, p50/p95/p99 latency and the error rate.
+    """
+    if url and target != "http":
+        raise click.UsageError("--url requires --target http")
+
+    payloads = synthetic_payloads(sizes, seed=seed)
+    if target == "in-process":
+        report = run_load_test(in_process_target(), payloads, requests, concurrency)
+    elif url:
+        try:
+            send = http_target(url)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--url") from e
+        report = run_load_test(send, payloads, requests, concurrency, name=url)
+    else:
+        with parse_server() as server_url:
+            report = run_load_test(
+                http_target(server_url), payloads, requests, concurrency, name=server_url
+            )
+
+    click.echo(f"target: {report.target}")
+    click.echo(f"requests: {report.requests:,} ({report.concurrency} concurrent)")
+    click.echo(f"throughput: {report.requests_per_second:,.2f} requests/s")
+    click.echo(
+        f"latency: p50 {report.p50_ms:,.2f} ms, p95 {report.p95_ms:,.2f} ms, "
+        f"p99 {report.p99_ms:,.2f} ms, max {report.max_ms:,.2f} ms"
+    )
+    click.echo(f"errors: {report.errors:,} ({report.error_rate:.2%})")
+
+    if output:
+        output.write_text(report.model_dump_json())
+        click.echo(f"Report written to {output}", err=True)
+
 
 if __name__ == "__main__":
     main()
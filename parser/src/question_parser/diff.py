@@ -0,0 +1,352 @@
+"""Structural diff between two versions of a quiz.
+
+Questions are aligned by hashing, in passes that each take linear time:
+
+1. identical text and choices
+2. identical text (the choices were edited)
+3. identical choices (the text was edited)
+4. the same question id (both were edited), if the texts are still similar
+   or most choices are unchanged
+
+Whatever is left is added or removed, so a question replaced by an unrelated
+one at the same id is not reported as an edit. Question ids are ignored by
+the first three passes, so renumbered and reordered questions still align. Among
+aligned questions, those outside the longest run kept in the same relative
+order are reported as moved, so inserting one question near the top does
+not report every later one as moved.
+"""
+
+import bisect
+import difflib
+from collections import defaultdict, deque
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+from question_parser.loader import load_quiz
+from question_parser.models import Question, Quiz
+
+# Least similarity (difflib ratio) for two question texts to count as one
+# edited question when pairing by id
+SIMILAR_TEXT_RATIO = 0.6
+
+# Least text similarity for two questions that share most of their choices
+# to count as one edited question; shared choices alone, such as "True" and
+# "False", say little about whether two questions are related
+RELATED_TEXT_RATIO = 0.5
+
+
+class TextEdit(BaseModel):
+    """A changed piece of text.
+
+    Attributes:
+        old: Text in the old version
+        new: Text in the new version
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    old: str
+    new: str
+
+
+class ChoiceEdit(TextEdit):
+    """A choice whose text changed.
+
+    Attributes:
+        label: Label of the choice
+        old: Choice text in the old version, or "" if the label was missing
+        new: Choice text in the new version, or "" if the label was missing
+    """
+
+    label: str
+
+
+class QuestionEdit(BaseModel):
+    """A question present in both versions with different content.
+
+    Attributes:
+        old_id: Id in the old version
+        new_id: Id in the new version
+        moved: Whether the question changed position relative to the others
+        text: The text change, if the text was edited
+        choices: Edited choices, by label
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    old_id: int
+    new_id: int
+    moved: bool = False
+    text: TextEdit | None = None
+    choices: list[ChoiceEdit] = []
+
+
+class QuestionMove(BaseModel):
+    """An unchanged question that changed position relative to the others.
+
+    Attributes:
+        old_id: Id in the old version
+        new_id: Id in the new version
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    old_id: int
+    new_id: int
+
+
+class QuizDiff(BaseModel):
+    """Changes between two versions of a quiz.
+
+    Attributes:
+        added: Questions only in the new version
+        removed: Questions only in the old version
+        moved: Unchanged questions that changed position
+        edited: Questions whose text or choices changed
+        unchanged: Number of identical questions in the same relative order,
+            including renumbered ones
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    added: list[Question]
+    removed: list[Question]
+    moved: list[QuestionMove]
+    edited: list[QuestionEdit]
+    unchanged: int
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether the versions differ in anything but numbering."""
+        return bool(self.added or self.removed or self.moved or self.edited)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Serialize to JSON string with pretty formatting."""
+        return super().model_dump_json(indent=2, **kwargs)
+
+
+def diff_quizzes(old: Quiz, new: Quiz) -> QuizDiff:
+    """Compare two versions of a quiz.
+
+    Args:
+        old: The earlier version
+        new: The revised version
+
+    Returns:
+        The changes from old to new
+    """
+    unmatched_old = list(range(len(old.questions)))
+    unmatched_new = list(range(len(new.questions)))
+    # (old index, new index) of aligned questions
+    pairs: list[tuple[int, int]] = []
+
+    # Sharing choices or an id alone does not make two questions the same one
+    passes: list[
+        tuple[Callable[[Question], Hashable], Callable[[Question, Question], bool] | None]
+    ] = [
+        (_content_key, None),
+        (lambda question: question.text, None),
+        (_choices_key, lambda old, new: _similar_text(old.text, new.text, RELATED_TEXT_RATIO)),
+        (lambda question: question.id, _related),
+    ]
+    for key, accept in passes:
+        matched, unmatched_old, unmatched_new = _align(
+            old.questions, unmatched_old, new.questions, unmatched_new, key, accept
+        )
+        pairs.extend(matched)
+
+    pairs.sort(key=lambda pair: pair[1])
+    in_order = _longest_increasing([old_index for old_index, _ in pairs])
+
+    moved: list[QuestionMove] = []
+    edited: list[QuestionEdit] = []
+    unchanged = 0
+    for position, (old_index, new_index) in enumerate(pairs):
+        before, after = old.questions[old_index], new.questions[new_index]
+        is_moved = position not in in_order
+        edit = _edit(before, after, is_moved)
+        if edit is not None:
+            edited.append(edit)
+        elif is_moved:
+            moved.append(QuestionMove(old_id=before.id, new_id=after.id))
+        else:
+            unchanged += 1
+
+    return QuizDiff(
+        added=[new.questions[index] for index in unmatched_new],
+        removed=[old.questions[index] for index in unmatched_old],
+        moved=moved,
+        edited=edited,
+        unchanged=unchanged,
+    )
+
+
+def diff_files(old_path: str | Path, new_path: str | Path) -> QuizDiff:
+    """Compare two quiz files, each a DOCX document or quiz JSON.
+
+    Args:
+        old_path: The earlier version
+        new_path: The revised version
+
+    Returns:
+        The changes from old to new
+
+    Raises:
+        FileNotFoundError: If a file does not exist
+        ValueError: If a file is not a valid DOCX file or quiz JSON
+        ParsingError: If a DOCX document cannot be parsed
+    """
+    return diff_quizzes(load_quiz(old_path), load_quiz(new_path))
+
+
+def format_diff(diff: QuizDiff) -> str:
+    """Render a diff as compact, line-oriented text.
+
+    Args:
+        diff: The diff to render
+
+    Returns:
+        One entry per change, followed by a summary line
+    """
+    lines: list[str] = []
+
+    for edit in diff.edited:
+        header = _header(edit.old_id, edit.new_id) + (" (moved)" if edit.moved else "")
+        if edit.text is not None:
+            lines.append(f"~ {header}: text")
+            lines.extend(_text_lines(edit.text))
+        for choice in edit.choices:
+            lines.append(f"~ {header}: choice {choice.label}")
+            lines.extend(_text_lines(choice))
+    for move in diff.moved:
+        lines.append(f"> {_header(move.old_id, move.new_id)}: moved")
+    for question in diff.removed:
+        lines.append(f"- Question {question.id}: {_first_line(question.text)}")
+    for question in diff.added:
+        lines.append(f"+ Question {question.id}: {_first_line(question.text)}")
+
+    lines.append(
+        f"{len(diff.added)} added, {len(diff.removed)} removed, {len(diff.moved)} moved, "
+        f"{len(diff.edited)} edited, {diff.unchanged} unchanged"
+    )
+    return "\n".join(lines)
+
+
+def _content_key(question: Question) -> Hashable:
+    return question.text, _choices_key(question)
+
+
+def _choices_key(question: Question) -> Hashable:
+    return tuple((choice.label, choice.text) for choice in question.choices)
+
+
+def _related(old: Question, new: Question) -> bool:
+    """Whether two questions with different text and choices are versions of one question.
+
+    They are if their texts are similar, or if they share most choices and
+    their texts are still somewhat similar.
+    """
+    old_choices = {(choice.label, choice.text) for choice in old.choices}
+    same_choices = sum((choice.label, choice.text) in old_choices for choice in new.choices)
+    if 2 * same_choices > max(len(old.choices), len(new.choices)):
+        return _similar_text(old.text, new.text, RELATED_TEXT_RATIO)
+    return _similar_text(old.text, new.text, SIMILAR_TEXT_RATIO)
+
+
+def _similar_text(old: str, new: str, ratio: float) -> bool:
+    """Whether two texts have a difflib similarity ratio of at least ratio."""
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    # quick_ratio bounds ratio from above and is much cheaper
+    return matcher.quick_ratio() >= ratio and matcher.ratio() >= ratio
+
+
+def _align(
+    old: list[Question],
+    old_indices: list[int],
+    new: list[Question],
+    new_indices: list[int],
+    key: Callable[[Question], Hashable],
+    accept: Callable[[Question, Question], bool] | None = None,
+) -> tuple[list[tuple[int, int]], list[int], list[int]]:
+    """Pair questions with equal keys, first come first served.
+
+    With `accept`, a pair is only made if accept(old question, new question)
+    holds; otherwise both stay unmatched.
+
+    Returns:
+        The pairs, then the old and new indices left unmatched
+    """
+    candidates: defaultdict[Hashable, deque[int]] = defaultdict(deque)
+    for index in old_indices:
+        candidates[key(old[index])].append(index)
+
+    pairs: list[tuple[int, int]] = []
+    matched_old: set[int] = set()
+    unmatched_new: list[int] = []
+    for index in new_indices:
+        queue = candidates.get(key(new[index]))
+        if queue and (accept is None or accept(old[queue[0]], new[index])):
+            old_index = queue.popleft()
+            pairs.append((old_index, index))
+            matched_old.add(old_index)
+        else:
+            unmatched_new.append(index)
+
+    unmatched_old = [index for index in old_indices if index not in matched_old]
+    return pairs, unmatched_old, unmatched_new
+
+
+def _longest_increasing(values: list[int]) -> set[int]:
+    """Return the positions of a longest strictly increasing subsequence."""
+    tails: list[int] = []  # Smallest tail value of an increasing run of each length
+    tail_positions: list[int] = []
+    previous = [-1] * len(values)
+
+    for position, value in enumerate(values):
+        length = bisect.bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[length] = value
+            tail_positions[length] = position
+        previous[position] = tail_positions[length - 1] if length else -1
+
+    positions: set[int] = set()
+    position = tail_positions[-1] if tail_positions else -1
+    while position != -1:
+        positions.add(position)
+        position = previous[position]
+    return positions
+
+
+def _edit(old: Question, new: Question, moved: bool) -> QuestionEdit | None:
+    """Describe how an aligned question changed, or None if it is identical."""
+    text = TextEdit(old=old.text, new=new.text) if old.text != new.text else None
+
+    old_choices = {choice.label: choice.text for choice in old.choices}
+    new_choices = {choice.label: choice.text for choice in new.choices}
+    choices = [
+        ChoiceEdit(label=label, old=old_choices.get(label, ""), new=new_choices.get(label, ""))
+        for label in sorted(old_choices.keys() | new_choices.keys())
+        if old_choices.get(label) != new_choices.get(label)
+    ]
+
+    if text is None and not choices:
+        return None
+    return QuestionEdit(old_id=old.id, new_id=new.id, moved=moved, text=text, choices=choices)
+
+
+def _header(old_id: int, new_id: int) -> str:
+    return f"Question {old_id}" if old_id == new_id else f"Question {old_id} -> {new_id}"
+
+
+def _text_lines(edit: TextEdit) -> list[str]:
+    return [f"    - {edit.old}", f"    + {edit.new}"]
+
+
+def _first_line(text: str) -> str:
+    return text.split("\n", 1)[0]
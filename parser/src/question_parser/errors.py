@@ -27,4 +27,23 @@ class ParsingError(QuestionParserError):
         - Malformed question structure
         - Invalid choice labels
         - Wrong number of choices
+
+    Attributes:
+        message: Human-readable error description
+        paragraph: Position in the source document of the paragraph where
+            the failing question starts, if known
     """
+
+    def __init__(self, message: str, paragraph: int | None = None) -> None:
+        """Initialize the error with a message and an optional location.
+
+        Args:
+            message: Human-readable error description
+            paragraph: Position in the source document of the paragraph where
+                the failing question starts, counted from 0 among all body
+                paragraphs including empty ones. Only set by the parser
+                methods that are given source positions; never an index into
+                a filtered paragraph list.
+        """
+        super().__init__(message)
+        self.paragraph = paragraph
@@ -1,20 +1,78 @@
 """Extract content from DOCX files."""
 
+import io
+import shutil
+import tempfile
+import zipfile
+from array import array
+from collections.abc import Callable, Generator, Iterable, Iterator
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
+from typing import IO
+from xml.parsers import expat
 
 from docx import Document
+from docx.document import Document as DocumentObject
+from docx.opc.constants import RELATIONSHIP_TYPE
 from docx.opc.exceptions import PackageNotFoundError
+from docx.oxml.ns import qn
+from lxml import etree  # type: ignore[import-untyped]
+
+from question_parser import hooks
+from question_parser.normalize import TextNormalizer
+
+# Anything a DOCX document can be read from: a path, the file contents in
+# memory, or a binary file object
+DocxSource = str | Path | bytes | bytearray | memoryview | IO[bytes]
+
+# Bytes of document XML fed to the parser at a time when streaming
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Non-seekable streams up to this size are buffered in memory when streaming;
+# larger ones spill to a temporary file
+STREAM_SPOOL_SIZE = 16 * 1024 * 1024
+
+_PARAGRAPH_TAG = qn("w:p")
+_BODY_TAG = qn("w:body")
+_RUN_TAG = qn("w:r")
+_HYPERLINK_TAG = qn("w:hyperlink")
+_TEXT_TAG = qn("w:t")
+_BREAK_TAG = qn("w:br")
+_BREAK_TYPE = qn("w:type")
+
+# Text of the run content elements that python-docx renders as a fixed string
+_RUN_CONTENT_TEXT = {
+    qn("w:cr"): "\n",
+    qn("w:noBreakHyphen"): "-",
+    qn("w:ptab"): "\t",
+    qn("w:tab"): "\t",
+}
+_DEFAULT_DOCUMENT_PART = "word/document.xml"
 
 
 class DocxExtractor:
-    """Extract paragraphs from DOCX files."""
+    """Extract paragraphs from DOCX files.
+
+    An extractor holds no mutable state; every call opens its own document,
+    so one instance can be shared by any number of threads.
+    """
+
+    def __init__(self, normalizer: TextNormalizer | None = None) -> None:
+        """Initialize the extractor.
 
-    def extract(self, file_path: str | Path) -> list[str]:
+        Args:
+            normalizer: Cleans the text of every paragraph in both `extract` and
+                `iter_paragraphs`; by default only surrounding whitespace is stripped
+        """
+        self.normalizer = normalizer
+        self._clean: Callable[[str], str] = normalizer or str.strip
+
+    def extract(self, source: DocxSource) -> list[str]:
         """
         Extract paragraphs from a DOCX file.
 
         Args:
-            file_path: Path to the DOCX file.
+            source: Path to the DOCX file, its contents as bytes, or a binary file object.
 
         Returns:
             List of non-empty paragraph texts.
@@ -23,20 +81,391 @@ class DocxExtractor:
             FileNotFoundError: If the file does not exist.
             ValueError: If the file is not a valid DOCX file.
         """
-        path = Path(file_path)
+        with hooks.timed(hooks.EVENT_EXTRACT):
+            paragraphs = self.paragraphs(self.load(source))
+        hooks.count(hooks.COUNT_PARAGRAPHS, len(paragraphs))
+        return paragraphs
 
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+    def load(self, source: DocxSource) -> DocumentObject:
+        """
+        Load a DOCX file into a python-docx document.
 
-        try:
-            doc = Document(str(path))
-        except PackageNotFoundError as e:
-            raise ValueError(f"Invalid DOCX file: {file_path}") from e
+        In-memory contents and file objects are read directly, without a
+        temporary file. Non-seekable streams such as stdin are buffered
+        first, since DOCX files are zip archives.
+
+        Args:
+            source: Path to the DOCX file, its contents as bytes, or a binary file object.
+
+        Returns:
+            The loaded document.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a valid DOCX file.
+        """
+        with _open_source(source, STREAM_SPOOL_SIZE) as target:
+            try:
+                return Document(target)
+            except (PackageNotFoundError, zipfile.BadZipFile, KeyError) as e:
+                raise ValueError(f"Invalid DOCX file: {_describe(source)}") from e
+
+    def extract_with_positions(self, source: DocxSource) -> tuple[list[str], "array[int]"]:
+        """
+        Extract paragraphs from a DOCX file along with where each one is in it.
+
+        Args:
+            source: Path to the DOCX file, its contents as bytes, or a binary file object.
+
+        Returns:
+            The same paragraph texts as `extract`, and the index of each among
+            all paragraphs of the document body, counted from 0 and including
+            empty ones.
 
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a valid DOCX file.
+        """
+        with hooks.timed(hooks.EVENT_EXTRACT):
+            paragraphs: list[str] = []
+            positions = array("I")
+            for position, para in enumerate(self.load(source).paragraphs):
+                text = self._clean(para.text)
+                if text:  # Filter out empty and whitespace-only paragraphs
+                    paragraphs.append(text)
+                    positions.append(position)
+        hooks.count(hooks.COUNT_PARAGRAPHS, len(paragraphs))
+        return paragraphs, positions
+
+    def paragraphs(self, document: DocumentObject) -> list[str]:
+        """
+        Collect the non-empty paragraph texts of a loaded document.
+
+        Args:
+            document: Document returned by `load`.
+
+        Returns:
+            List of non-empty paragraph texts.
+        """
         paragraphs = []
-        for para in doc.paragraphs:
-            text = para.text.strip()
+        for para in document.paragraphs:
+            text = self._clean(para.text)
             if text:  # Filter out empty and whitespace-only paragraphs
                 paragraphs.append(text)
 
         return paragraphs
+
+    def iter_paragraphs(
+        self, source: DocxSource, spool_size: int = STREAM_SPOOL_SIZE, offset: int = 0
+    ) -> Generator[str, None, None]:
+        """
+        Stream the non-empty paragraph texts of a DOCX file.
+
+        Yields the same paragraphs as `extract`, but reads the document XML
+        in chunks and discards each paragraph once yielded, so memory use
+        does not grow with the size of the document.
+
+        Args:
+            source: Path to the DOCX file, its contents as bytes, or a binary file object.
+            spool_size: Bytes of a non-seekable stream kept in memory before
+                spilling it to a temporary file.
+            offset: Start at the body paragraph at this byte offset of the
+                document XML, as reported by `iter_paragraph_offsets`. The XML
+                before it is decompressed but not parsed.
+
+        Yields:
+            Non-empty paragraph texts in document order.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a valid DOCX file, or the offset is
+                before the document body.
+        """
+        for _, text in self.iter_paragraphs_with_positions(source, spool_size, offset):
+            yield text
+
+    def iter_paragraphs_with_positions(
+        self,
+        source: DocxSource,
+        spool_size: int = STREAM_SPOOL_SIZE,
+        offset: int = 0,
+        position: int = 0,
+    ) -> Generator[tuple[int, str], None, None]:
+        """
+        Stream the non-empty paragraph texts of a DOCX file with where each one is in it.
+
+        Like `iter_paragraphs`, with the positions `extract_with_positions` reports.
+
+        Args:
+            source: Path to the DOCX file, its contents as bytes, or a binary file object.
+            spool_size: Bytes of a non-seekable stream kept in memory before
+                spilling it to a temporary file.
+            offset: Start at the body paragraph at this byte offset of the
+                document XML, as reported by `iter_paragraph_offsets`.
+            position: Position of the paragraph at `offset`, as reported by
+                `iter_paragraph_offsets`, so positions count from the start of
+                the document when resuming.
+
+        Yields:
+            (index among all paragraphs of the document body, counted from 0
+            and including empty ones, paragraph text) tuples in document order.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a valid DOCX file, or the offset is
+                before the document body.
+        """
+        with self._open_document(source, spool_size) as stream:
+            chunks = _read_chunks(stream) if offset == 0 else _resume_chunks(stream, offset)
+            for index, text in _counted(_stream_paragraphs(chunks, self._clean)):
+                yield position + index, text
+
+    def iter_paragraph_offsets(
+        self, source: DocxSource, spool_size: int = STREAM_SPOOL_SIZE
+    ) -> Iterator[tuple[int, int, str]]:
+        """
+        Stream the non-empty paragraph texts of a DOCX file with their offsets.
+
+        Like `iter_paragraphs_with_positions`, but also reports where each
+        paragraph starts in the document XML, so a later call can start
+        there. Finding the offsets needs a second XML parser, so this is slower.
+
+        Args:
+            source: Path to the DOCX file, its contents as bytes, or a binary file object.
+            spool_size: Bytes of a non-seekable stream kept in memory before
+                spilling it to a temporary file.
+
+        Yields:
+            (byte offset in the document XML, position among all body
+            paragraphs, paragraph text) tuples in document order.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a valid DOCX file.
+        """
+        starts = _ParagraphStarts()
+        with self._open_document(source, spool_size) as stream:
+            paragraphs = _stream_paragraphs(starts.track(_read_chunks(stream)), self._clean)
+            for position, text in _counted(paragraphs):
+                yield starts.offsets[position], position, text
+
+    @contextmanager
+    def _open_document(self, source: DocxSource, spool_size: int) -> Iterator[IO[bytes]]:
+        """Open the main document XML of a DOCX source for reading."""
+        with _open_package(source, spool_size) as package:
+            try:
+                stream = package.open(_main_document_part(package))
+            except KeyError as e:
+                raise ValueError(f"Invalid DOCX file: {_describe(source)}") from e
+
+            with stream:
+                yield stream
+
+
+@contextmanager
+def _open_source(source: DocxSource, spool_size: int) -> Iterator[str | IO[bytes]]:
+    """Resolve a DOCX source to a path or a seekable binary file object."""
+    if isinstance(source, str | Path):
+        path = Path(source)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {source}")
+        yield str(path)
+    elif isinstance(source, bytes | bytearray | memoryview):
+        yield io.BytesIO(source)
+    elif source.seekable():
+        yield source
+    else:
+        # Zip archives need random access, so buffer the stream, on disk if large
+        with tempfile.SpooledTemporaryFile(max_size=spool_size) as buffer:
+            shutil.copyfileobj(source, buffer)
+            buffer.seek(0)
+            yield buffer
+
+
+@contextmanager
+def _open_package(source: DocxSource, spool_size: int) -> Iterator[zipfile.ZipFile]:
+    """Open a DOCX source as a zip archive without loading the document."""
+    with ExitStack() as stack:
+        target = stack.enter_context(_open_source(source, spool_size))
+        try:
+            package = stack.enter_context(zipfile.ZipFile(target))
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"Invalid DOCX file: {_describe(source)}") from e
+
+        yield package
+
+
+def _main_document_part(package: zipfile.ZipFile) -> str:
+    """Return the archive member holding the main document XML."""
+    try:
+        rels = etree.fromstring(package.read("_rels/.rels"))
+    except (KeyError, etree.XMLSyntaxError):
+        return _DEFAULT_DOCUMENT_PART
+
+    for rel in rels:
+        if rel.get("Type") == RELATIONSHIP_TYPE.OFFICE_DOCUMENT:
+            return str(rel.get("Target", _DEFAULT_DOCUMENT_PART)).lstrip("/")
+    return _DEFAULT_DOCUMENT_PART
+
+
+def _read_chunks(stream: IO[bytes]) -> Iterator[bytes]:
+    """Read a stream in STREAM_CHUNK_SIZE pieces."""
+    while chunk := stream.read(STREAM_CHUNK_SIZE):
+        yield chunk
+
+
+def _resume_chunks(stream: IO[bytes], offset: int) -> Iterator[bytes]:
+    """Read document XML from the body paragraph at `offset`.
+
+    The XML before the first body element (the XML declaration and the
+    document and body start tags, which declare the namespaces) is yielded
+    first, so the result is well-formed XML without the skipped paragraphs.
+    """
+    head = b""
+    starts = _ParagraphStarts()
+    for chunk in starts.track(_read_chunks(stream)):
+        head += chunk
+        if starts.body_start is not None:
+            break
+
+    body_start = starts.body_start
+    if body_start is None or offset < body_start:
+        raise ValueError(f"Offset {offset} is not in the document body")
+
+    yield head[:body_start]
+    if offset < len(head):
+        yield head[offset:]
+    else:
+        # Zip members decompress, without parsing, up to the new position
+        stream.seek(offset)
+    yield from _read_chunks(stream)
+
+
+class _ParagraphStarts:
+    """Record where body paragraphs start in document XML.
+
+    lxml does not report positions, so expat runs over the same chunks and
+    records the byte offset of every body paragraph, empty or not, in the
+    order lxml sees them.
+    """
+
+    _PARAGRAPH = _PARAGRAPH_TAG[1:]
+    _BODY = _BODY_TAG[1:]
+
+    def __init__(self) -> None:
+        self.offsets = array("Q")
+        self.body_start: int | None = None  # Offset of the first body element
+        self._parser = expat.ParserCreate(namespace_separator="}")
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+        self._path: list[str] = []
+
+    def track(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Pass chunks through, recording the paragraphs that start in each."""
+        for chunk in chunks:
+            try:
+                self._parser.Parse(chunk, False)
+            except expat.ExpatError as e:
+                raise ValueError(f"Invalid document XML: {e}") from e
+            yield chunk
+
+    def _start(self, name: str, attributes: object) -> None:
+        if len(self._path) == 2 and self._path[1] == self._BODY:
+            offset = self._parser.CurrentByteIndex
+            if self.body_start is None:
+                self.body_start = offset
+            if name == self._PARAGRAPH:
+                self.offsets.append(offset)
+        self._path.append(name)
+
+    def _end(self, name: str) -> None:
+        self._path.pop()
+
+
+def _stream_paragraphs(
+    chunks: Iterable[bytes], clean: Callable[[str], str]
+) -> Iterator[tuple[int, str]]:
+    """Incrementally parse document XML, yielding non-empty body paragraph texts.
+
+    Yields:
+        (index among all body paragraphs, including empty ones, text) tuples
+    """
+    parser = etree.XMLPullParser(
+        events=("end",), tag=_PARAGRAPH_TAG, remove_blank_text=True, resolve_entities=False
+    )
+    index = -1
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            body = element.getparent()
+            if body is None or body.tag != _BODY_TAG:
+                continue  # Paragraphs inside tables are not body paragraphs
+
+            index += 1
+            text = clean(_paragraph_text(element))
+            # Drop this paragraph and everything before it from the tree
+            element.clear()
+            while element.getprevious() is not None:
+                del body[0]
+
+            if text:  # Filter out empty and whitespace-only paragraphs
+                yield index, text
+
+    parser.close()
+
+
+def _counted(paragraphs: Iterator[tuple[int, str]]) -> Iterator[tuple[int, str]]:
+    """Report streamed paragraphs to hooks like `extract` does.
+
+    Extraction time excludes the time the consumer spends between
+    paragraphs. The count covers the paragraphs read, also when the
+    consumer stops early.
+    """
+    count = 0
+    try:
+        for paragraph in hooks.timed_items(hooks.EVENT_EXTRACT, paragraphs):
+            count += 1
+            yield paragraph
+    finally:
+        hooks.count(hooks.COUNT_PARAGRAPHS, count)
+
+
+def _paragraph_text(paragraph: etree._Element) -> str:
+    """Return the text of a `w:p` element exactly as python-docx's `Paragraph.text` does.
+
+    Walks the children directly instead of going through python-docx's
+    element classes and XPath queries, which dominate extraction time.
+    """
+    parts: list[str] = []
+    for child in paragraph:
+        if child.tag == _RUN_TAG:
+            _append_run_text(child, parts)
+        elif child.tag == _HYPERLINK_TAG:
+            for run in child:
+                if run.tag == _RUN_TAG:
+                    _append_run_text(run, parts)
+    return "".join(parts)
+
+
+def _append_run_text(run: etree._Element, parts: list[str]) -> None:
+    """Append the text equivalent of each content element of a `w:r` element."""
+    for child in run:
+        tag = child.tag
+        if tag == _TEXT_TAG:
+            parts.append(child.text or "")
+        elif tag == _BREAK_TAG:
+            # Only line breaks have a text equivalent; page and column breaks do not
+            if child.get(_BREAK_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(_RUN_CONTENT_TEXT.get(tag, ""))
+
+
+def _describe(source: DocxSource) -> str:
+    """Name a DOCX source for error messages."""
+    if isinstance(source, str | Path):
+        return str(source)
+    if isinstance(source, bytes | bytearray | memoryview):
+        return f"<{len(source)} bytes>"
+    return str(getattr(source, "name", "<stream>"))
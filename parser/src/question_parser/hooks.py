@@ -0,0 +1,157 @@
+"""Instrumentation hooks for observing the extractor, parser and serializer.
+
+Register an Observer to receive timings, counts and errors. When no observer
+is registered, every hook returns after a single check of an empty tuple.
+"""
+
+import threading
+import time
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from types import TracebackType
+
+from question_parser.errors import QuestionParserError
+
+# Timed events
+EVENT_EXTRACT = "extract"
+EVENT_PARSE_QUESTION = "parse_question"
+EVENT_VALIDATE = "validate"
+EVENT_SERIALIZE = "serialize"
+
+# Counters
+COUNT_PARAGRAPHS = "paragraphs"
+COUNT_QUESTIONS = "questions"
+
+
+class Observer:
+    """Receive parser events.
+
+    Subclass and override the hooks you need; the defaults do nothing.
+    Hooks may be called from several threads at once.
+    """
+
+    def on_start(self, event: str) -> None:
+        """Called when a timed event starts."""
+
+    def on_end(self, event: str, seconds: float) -> None:
+        """Called when a timed event ends, with its wall-clock duration."""
+
+    def on_count(self, name: str, value: int) -> None:
+        """Called to add a value to a counter (ex: paragraphs extracted)."""
+
+    def on_error(self, error: QuestionParserError) -> None:
+        """Called when parsing fails, before the error is raised."""
+
+
+# Replaced rather than mutated, so readers never need the lock
+_observers: tuple[Observer, ...] = ()
+_lock = threading.Lock()
+_NULL_CONTEXT = nullcontext()
+
+
+def add_observer(observer: Observer) -> None:
+    """Register an observer for all parser events."""
+    global _observers
+    with _lock:
+        _observers = (*_observers, observer)
+
+
+def remove_observer(observer: Observer) -> None:
+    """Unregister an observer; unknown observers are ignored."""
+    global _observers
+    with _lock:
+        _observers = tuple(o for o in _observers if o is not observer)
+
+
+@contextmanager
+def observing(observer: Observer) -> Iterator[Observer]:
+    """Register an observer for the duration of a with block."""
+    add_observer(observer)
+    try:
+        yield observer
+    finally:
+        remove_observer(observer)
+
+
+def timed(event: str) -> AbstractContextManager[None]:
+    """Time the wrapped block and report it as an event.
+
+    Args:
+        event: Event name passed to the observers
+    """
+    if not _observers:
+        return _NULL_CONTEXT
+    return _Timer(event, _observers)
+
+
+def timed_items[T](event: str, items: Iterable[T]) -> Generator[T, None, None]:
+    """Pass items through, reporting the time spent producing them as one event.
+
+    Meant for streaming stages: only time spent inside the iterable counts,
+    not time the consumer spends between items. The event ends when the
+    iterable is exhausted or fails, or when the generator is closed.
+
+    Args:
+        event: Event name passed to the observers
+        items: Iterable to time
+    """
+    observers = _observers
+    if not observers:
+        yield from items
+        return
+
+    for observer in observers:
+        observer.on_start(event)
+    iterator = iter(items)
+    seconds = 0.0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                seconds += time.perf_counter() - start
+            yield item
+    finally:
+        for observer in observers:
+            observer.on_end(event, seconds)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Add a value to a counter."""
+    for observer in _observers:
+        observer.on_count(name, value)
+
+
+def error(exc: QuestionParserError) -> None:
+    """Report an error that is about to be raised."""
+    for observer in _observers:
+        observer.on_error(exc)
+
+
+class _Timer:
+    """Context manager that reports start and end of an event to observers."""
+
+    __slots__ = ("event", "observers", "start")
+
+    def __init__(self, event: str, observers: tuple[Observer, ...]) -> None:
+        self.event = event
+        self.observers = observers
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        for observer in self.observers:
+            observer.on_start(self.event)
+        self.start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        seconds = time.perf_counter() - self.start
+        for observer in self.observers:
+            observer.on_end(self.event, seconds)
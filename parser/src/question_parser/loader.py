@@ -0,0 +1,37 @@
+"""Load quizzes from DOCX or parser JSON output."""
+
+from pathlib import Path
+
+from question_parser.extractor import DocxExtractor
+from question_parser.models import Quiz
+from question_parser.parser import QuestionParser
+
+
+def is_json(path: str | Path) -> bool:
+    """Return whether a file is treated as quiz JSON rather than DOCX."""
+    return Path(path).suffix.lower() == ".json"
+
+
+def load_quiz(path: str | Path, data: bytes | None = None) -> Quiz:
+    """Load a quiz from a DOCX file or a JSON file written by the parser.
+
+    Files ending in ".json" are validated as quiz JSON; anything else is
+    extracted and parsed as DOCX.
+
+    Args:
+        path: File to load
+        data: File contents, if already read
+
+    Returns:
+        The quiz
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is not a valid DOCX file or quiz JSON
+        ParsingError: If the DOCX document cannot be parsed
+    """
+    if data is None:
+        data = Path(path).read_bytes()
+    if is_json(path):
+        return Quiz.model_validate_json(data)
+    return QuestionParser(bulk_validation=True).parse(DocxExtractor().extract(data))
@@ -0,0 +1,277 @@
+"""Offline load testing of DOCX parsing.
+
+Drives many concurrent parse requests with synthetic DOCX payloads and
+reports throughput, latency percentiles and the error rate. Requests go to
+one of two targets, both on the local machine:
+
+- in-process: calls DocxExtractor and QuestionParser directly, measuring
+  the parser alone
+- HTTP: POSTs each payload to a parse endpoint, by default a stand-in
+  server started on an ephemeral localhost port, measuring the parser plus
+  request handling
+
+The stand-in server accepts `POST /parse` with a DOCX body and answers with
+the quiz JSON, or a `{"error": ...}` object and status 422 when the
+document cannot be converted.
+"""
+
+import http.client
+import json
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel, ConfigDict
+
+from question_parser.errors import QuestionParserError
+from question_parser.extractor import DocxExtractor
+from question_parser.parser import QuestionParser
+from question_parser.synthetic import synthetic_docx
+
+# Path of the parse endpoint on the stand-in server
+PARSE_PATH = "/parse"
+
+# Seconds an HTTP request may take before it counts as an error
+DEFAULT_TIMEOUT = 30.0
+
+# Sends one payload; raises if the request fails
+Target = Callable[[bytes], None]
+
+
+class LoadTestReport(BaseModel):
+    """Results of a load test.
+
+    Attributes:
+        target: What was tested: "in-process" or the endpoint URL
+        requests: Number of requests sent
+        concurrency: Number of requests in flight at a time
+        errors: Number of failed requests
+        error_rate: Fraction of requests that failed
+        seconds: Wall-clock duration of the whole test
+        requests_per_second: Completed requests per second
+        p50_ms: Median request latency in milliseconds
+        p95_ms: 95th percentile request latency in milliseconds
+        p99_ms: 99th percentile request latency in milliseconds
+        max_ms: Slowest request latency in milliseconds
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    target: str
+    requests: int
+    concurrency: int
+    errors: int
+    error_rate: float
+    seconds: float
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Serialize to JSON string with pretty formatting."""
+        return super().model_dump_json(indent=2, **kwargs)
+
+
+def synthetic_payloads(sizes: Sequence[int], seed: int = 0) -> list[bytes]:
+    """Build one synthetic DOCX payload per size.
+
+    Args:
+        sizes: Number of questions in each payload
+        seed: Seed for the first payload; each later one uses the next seed
+
+    Returns:
+        The DOCX file contents
+    """
+    return [synthetic_docx(size, seed=seed + index) for index, size in enumerate(sizes)]
+
+
+def in_process_target() -> Target:
+    """Build a target that parses payloads with a shared extractor and parser."""
+    extractor = DocxExtractor()
+    parser = QuestionParser()
+
+    def send(payload: bytes) -> None:
+        parser.parse(extractor.extract(payload)).model_dump_json()
+
+    return send
+
+
+def http_target(url: str, timeout: float = DEFAULT_TIMEOUT) -> Target:
+    """Build a target that POSTs payloads to a parse endpoint.
+
+    Each sending thread keeps its own connection open between requests.
+
+    Args:
+        url: Endpoint URL, e.g. "http://127.0.0.1:8000/parse"
+        timeout: Seconds before a request fails
+
+    Raises:
+        ValueError: If the URL is not an http URL
+    """
+    parts = urlsplit(url)
+    if parts.scheme != "http" or not parts.hostname:
+        raise ValueError(f"Expected an http:// URL, got {url!r}")
+    host, port, path = parts.hostname, parts.port or 80, parts.path or "/"
+    local = threading.local()
+
+    def send(payload: bytes) -> None:
+        connection = getattr(local, "connection", None)
+        if connection is None:
+            connection = local.connection = http.client.HTTPConnection(host, port, timeout=timeout)
+        try:
+            connection.request(
+                "POST",
+                path,
+                body=payload,
+                headers={"Content-Type": "application/octet-stream"},
+            )
+            response = connection.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            # Reconnect on the next request
+            connection.close()
+            local.connection = None
+            raise
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}: {body[:200]!r}")
+
+    return send
+
+
+def run_load_test(
+    target: Target,
+    payloads: Sequence[bytes],
+    requests: int,
+    concurrency: int,
+    name: str = "in-process",
+) -> LoadTestReport:
+    """Send requests concurrently and measure them.
+
+    Payloads are sent in turn, so every size is exercised evenly. A request
+    that raises any exception counts as an error; its latency still counts.
+
+    Args:
+        target: Sends one payload
+        payloads: DOCX payloads to cycle through
+        requests: Total number of requests
+        concurrency: Number of requests in flight at a time
+        name: Target name recorded in the report
+
+    Returns:
+        Throughput, latency percentiles and error rate
+
+    Raises:
+        ValueError: If there are no payloads, or requests or concurrency is
+            not positive
+    """
+    if not payloads:
+        raise ValueError("At least one payload is required")
+    if requests < 1 or concurrency < 1:
+        raise ValueError(
+            f"Requests and concurrency must be positive, got {requests} and {concurrency}"
+        )
+
+    def timed_request(index: int) -> tuple[float, bool]:
+        start = time.perf_counter()
+        try:
+            target(payloads[index % len(payloads)])
+        except Exception:
+            return time.perf_counter() - start, False
+        return time.perf_counter() - start, True
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(timed_request, range(requests)))
+    seconds = time.perf_counter() - start
+
+    latencies = sorted(latency * 1000 for latency, _ in outcomes)
+    errors = sum(1 for _, ok in outcomes if not ok)
+    return LoadTestReport(
+        target=name,
+        requests=requests,
+        concurrency=concurrency,
+        errors=errors,
+        error_rate=errors / requests,
+        seconds=seconds,
+        requests_per_second=requests / seconds,
+        p50_ms=_percentile(latencies, 50),
+        p95_ms=_percentile(latencies, 95),
+        p99_ms=_percentile(latencies, 99),
+        max_ms=latencies[-1],
+    )
+
+
+@contextmanager
+def parse_server(host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+    """Run the stand-in parse server in a background thread.
+
+    Args:
+        host: Address to listen on
+        port: Port to listen on; 0 picks a free one
+
+    Yields:
+        URL of the parse endpoint
+    """
+    server = ThreadingHTTPServer((host, port), _ParseHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://{host}:{server.server_port}{PARSE_PATH}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of sorted values."""
+    rank = math.ceil(percent / 100 * len(values))
+    return values[max(rank, 1) - 1]
+
+
+class _ParseHandler(BaseHTTPRequestHandler):
+    """Handle `POST /parse` with a shared extractor and parser."""
+
+    # Keep connections open between requests, as real clients would
+    protocol_version = "HTTP/1.1"
+
+    extractor = DocxExtractor()
+    parser = QuestionParser()
+
+    def do_POST(self) -> None:  # noqa: N802 - name required by BaseHTTPRequestHandler
+        """Parse the DOCX request body into quiz JSON."""
+        # Read the body whatever the path, or on a kept-alive connection it
+        # would be read as the next request
+        payload = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path != PARSE_PATH:
+            self._respond(404, json.dumps({"error": f"Not found: {self.path}"}))
+            return
+
+        try:
+            quiz = self.parser.parse(self.extractor.extract(payload))
+        except QuestionParserError as e:
+            self._respond(422, json.dumps({"error": e.message}))
+        except ValueError as e:
+            self._respond(422, json.dumps({"error": str(e)}))
+        else:
+            self._respond(200, quiz.model_dump_json())
+
+    def _respond(self, status: int, body: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the load test output free of per-request logging."""
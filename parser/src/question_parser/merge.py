@@ -0,0 +1,226 @@
+"""Merge many quiz documents into one renumbered bank.
+
+Questions are streamed from each input in order, renumbered on the fly from
+QUESTION_ID_START and written straight to the output with a QuizWriter, so
+the merged quiz is never held in memory and is never validated as a whole.
+Each question is validated once, when its input is parsed.
+
+Provenance is recorded per input as the block of merged ids it contributed.
+Within an input ids run sequentially from QUESTION_ID_START, so the block
+identifies the source file and original id of every merged question.
+"""
+
+import bisect
+import itertools
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import IO, Any
+
+from pydantic import BaseModel, ConfigDict
+
+from question_parser import hooks
+from question_parser.batch import BatchMode, resolve_mode
+from question_parser.defaults import QUESTION_ID_START, QUIZ_VERSION
+from question_parser.errors import ParsingError
+from question_parser.extractor import DocxExtractor
+from question_parser.loader import is_json
+from question_parser.models import Question
+from question_parser.normalize import TextNormalizer
+from question_parser.parser import QuestionParser
+from question_parser.reader import NDJSON_SUFFIXES, iter_questions
+from question_parser.streaming import QuizWriter
+
+
+class MergeSource(BaseModel):
+    """The questions one input contributed to a merged bank.
+
+    Attributes:
+        file: Path of the input
+        first_id: Merged id of its first question
+        questions: Number of questions it contributed
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    file: str
+    first_id: int
+    questions: int
+
+    @property
+    def last_id(self) -> int:
+        """Merged id of its last question."""
+        return self.first_id + self.questions - 1
+
+
+class MergeReport(BaseModel):
+    """Provenance of every question in a merged bank.
+
+    Attributes:
+        questions: Total number of questions written
+        sources: Inputs in merge order, with the merged ids each contributed
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    questions: int
+    sources: list[MergeSource]
+
+    def locate(self, question_id: int) -> tuple[str, int]:
+        """Find where a merged question came from.
+
+        Args:
+            question_id: Id in the merged bank
+
+        Returns:
+            The input file and the question's id in that file
+
+        Raises:
+            KeyError: If no question has this id
+        """
+        index = bisect.bisect_right([source.first_id for source in self.sources], question_id)
+        if index:
+            source = self.sources[index - 1]
+            if question_id <= source.last_id:
+                return source.file, question_id - source.first_id + QUESTION_ID_START
+        raise KeyError(question_id)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Serialize to JSON string with pretty formatting."""
+        return super().model_dump_json(indent=2, **kwargs)
+
+
+def merge_quizzes(
+    sources: Iterable[str | Path],
+    output: IO[str],
+    version: str = QUIZ_VERSION,
+    workers: int = 1,
+    mode: BatchMode = "auto",
+    normalizer: TextNormalizer | None = None,
+) -> MergeReport:
+    """Merge quiz documents into one bank with sequential ids.
+
+    Inputs may be DOCX documents or quiz JSON (or NDJSON, see reader). With
+    one worker, every input is streamed question by question. With more,
+    up to twice as many inputs as workers are parsed ahead in a thread or
+    process pool while earlier ones are written, in input order.
+
+    The output is written as the merge goes, so it is incomplete if an input
+    fails; write to a temporary file and move it into place to avoid that.
+
+    Args:
+        sources: Input files, in the order their questions should appear
+        output: Text stream the merged quiz JSON is written to
+        version: Quiz format version of the merged bank
+        workers: Number of inputs parsed at a time
+        mode: Pool used when workers > 1: "thread", "process", or "auto" (see batch)
+        normalizer: Cleans paragraph text of DOCX inputs before parsing
+
+    Returns:
+        Provenance of the merged questions
+
+    Raises:
+        FileNotFoundError: If an input does not exist
+        ValueError: If there are no inputs, workers is not positive, or an
+            input is not a valid DOCX file or quiz JSON
+        ParsingError: If an input cannot be parsed or has no questions
+    """
+    paths = [str(source) for source in sources]
+    if not paths:
+        raise ValueError("At least one input is required")
+    if workers < 1:
+        raise ValueError(f"Number of workers must be positive, got {workers}")
+
+    documents: Generator[tuple[str, Iterable[Question]], None, None] = (
+        ((path, _iter_source(path, normalizer)) for path in paths)
+        if workers == 1
+        else _parse_ahead(paths, workers, mode, normalizer)
+    )
+
+    merged: list[MergeSource] = []
+    # Closing the documents shuts down the pool promptly if an input fails
+    with closing(documents), QuizWriter(output, version) as writer:
+        for path, questions in documents:
+            start = writer.count
+            for question in questions:
+                writer.write(question.model_copy(update={"id": QUESTION_ID_START + writer.count}))
+            merged.append(
+                MergeSource(
+                    file=path, first_id=QUESTION_ID_START + start, questions=writer.count - start
+                )
+            )
+
+    return MergeReport(questions=writer.count, sources=merged)
+
+
+def _iter_source(path: str, normalizer: TextNormalizer | None) -> Iterator[Question]:
+    """Stream the questions of one input, checked like a complete Quiz.
+
+    Errors name the input, since a merge reads many. Like `parse`, parsing
+    reports its events and errors to hooks.
+    """
+    if is_json(path) or Path(path).suffix.lower() in NDJSON_SUFFIXES:
+        try:
+            yield from iter_questions(path)
+        except ParsingError as e:
+            raise ParsingError(f"{path}: {e.message}") from e
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from e
+        return
+
+    paragraphs = DocxExtractor(normalizer).iter_paragraphs_with_positions(path)
+    expected_id = QUESTION_ID_START
+    try:
+        for question in QuestionParser().iter_questions_with_positions(paragraphs):
+            if question.id != expected_id:
+                error = ParsingError(
+                    f"Question IDs must be sequential starting from {QUESTION_ID_START}, "
+                    f"expected {expected_id}, got {question.id}"
+                )
+                hooks.error(error)
+                raise error
+            expected_id += 1
+            yield question
+        if expected_id == QUESTION_ID_START:
+            error = ParsingError("No valid questions found")
+            hooks.error(error)
+            raise error
+    except ParsingError as e:
+        raise ParsingError(f"{path}: {e.message}", paragraph=e.paragraph) from e
+
+
+def _read_source(path: str, normalizer: TextNormalizer | None) -> list[Question]:
+    """Pool entry point: parse a whole input."""
+    return list(_iter_source(path, normalizer))
+
+
+def _parse_ahead(
+    paths: list[str], workers: int, mode: BatchMode, normalizer: TextNormalizer | None
+) -> Generator[tuple[str, list[Question]], None, None]:
+    """Parse inputs in a pool, yielding them in order with a bounded lookahead."""
+    executor: Executor = (
+        ThreadPoolExecutor(max_workers=workers)
+        if resolve_mode(mode) == "thread"
+        else ProcessPoolExecutor(max_workers=workers)
+    )
+    remaining = iter(paths)
+    pending: deque[tuple[str, Future[list[Question]]]] = deque()
+
+    def submit(path: str) -> None:
+        pending.append((path, executor.submit(_read_source, path, normalizer)))
+
+    try:
+        for path in itertools.islice(remaining, workers * 2):
+            submit(path)
+        while pending:
+            path, future = pending.popleft()
+            questions = future.result()
+            next_path = next(remaining, None)
+            if next_path is not None:
+                submit(next_path)
+            yield path, questions
+    finally:
+        # Stop parsing ahead if the merge failed or was abandoned
+        executor.shutdown(cancel_futures=True)
@@ -0,0 +1,140 @@
+"""In-memory metrics collector and Prometheus text-format exporter."""
+
+import bisect
+import math
+import threading
+
+from question_parser.errors import QuestionParserError
+from question_parser.hooks import Observer
+
+# Upper bounds in seconds for duration histograms
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+)
+
+# Counter incremented for every error reported to the collector
+ERRORS_COUNTER = "parsing_errors"
+
+
+class Histogram:
+    """Fixed-bucket histogram of observed values.
+
+    Attributes:
+        buckets: Sorted bucket upper bounds
+        bucket_counts: Observations per bucket, with a final +Inf bucket
+        total: Sum of all observed values
+        count: Number of observations
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            buckets: Bucket upper bounds; sorted on construction
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list[int]:
+        """Return the number of observations at or below each bucket bound, then +Inf."""
+        counts: list[int] = []
+        running = 0
+        for bucket_count in self.bucket_counts:
+            running += bucket_count
+            counts.append(running)
+        return counts
+
+
+class HistogramCollector(Observer):
+    """Observer that keeps duration histograms and counters in memory.
+
+    Attributes:
+        histograms: Duration histograms keyed by event name
+        counters: Counter totals keyed by name
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize an empty collector.
+
+        Args:
+            buckets: Bucket upper bounds in seconds for every histogram
+        """
+        self.buckets = buckets
+        self.histograms: dict[str, Histogram] = {}
+        self.counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def on_end(self, event: str, seconds: float) -> None:
+        """Record the duration of an event."""
+        with self._lock:
+            histogram = self.histograms.get(event)
+            if histogram is None:
+                histogram = self.histograms[event] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def on_count(self, name: str, value: int) -> None:
+        """Add to a counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def on_error(self, error: QuestionParserError) -> None:
+        """Count an error."""
+        self.on_count(ERRORS_COUNTER, 1)
+
+
+def prometheus_text(collector: HistogramCollector, namespace: str = "question_parser") -> str:
+    """Render a collector in the Prometheus text exposition format.
+
+    Histograms become `<namespace>_<event>_seconds` and counters become
+    `<namespace>_<name>_total`.
+
+    Args:
+        collector: Collector to export
+        namespace: Prefix for every metric name
+
+    Returns:
+        The exposition text, ending with a newline
+    """
+    lines: list[str] = []
+
+    with collector._lock:
+        for event, histogram in sorted(collector.histograms.items()):
+            name = f"{namespace}_{event}_seconds"
+            lines.append(f"# HELP {name} Duration of {event} events in seconds.")
+            lines.append(f"# TYPE {name} histogram")
+            bounds = [*histogram.buckets, math.inf]
+            for bound, cumulative in zip(bounds, histogram.cumulative_counts(), strict=True):
+                lines.append(f'{name}_bucket{{le="{_format_bound(bound)}"}} {cumulative}')
+            lines.append(f"{name}_sum {histogram.total!r}")
+            lines.append(f"{name}_count {histogram.count}")
+
+        for counter, value in sorted(collector.counters.items()):
+            name = f"{namespace}_{counter}_total"
+            lines.append(f"# HELP {name} Total {counter.replace('_', ' ')}.")
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {value}")
+
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _format_bound(bound: float) -> str:
+    """Format a bucket bound the way Prometheus clients do."""
+    return "+Inf" if math.isinf(bound) else repr(float(bound))
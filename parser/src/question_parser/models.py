@@ -4,6 +4,7 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, field_validator
 
+from question_parser import hooks
 from question_parser.defaults import (
     CHOICES_PER_QUESTION,
     LABEL_CHOICES,
@@ -115,4 +116,5 @@ class Quiz(BaseModel):
 
     def model_dump_json(self, **kwargs: Any) -> str:
         """Serialize to JSON string with pretty formatting."""
-        return super().model_dump_json(indent=2, **kwargs)
+        with hooks.timed(hooks.EVENT_SERIALIZE):
+            return super().model_dump_json(indent=2, **kwargs)
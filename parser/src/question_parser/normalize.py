@@ -0,0 +1,97 @@
+"""Text normalization for paragraphs extracted from Word documents.
+
+Word documents routinely contain characters that look like plain text but
+are not: zero-width spaces and joiners, byte order marks, soft hyphens,
+exotic spaces, full-width letters and digits, and smart quotes and dashes.
+They keep `Question N` headers and `A. text` choices from matching, or end up
+in the quiz JSON. A TextNormalizer cleans a paragraph with C-level string
+operations only:
+
+1. Unicode normalization, skipped for text that is already normalized
+2. character mapping, as a single `str.translate` with a precomputed table
+3. whitespace folding, turning every run of whitespace into one space
+
+Mapped characters that normalization would rewrite, such as the double
+prime NFKC splits into two primes, are translated before normalizing so
+their mapping still applies. Plain ASCII paragraphs, the common case, skip
+the first two steps.
+"""
+
+import unicodedata
+from collections.abc import Mapping
+from typing import Literal
+
+NormalizationForm = Literal["NFC", "NFKC", "NFD", "NFKD"]
+
+# Characters removed outright: zero-width space, non-joiner and joiner, word
+# joiner, byte order mark and soft hyphen
+INVISIBLE_CHARACTERS = "\u200b\u200c\u200d\u2060\ufeff\u00ad"
+
+# Typographic punctuation mapped to its ASCII equivalent: single quotes and
+# prime, double quotes and double prime, hyphens, dashes and minus sign
+SMART_PUNCTUATION: dict[str, str] = {
+    **dict.fromkeys("\u2018\u2019\u201a\u201b\u2032", "'"),
+    **dict.fromkeys("\u201c\u201d\u201e\u201f\u2033", '"'),
+    **dict.fromkeys("\u2010\u2011\u2012\u2013\u2014\u2015\u2212", "-"),
+}
+
+# Mapping applied by default: invisible characters removed, smart punctuation
+# made ASCII
+DEFAULT_CHARACTER_MAP: dict[str, str | None] = {
+    **dict.fromkeys(INVISIBLE_CHARACTERS),
+    **SMART_PUNCTUATION,
+}
+
+
+class TextNormalizer:
+    """Clean paragraph text so it parses like plain typed text.
+
+    Attributes:
+        form: Unicode normalization form, or None to skip normalization
+        fold_whitespace: Whether whitespace runs become single spaces
+        mapping: Characters replaced, with None for characters removed
+    """
+
+    def __init__(
+        self,
+        form: NormalizationForm | None = "NFKC",
+        fold_whitespace: bool = True,
+        mapping: Mapping[str, str | None] | None = None,
+    ) -> None:
+        """Precompute the translation table.
+
+        Args:
+            form: Unicode normalization form, or None to skip normalization.
+                NFKC also turns non-breaking spaces into spaces and full-width
+                characters into their ASCII forms.
+            fold_whitespace: Replace each run of whitespace, including line
+                breaks and tabs within a paragraph, with a single space
+            mapping: Characters to replace (None removes them); defaults to
+                DEFAULT_CHARACTER_MAP
+        """
+        self.form = form
+        self.fold_whitespace = fold_whitespace
+        self.mapping = dict(DEFAULT_CHARACTER_MAP if mapping is None else mapping)
+        self._table = str.maketrans(self.mapping)
+        self._early_table = str.maketrans(
+            {
+                character: replacement
+                for character, replacement in self.mapping.items()
+                if form is not None and unicodedata.normalize(form, character) != character
+            }
+        )
+        # ASCII text is already normalized in every form, so unless the mapping
+        # touches ASCII it only needs whitespace handling
+        self._ascii_unchanged = all(code >= 128 for code in self._table)
+
+    def __call__(self, text: str) -> str:
+        """Normalize one paragraph; the result has no surrounding whitespace."""
+        if not (self._ascii_unchanged and text.isascii()):
+            if self.form is not None and not unicodedata.is_normalized(self.form, text):
+                if self._early_table:
+                    text = text.translate(self._early_table)
+                text = unicodedata.normalize(self.form, text)
+            text = text.translate(self._table)
+        if self.fold_whitespace:
+            return " ".join(text.split())
+        return text.strip()
@@ -1,24 +1,76 @@
 """Parse paragraphs into Question and Quiz objects."""
 
+import itertools
 import re
+from collections.abc import Iterable, Iterator, Sequence
 
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from question_parser import hooks
 from question_parser.defaults import (
     CHOICES_PER_QUESTION,
     LABEL_CHOICES,
+    QUESTION_ID_START,
     QUESTION_KEYWORD,
 )
 from question_parser.errors import ParsingError
 from question_parser.models import Choice, Question, Quiz
+from question_parser.sourcemap import SourceMap
+
+# A question as parsed from paragraphs, before model validation:
+# (question id, question text, [(label, choice text), ...])
+RawQuestion = tuple[int, str, list[tuple[str, str]]]
+
+# Compiled once and shared by every parser; compiled patterns are safe to use
+# from several threads
+_QUESTION_PATTERN = re.compile(rf"^{QUESTION_KEYWORD}\s+(\d+)$")
+_CHOICE_PATTERN = re.compile(rf"^({'|'.join(LABEL_CHOICES)})\.\s+(.+)$")
+
+# Position of each label in LABEL_CHOICES, the order choices are kept in a SourceMap
+_LABEL_SLOTS = {label: slot for slot, label in enumerate(LABEL_CHOICES)}
+
+
+class CheckResult(BaseModel):
+    """Outcome of checking a document without converting it.
+
+    Attributes:
+        questions: Number of 'Question N' blocks found
+        problems: Every problem found, in document order
+        paragraphs: Source position of the 'Question N' paragraph each
+            problem is about, in step with problems; None where unknown, and
+            always None from `check`, which is not given source positions
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    questions: int
+    problems: list[str]
+    paragraphs: list[int | None]
+
+    @property
+    def ok(self) -> bool:
+        """Whether the document would convert without errors."""
+        return not self.problems
 
 
 class QuestionParser:
-    """Parse text paragraphs into structured Question and Quiz objects."""
+    """Parse text paragraphs into structured Question and Quiz objects.
 
-    def __init__(self) -> None:
-        """Initialize parser with dynamic regex patterns based on configuration."""
-        self.question_pattern = re.compile(rf"^{QUESTION_KEYWORD}\s+(\d+)$")
-        labels = "|".join(LABEL_CHOICES)
-        self.choice_pattern = re.compile(rf"^({labels})\.\s+(.+)$")
+    A parser holds no mutable state: all parsing state lives in local
+    variables, so one instance can be shared by any number of threads.
+    """
+
+    def __init__(self, bulk_validation: bool = False) -> None:
+        """Initialize parser with the regex patterns built from configuration.
+
+        Args:
+            bulk_validation: Build plain dicts for the whole document and validate
+                them into a Quiz with a single model_validate call, instead of
+                constructing each Choice and Question separately
+        """
+        self.bulk_validation = bulk_validation
+        self.question_pattern = _QUESTION_PATTERN
+        self.choice_pattern = _CHOICE_PATTERN
 
     def parse(self, paragraphs: list[str]) -> Quiz:
         """Parse paragraphs into a Quiz.
@@ -32,15 +84,77 @@ class QuestionParser:
         Raises:
             ParsingError: If parsing fails due to invalid format
         """
+        try:
+            quiz = self._parse(paragraphs)
+        except ParsingError as e:
+            hooks.error(e)
+            raise
+
+        hooks.count(hooks.COUNT_QUESTIONS, len(quiz.questions))
+        return quiz
+
+    def parse_with_sources(
+        self, paragraphs: list[str], positions: Sequence[int] | None = None
+    ) -> tuple[Quiz, SourceMap]:
+        """Parse paragraphs into a Quiz, recording where each question and choice came from.
+
+        Args:
+            paragraphs: List of paragraph strings from document
+            positions: Source paragraph index of each paragraph, e.g. from
+                DocxExtractor.extract_with_positions; by default, indexes in paragraphs
+
+        Returns:
+            The Quiz, and the source positions of its questions and choices
+
+        Raises:
+            ValueError: If positions and paragraphs differ in length
+            ParsingError: If parsing fails due to invalid format; its paragraph
+                is a source position
+        """
+        if positions is None:
+            positions = range(len(paragraphs))
+        elif len(positions) != len(paragraphs):
+            raise ValueError(f"Got {len(positions)} positions for {len(paragraphs)} paragraphs")
+
+        sources = SourceMap()
+        try:
+            quiz = self._parse(paragraphs, (positions, sources))
+        except ParsingError as e:
+            hooks.error(e)
+            raise
+
+        hooks.count(hooks.COUNT_QUESTIONS, len(quiz.questions))
+        return quiz, sources
+
+    def _parse(
+        self, paragraphs: list[str], located: tuple[Sequence[int], SourceMap] | None = None
+    ) -> Quiz:
+        """Parse and validate paragraphs into a Quiz, without reporting to hooks.
+
+        Args:
+            paragraphs: List of paragraph strings from document
+            located: Source positions of the paragraphs, and a map to record
+                question and choice positions in
+        """
         if not paragraphs:
             raise ParsingError("No paragraphs to parse")
 
-        questions = self.parse_all_questions(paragraphs)
+        if located is None:
+            raw_questions = self.parse_raw_questions(paragraphs)
+        else:
+            raw_questions = self._parse_located(paragraphs, *located)
 
-        if not questions:
+        if not raw_questions:
             raise ParsingError("No valid questions found")
 
-        return Quiz(questions=questions)
+        with hooks.timed(hooks.EVENT_VALIDATE):
+            if self.bulk_validation:
+                return self._validate_bulk(raw_questions)
+            questions = self._build_questions(raw_questions)
+            try:
+                return Quiz(questions=questions)
+            except ValidationError as e:
+                raise ParsingError(_describe_errors(e, raw_questions)) from e
 
     def parse_all_questions(self, paragraphs: list[str]) -> list[Question]:
         """Parse all questions from paragraphs.
@@ -51,22 +165,309 @@ class QuestionParser:
         Returns:
             List of parsed Question objects
         """
-        questions: list[Question] = []
-        i = 0
+        return self._build_questions(self.parse_raw_questions(paragraphs))
+
+    def parse_raw_questions(self, paragraphs: Iterable[str]) -> list[RawQuestion]:
+        """Parse all questions from paragraphs without building models.
+
+        Args:
+            paragraphs: Paragraph strings
+
+        Returns:
+            List of (question id, question text, [(label, choice text), ...]) tuples
+
+        Raises:
+            ParsingError: If question format is invalid
+        """
+        return list(self.iter_raw_questions(paragraphs))
+
+    def iter_raw_questions(self, paragraphs: Iterable[str]) -> Iterator[RawQuestion]:
+        """Lazily parse questions from a stream of paragraphs without building models.
+
+        Paragraphs are grouped into blocks, each running from a 'Question N'
+        line up to the next one, and each block is parsed as soon as it is
+        complete. Only one block is held at a time, and every paragraph is
+        examined a bounded number of times. Paragraphs before the first
+        'Question N' line are ignored.
+
+        Every 'Question N' line starts a new question. A question without
+        labeled choices therefore takes its unlabeled choices from its own
+        block rather than reading on for labeled choices further down, and a
+        header followed directly by another header is a question with no text.
+
+        Args:
+            paragraphs: Paragraph strings, e.g. from DocxExtractor.iter_paragraphs
+
+        Yields:
+            (question id, question text, [(label, choice text), ...]) tuples
+
+        Raises:
+            ParsingError: If question format is invalid
+        """
+        for block, question_id, _ in self._iter_blocks(enumerate(paragraphs)):
+            yield self._parse_block(block, question_id)[0]
+
+    def iter_questions(self, paragraphs: Iterable[str]) -> Iterator[Question]:
+        """Lazily parse and validate questions from a stream of paragraphs.
+
+        Each question is validated on its own; checks that span the quiz,
+        such as sequential ids, are left to the consumer. Errors and the
+        number of questions yielded are reported to hooks like `parse` does.
+
+        Args:
+            paragraphs: Paragraph strings, e.g. from DocxExtractor.iter_paragraphs
+
+        Yields:
+            Question objects in document order
+
+        Raises:
+            ParsingError: If question format is invalid
+        """
+        return self._validate_each(self.iter_raw_questions(paragraphs))
+
+    def iter_questions_with_positions(
+        self, paragraphs: Iterable[tuple[int, str]]
+    ) -> Iterator[Question]:
+        """Lazily parse and validate questions, locating errors in the source document.
+
+        Like `iter_questions`, for paragraphs that come with their source positions.
+
+        Args:
+            paragraphs: (source position, paragraph string) tuples, e.g. from
+                DocxExtractor.iter_paragraphs_with_positions
+
+        Yields:
+            Question objects in document order
+
+        Raises:
+            ParsingError: If question format is invalid; its paragraph is the
+                source position of the question's 'Question N' paragraph
+        """
+        raw_questions = (
+            self._parse_block(block, question_id, start)[0]
+            for block, question_id, start in self._iter_blocks(paragraphs)
+        )
+        return self._validate_each(raw_questions)
+
+    def check(self, paragraphs: Iterable[str]) -> CheckResult:
+        """Check paragraphs against every parsing and Quiz validation rule.
+
+        Runs the same structural parse as `parse` (headers, question text,
+        choice counts and label sets) plus the Quiz rules on question ids,
+        but builds no models. Unlike `parse`, it does not stop at the first
+        problem; each question that fails to parse is reported to hooks as
+        an error.
+
+        Args:
+            paragraphs: Paragraph strings, e.g. from DocxExtractor.iter_paragraphs
+
+        Returns:
+            The number of questions found and every problem, in document order
+        """
+        return self._check(enumerate(paragraphs), located=False)
+
+    def check_with_positions(self, paragraphs: Iterable[tuple[int, str]]) -> CheckResult:
+        """Check paragraphs like `check`, locating each problem in the source document.
+
+        Args:
+            paragraphs: (source position, paragraph string) tuples, e.g. from
+                DocxExtractor.iter_paragraphs_with_positions
 
-        while i < len(paragraphs):
-            match = self.question_pattern.match(paragraphs[i])
+        Returns:
+            The number of questions found and every problem, in document
+            order, with the source position of the question it is about
+        """
+        return self._check(paragraphs, located=True)
+
+    def _validate_each(self, raw_questions: Iterable[RawQuestion]) -> Iterator[Question]:
+        """Validate raw questions one by one, reporting errors and the count to hooks."""
+        count = 0
+        try:
+            for raw_question in raw_questions:
+                yield from self._build_questions([raw_question])
+                count += 1
+        except ParsingError as e:
+            hooks.error(e)
+            raise
+        finally:
+            hooks.count(hooks.COUNT_QUESTIONS, count)
+
+    def _check(self, paragraphs: Iterable[tuple[int, str]], located: bool) -> CheckResult:
+        """Check (position, paragraph) tuples; positions are reported only if located."""
+        paragraphs = iter(paragraphs)
+        first = next(paragraphs, None)
+        if first is None:
+            return CheckResult(questions=0, problems=["No paragraphs to parse"], paragraphs=[None])
+
+        problems: list[str] = []
+        locations: list[int | None] = []
+        count = 0
+        expected_id = QUESTION_ID_START
+        for block, question_id, start in self._iter_blocks(itertools.chain([first], paragraphs)):
+            count += 1
+            location = start if located else None
+            try:
+                self._parse_block(block, question_id, location)
+            except ParsingError as e:
+                hooks.error(e)
+                problems.append(e.message)
+                locations.append(location)
+
+            if question_id <= 0:
+                problems.append(f"Question {question_id}: Question ID must be positive")
+                locations.append(location)
+            if question_id != expected_id:
+                problems.append(
+                    f"Question {question_id}: Question IDs must be sequential starting from "
+                    f"{QUESTION_ID_START}, expected {expected_id}"
+                )
+                locations.append(location)
+            expected_id = question_id + 1
+
+        if not count:
+            problems.append("No valid questions found")
+            locations.append(None)
+        return CheckResult(questions=count, problems=problems, paragraphs=locations)
+
+    def _iter_blocks(
+        self, paragraphs: Iterable[tuple[int, str]]
+    ) -> Iterator[tuple[list[str], int, int]]:
+        """Group paragraphs into blocks from one 'Question N' line up to the next.
+
+        Args:
+            paragraphs: (position, paragraph string) tuples; the position is
+                passed through, so it may be a list index or a source position
+
+        Yields:
+            (block starting with 'Question N', N, position of the 'Question N'
+            paragraph) tuples
+        """
+        block: list[str] = []
+        question_id = 0
+        start = 0
+
+        for position, paragraph in paragraphs:
+            match = self.question_pattern.match(paragraph)
             if match:
+                if block:
+                    yield block, question_id, start
+                block = [paragraph]
                 question_id = int(match.group(1))
-                question, lines_consumed = self._parse_question(paragraphs[i:], question_id)
-                questions.append(question)
-                i += lines_consumed
-            else:
-                i += 1
+                start = position
+            elif block:
+                block.append(paragraph)
+
+        if block:
+            yield block, question_id, start
+
+    def _parse_located(
+        self, paragraphs: list[str], positions: Sequence[int], sources: SourceMap
+    ) -> list[RawQuestion]:
+        """Parse all questions, recording their source positions in sources.
+
+        Raises:
+            ParsingError: If question format is invalid, located by source position
+        """
+        raw_questions: list[RawQuestion] = []
+
+        for block, question_id, start in self._iter_blocks(enumerate(paragraphs)):
+            raw_question, first_choice = self._parse_block(block, question_id, positions[start])
+
+            choices = [0] * len(LABEL_CHOICES)
+            for offset, (label, _) in enumerate(raw_question[2]):
+                choices[_LABEL_SLOTS[label]] = positions[start + first_choice + offset]
+            sources.append(
+                start=positions[start],
+                text=range(positions[start + 1], positions[start + first_choice - 1] + 1),
+                stop=positions[start + len(block) - 1] + 1,
+                choices=choices,
+            )
+            raw_questions.append(raw_question)
+
+        return raw_questions
+
+    def _build_questions(self, raw_questions: list[RawQuestion]) -> list[Question]:
+        """Construct a Question model, with its Choice models, for each raw question.
+
+        Args:
+            raw_questions: Questions returned by parse_raw_questions
+
+        Returns:
+            List of Question objects
+
+        Raises:
+            ParsingError: If a question fails validation, naming the question
+        """
+        questions: list[Question] = []
+
+        for index, (question_id, text, raw_choices) in enumerate(raw_questions):
+            try:
+                choices = [
+                    Choice(label=label, text=choice_text)  # type: ignore[arg-type]
+                    for label, choice_text in raw_choices
+                ]
+                questions.append(Question(id=question_id, text=text, choices=choices))
+            except ValidationError as e:
+                raise ParsingError(_describe_errors(e, raw_questions, index)) from e
 
         return questions
 
-    def _parse_question(self, paragraphs: list[str], question_id: int) -> tuple[Question, int]:
+    def _validate_bulk(self, raw_questions: list[RawQuestion]) -> Quiz:
+        """Validate raw questions into a Quiz with a single model_validate call.
+
+        Args:
+            raw_questions: Questions returned by parse_raw_questions
+
+        Returns:
+            Quiz object with the validated questions
+
+        Raises:
+            ParsingError: If validation fails, naming the question at fault
+        """
+        data = {
+            "questions": [
+                {
+                    "id": question_id,
+                    "text": text,
+                    "choices": [
+                        {"label": label, "text": choice_text} for label, choice_text in choices
+                    ],
+                }
+                for question_id, text, choices in raw_questions
+            ]
+        }
+
+        try:
+            return Quiz.model_validate(data)
+        except ValidationError as e:
+            raise ParsingError(_describe_errors(e, raw_questions)) from e
+
+    def _parse_block(
+        self, block: list[str], question_id: int, paragraph: int | None = None
+    ) -> tuple[RawQuestion, int]:
+        """Parse one question block, reporting its duration to hooks.
+
+        Args:
+            block: Paragraphs from 'Question N' up to the next question
+            question_id: The question number from the header
+            paragraph: Source position of the block's first paragraph, if
+                known, recorded in errors
+
+        Returns:
+            The raw question, and the index within the block of its first choice
+
+        Raises:
+            ParsingError: If question format is invalid
+        """
+        with hooks.timed(hooks.EVENT_PARSE_QUESTION):
+            try:
+                return self._parse_question(block, question_id)
+            except ParsingError as e:
+                if paragraph is None:
+                    raise
+                raise ParsingError(e.message, paragraph=paragraph) from e
+
+    def _parse_question(self, paragraphs: list[str], question_id: int) -> tuple[RawQuestion, int]:
         """Parse a single question starting from the 'Question N' line.
 
         Args:
@@ -74,7 +475,7 @@ class QuestionParser:
             question_id: The question number from the header
 
         Returns:
-            Tuple of (Question object, number of lines consumed)
+            The raw question, and the index in paragraphs of its first choice
 
         Raises:
             ParsingError: If question format is invalid
@@ -86,11 +487,7 @@ class QuestionParser:
         choices = self._parse_choices(paragraphs, text_end, question_id)
         self._validate_choices(choices, question_id)
 
-        question = Question(id=question_id, text=question_text, choices=choices)
-
-        # Total lines consumed: text lines + choice lines
-        lines_consumed = text_end + len(choices)
-        return question, lines_consumed
+        return (question_id, question_text, choices), text_end
 
     def _parse_question_text(self, paragraphs: list[str], question_id: int) -> tuple[str, int]:
         """Parse question text between 'Question N' and first choice.
@@ -134,7 +531,7 @@ class QuestionParser:
 
     def _parse_choices(
         self, paragraphs: list[str], start_index: int, question_id: int
-    ) -> list[Choice]:
+    ) -> list[tuple[str, str]]:
         """Parse choice options starting from given index.
 
         Supports both labeled format (A. text) and unlabeled format (text).
@@ -146,12 +543,12 @@ class QuestionParser:
             question_id: The question number for error messages
 
         Returns:
-            List of Choice objects
+            List of (label, choice text) tuples
 
         Raises:
             ParsingError: If wrong number of choices found
         """
-        choices: list[Choice] = []
+        choices: list[tuple[str, str]] = []
         i = start_index
 
         # Try parsing labeled choices first
@@ -160,7 +557,7 @@ class QuestionParser:
             if match:
                 label = match.group(1)
                 text = match.group(2)
-                choices.append(Choice(label=label, text=text))  # type: ignore[arg-type]
+                choices.append((label, text))
                 i += 1
             else:
                 break
@@ -175,7 +572,7 @@ class QuestionParser:
 
                 label = LABEL_CHOICES[len(choices)]
                 text = paragraphs[i].strip()
-                choices.append(Choice(label=label, text=text))  # type: ignore[arg-type]
+                choices.append((label, text))
                 i += 1
 
         if len(choices) != CHOICES_PER_QUESTION:
@@ -186,19 +583,45 @@ class QuestionParser:
 
         return choices
 
-    def _validate_choices(self, choices: list[Choice], question_id: int) -> None:
+    def _validate_choices(self, choices: list[tuple[str, str]], question_id: int) -> None:
         """Validate that all required choice labels are present.
 
         Args:
-            choices: List of Choice objects to validate
+            choices: List of (label, choice text) tuples to validate
             question_id: The question number for error messages
 
         Raises:
             ParsingError: If labels are missing or invalid
         """
-        labels = {c.label for c in choices}
+        labels = {label for label, _ in choices}
         if labels != set(LABEL_CHOICES):
             raise ParsingError(
                 f"Question {question_id} has invalid labels: {sorted(labels)}, "
                 f"expected {sorted(LABEL_CHOICES)}"
             )
+
+
+def _describe_errors(
+    error: ValidationError, raw_questions: list[RawQuestion], question: int | None = None
+) -> str:
+    """Turn a Quiz validation error into a message that names question ids.
+
+    Args:
+        error: Error raised by Quiz.model_validate
+        raw_questions: The questions that were validated, in order
+        question: Index in raw_questions of the question, if the error was
+            raised validating that question on its own
+
+    Returns:
+        One line per error, prefixed with the question it belongs to
+    """
+    lines = []
+    for detail in error.errors():
+        loc = detail["loc"] if question is None else ("questions", question, *detail["loc"])
+        message = detail["msg"].removeprefix("Value error, ")
+        if len(loc) >= 2 and loc[0] == "questions" and isinstance(loc[1], int):
+            question_id = raw_questions[loc[1]][0]
+            lines.append(f"Question {question_id}: {message}")
+        else:
+            lines.append(f"Invalid quiz: {message}")
+    return "\n".join(lines)
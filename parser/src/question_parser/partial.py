@@ -0,0 +1,232 @@
+"""Parse only a range of questions from a document.
+
+Paragraphs are streamed from the document and extraction stops as soon as
+the range has been read, so questions near the start of a bank come back
+quickly whatever its size. Questions before the range are skipped without
+being parsed.
+
+For ranges deep into a bank, a QuestionIndex records the byte offset of
+every 'Question N' header in the document XML. With an index, extraction
+starts at the header of the first requested question: the XML before it
+is decompressed but never parsed. Building the index costs one full pass
+over the document, so indexes are cached by a hash of the document
+contents, in memory and optionally on disk.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import closing
+from pathlib import Path
+from re import Pattern
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from question_parser import hooks
+from question_parser.defaults import QUESTION_ID_START
+from question_parser.errors import ParsingError
+from question_parser.extractor import DocxExtractor
+from question_parser.models import Question
+from question_parser.normalize import TextNormalizer
+from question_parser.parser import QuestionParser
+
+# Indexes kept in memory by an IndexCache
+DEFAULT_CACHE_ENTRIES = 64
+
+
+class QuestionIndex(BaseModel):
+    """Where the 'Question N' headers of a document start.
+
+    Attributes:
+        offsets: Byte offset in the document XML of each header paragraph,
+            keyed by question id; the first header wins if an id repeats
+        positions: Source position of each header paragraph, keyed like
+            offsets, so errors after a resumed read are still located
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    offsets: dict[int, int]
+    positions: dict[int, int]
+
+
+class IndexCache:
+    """Question indexes keyed by document contents.
+
+    Keeps the most recently used indexes in memory and, given a directory,
+    also stores every index there as JSON so it outlives the process.
+    """
+
+    def __init__(
+        self, directory: str | Path | None = None, max_entries: int = DEFAULT_CACHE_ENTRIES
+    ) -> None:
+        """Create a cache.
+
+        Args:
+            directory: Directory for index files; created if missing. None
+                keeps indexes in memory only.
+            max_entries: Number of indexes kept in memory
+        """
+        self.directory = Path(directory) if directory is not None else None
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, QuestionIndex] = OrderedDict()
+
+    def get(self, key: str) -> QuestionIndex | None:
+        """Return the index stored under a key, or None."""
+        index = self._entries.get(key)
+        if index is not None:
+            self._entries.move_to_end(key)
+            return index
+
+        if self.directory is None:
+            return None
+        try:
+            index = QuestionIndex.model_validate_json((self.directory / f"{key}.json").read_bytes())
+        except (FileNotFoundError, ValidationError):
+            return None  # Missing or unreadable entries are rebuilt
+        self._remember(key, index)
+        return index
+
+    def put(self, key: str, index: QuestionIndex) -> None:
+        """Store an index under a key."""
+        self._remember(key, index)
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / f"{key}.json").write_text(index.model_dump_json())
+
+    def _remember(self, key: str, index: QuestionIndex) -> None:
+        self._entries[key] = index
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def index_key(data: bytes, normalizer: TextNormalizer | None = None) -> str:
+    """Cache key for a document: a hash of its contents and normalizer settings.
+
+    Normalization can turn paragraphs into headers, so indexes built without
+    a normalizer, or with normalizers configured differently, are kept apart.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    if normalizer is None:
+        return digest
+    settings = [normalizer.form, normalizer.fold_whitespace, sorted(normalizer.mapping.items())]
+    return f"{digest}-{hashlib.sha256(json.dumps(settings).encode()).hexdigest()}"
+
+
+def build_question_index(data: bytes, normalizer: TextNormalizer | None = None) -> QuestionIndex:
+    """Record where each 'Question N' header starts in a document.
+
+    Args:
+        data: The DOCX file contents
+        normalizer: Cleans paragraph text before headers are recognized
+
+    Returns:
+        The header offsets and positions
+
+    Raises:
+        ValueError: If the data is not a valid DOCX file
+    """
+    pattern = QuestionParser().question_pattern
+    offsets: dict[int, int] = {}
+    positions: dict[int, int] = {}
+    for offset, position, text in DocxExtractor(normalizer).iter_paragraph_offsets(data):
+        match = pattern.match(text)
+        if match:
+            question_id = int(match.group(1))
+            if question_id not in offsets:
+                offsets[question_id] = offset
+                positions[question_id] = position
+    return QuestionIndex(offsets=offsets, positions=positions)
+
+
+def parse_question_range(
+    source: str | Path | bytes,
+    start: int,
+    end: int,
+    cache: IndexCache | None = None,
+    normalizer: TextNormalizer | None = None,
+) -> list[Question]:
+    """Parse questions START through END of a document, and nothing else.
+
+    The range must begin at an existing question; it is cut short if the
+    document ends first. Ids within the range must be sequential, as in a
+    complete quiz, but questions outside it are neither parsed nor checked.
+
+    Args:
+        source: Path to the DOCX file, or its contents as bytes
+        start: Id of the first question
+        end: Id of the last question, inclusive
+        cache: Look up, or build and store, the document's question index
+            and start reading at question START; without one, the document
+            is read from the beginning
+        normalizer: Cleans the text of every paragraph before parsing
+
+    Returns:
+        The questions, in document order
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the range is empty or starts before QUESTION_ID_START,
+            or the file is not a valid DOCX file
+        ParsingError: If question START is missing or a question in the
+            range cannot be parsed; parse errors carry the source position of
+            the question's 'Question N' paragraph
+    """
+    if start < QUESTION_ID_START or end < start:
+        raise ValueError(
+            f"Invalid question range {start}-{end}: expected START-END with "
+            f"{QUESTION_ID_START} <= START <= END"
+        )
+
+    offset = position = 0
+    if cache is not None:
+        data = Path(source).read_bytes() if isinstance(source, str | Path) else source
+        key = index_key(data, normalizer)
+        index = cache.get(key)
+        if index is None:
+            index = build_question_index(data, normalizer)
+            cache.put(key, index)
+        if start not in index.offsets:
+            error = ParsingError(f"Question {start} not found")
+            hooks.error(error)
+            raise error
+        source, offset, position = data, index.offsets[start], index.positions[start]
+
+    parser = QuestionParser()
+    extractor = DocxExtractor(normalizer)
+    with closing(
+        extractor.iter_paragraphs_with_positions(source, offset=offset, position=position)
+    ) as paragraphs:
+        selected = _select(paragraphs, start, end, parser.question_pattern)
+        questions = list(parser.iter_questions_with_positions(selected))
+
+    if not questions:
+        error = ParsingError(f"Question {start} not found")
+        hooks.error(error)
+        raise error
+    for expected_id, question in enumerate(questions, start=start):
+        if question.id != expected_id:
+            error = ParsingError(
+                f"Question IDs must be sequential, expected {expected_id}, got {question.id}"
+            )
+            hooks.error(error)
+            raise error
+    return questions
+
+
+def _select(
+    paragraphs: Iterable[tuple[int, str]], start: int, end: int, header: Pattern[str]
+) -> Iterator[tuple[int, str]]:
+    """Yield the located paragraphs from the 'Question START' header up to the header after END."""
+    selecting = False
+    for position, paragraph in paragraphs:
+        match = header.match(paragraph)
+        if match:
+            question_id = int(match.group(1))
+            if selecting and question_id > end:
+                return
+            selecting = selecting or question_id == start
+        if selecting:
+            yield position, paragraph
@@ -0,0 +1,225 @@
+"""Memory profiling for the extract, parse and serialize stages."""
+
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+from question_parser.extractor import DocxExtractor, DocxSource
+from question_parser.normalize import TextNormalizer
+from question_parser.parser import QuestionParser
+
+# Stage names used by profile_conversion, in pipeline order
+STAGE_LOAD = "load"
+STAGE_PARAGRAPHS = "paragraphs"
+STAGE_MODELS = "models"
+STAGE_SERIALIZE = "serialize"
+
+
+class AllocationSite(BaseModel):
+    """Memory allocated at a single source line during a stage.
+
+    Attributes:
+        file: Source file, relative to its sys.path entry when possible
+        line: Line number in the source file
+        size_bytes: Net bytes allocated at this line during the stage
+        count: Net number of allocations at this line during the stage
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    file: str
+    line: int
+    size_bytes: int
+    count: int
+
+
+class StageMemory(BaseModel):
+    """Memory usage of a single pipeline stage.
+
+    Attributes:
+        name: Stage name (ex: load)
+        peak_bytes: Highest traced memory reached while the stage ran
+        retained_bytes: Traced memory still held at the end of the stage, minus
+            what was held at its start
+        top_allocations: Largest allocation sites of the stage, biggest first
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    peak_bytes: int
+    retained_bytes: int
+    top_allocations: list[AllocationSite]
+
+
+class MemoryReport(BaseModel):
+    """Memory usage of a profiled run.
+
+    Attributes:
+        peak_bytes: Highest traced memory reached across all stages
+        stages: Per-stage measurements in the order the stages ran
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    peak_bytes: int
+    stages: list[StageMemory]
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Serialize to JSON string with pretty formatting."""
+        return super().model_dump_json(indent=2, **kwargs)
+
+
+class MemoryProfiler:
+    """Record peak memory and top allocation sites for named stages using tracemalloc.
+
+    Use as a context manager and wrap each stage in `stage()`:
+
+        with MemoryProfiler() as profiler:
+            with profiler.stage("load"):
+                ...
+        report = profiler.report()
+    """
+
+    def __init__(self, top: int = 10) -> None:
+        """Initialize the profiler.
+
+        Args:
+            top: Number of allocation sites to keep per stage
+        """
+        self.top = top
+        self._stages: list[StageMemory] = []
+        self._owns_tracing = False
+
+    def __enter__(self) -> "MemoryProfiler":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the memory used by the wrapped block.
+
+        Args:
+            name: Stage name recorded in the report
+
+        Raises:
+            RuntimeError: If the profiler has not been entered
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("MemoryProfiler.stage() used outside of the profiler context")
+
+        before = tracemalloc.take_snapshot()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            end_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            self._stages.append(
+                StageMemory(
+                    name=name,
+                    peak_bytes=peak_bytes,
+                    retained_bytes=end_bytes - start_bytes,
+                    top_allocations=self._top_sites(before, after),
+                )
+            )
+
+    def report(self) -> MemoryReport:
+        """Build the report for all stages measured so far."""
+        return MemoryReport(
+            peak_bytes=max((s.peak_bytes for s in self._stages), default=0),
+            stages=list(self._stages),
+        )
+
+    def _top_sites(
+        self, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot
+    ) -> list[AllocationSite]:
+        """Return the largest net allocation sites between two snapshots."""
+        ignore = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+        diffs = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+
+        sites: list[AllocationSite] = []
+        for diff in diffs:
+            if len(sites) >= self.top:
+                break
+            if diff.size_diff <= 0:
+                continue
+            frame = diff.traceback[0]
+            sites.append(
+                AllocationSite(
+                    file=_display_path(frame.filename),
+                    line=frame.lineno,
+                    size_bytes=diff.size_diff,
+                    count=diff.count_diff,
+                )
+            )
+        return sites
+
+
+def _display_path(filename: str) -> str:
+    """Strip the longest matching sys.path prefix so reports diff across machines."""
+    path = Path(filename)
+    best: Path | None = None
+    for entry in sys.path:
+        if not entry:
+            continue
+        root = Path(entry)
+        if path.is_relative_to(root) and (best is None or len(root.parts) > len(best.parts)):
+            best = root
+    return path.relative_to(best).as_posix() if best else path.as_posix()
+
+
+def profile_conversion(
+    source: DocxSource, top: int = 10, normalizer: TextNormalizer | None = None
+) -> tuple[str, MemoryReport]:
+    """Convert a DOCX file to quiz JSON while profiling each stage.
+
+    Args:
+        source: Path to the DOCX file, its contents as bytes, or a binary file object
+        top: Number of allocation sites to keep per stage
+        normalizer: Cleans the text of every paragraph; by default it is only stripped
+
+    Returns:
+        Tuple of (quiz JSON, memory report)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is not a valid DOCX file
+        ParsingError: If parsing fails due to invalid format
+    """
+    extractor = DocxExtractor(normalizer)
+    parser = QuestionParser()
+
+    with MemoryProfiler(top=top) as profiler:
+        with profiler.stage(STAGE_LOAD):
+            document = extractor.load(source)
+        with profiler.stage(STAGE_PARAGRAPHS):
+            paragraphs = extractor.paragraphs(document)
+        with profiler.stage(STAGE_MODELS):
+            quiz = parser.parse(paragraphs)
+        with profiler.stage(STAGE_SERIALIZE):
+            json_output = quiz.model_dump_json()
+
+    return json_output, profiler.report()
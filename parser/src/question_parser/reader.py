@@ -0,0 +1,228 @@
+"""Stream questions out of quiz JSON without loading the whole file.
+
+Reads the JSON written by the parser, `{"version": ..., "questions": [...]}`,
+in chunks and yields each question as soon as its object is complete, so
+memory use stays constant whatever the size of the bank. The NDJSON form,
+one question object per line, is read line by line.
+"""
+
+import json
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+
+from question_parser.defaults import QUESTION_ID_START, QUIZ_VERSION
+from question_parser.errors import ParsingError
+from question_parser.models import Choice, Question
+
+# Characters read from the source at a time
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# File suffixes read as one question per line
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_questions(
+    source: str | Path | IO[str],
+    validate: bool = True,
+    ndjson: bool | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Question]:
+    """Lazily read questions from quiz JSON or NDJSON.
+
+    With validation, every question is validated as it is read and ids must
+    be sequential from QUESTION_ID_START, so a fully consumed iterator
+    has checked everything `Quiz.model_validate_json` would. Quiz JSON must
+    also declare the supported format version, QUIZ_VERSION; NDJSON carries
+    no version. Without validation,
+    questions are built with `model_construct` and accepted as they are;
+    use this for input that may not pass validation, not for speed, since
+    pydantic's compiled validator outruns constructing models in Python.
+
+    Args:
+        source: Path to a JSON or NDJSON file, or a text stream
+        validate: Validate each question and the id sequence
+        ndjson: Read one question per line; by default, true for paths
+            ending in ".ndjson" or ".jsonl"
+        chunk_size: Characters read at a time from quiz JSON
+
+    Yields:
+        Questions in file order
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the input is not valid quiz JSON, or a question fails
+            validation (pydantic's ValidationError is a ValueError)
+        ParsingError: If validating quiz JSON whose version is missing or
+            not supported
+    """
+    if isinstance(source, str | Path):
+        if ndjson is None:
+            ndjson = Path(source).suffix.lower() in NDJSON_SUFFIXES
+        with open(source, encoding="utf-8") as stream:
+            yield from iter_questions(stream, validate, ndjson, chunk_size)
+        return
+
+    if ndjson:
+        objects = _iter_ndjson(source)
+    else:
+        objects = _iter_quiz_json(source, chunk_size, check_version=validate)
+    if not validate:
+        for data in objects:
+            yield _construct_question(data)
+        return
+
+    next_id = QUESTION_ID_START
+    for data in objects:
+        question = Question.model_validate(data)
+        if question.id != next_id:
+            raise ValueError(
+                f"Question IDs must be sequential starting from {QUESTION_ID_START}, "
+                f"expected {next_id}, got {question.id}"
+            )
+        next_id += 1
+        yield question
+
+    if next_id == QUESTION_ID_START:
+        raise ValueError("Quiz must have at least one question")
+
+
+def _construct_question(data: Any) -> Question:
+    """Build a Question, and its Choices, from trusted data without validation."""
+    choices = [Choice.model_construct(**choice) for choice in data["choices"]]
+    return Question.model_construct(id=data["id"], text=data["text"], choices=choices)
+
+
+def _iter_ndjson(stream: IO[str]) -> Iterator[Any]:
+    """Yield the object on each non-blank line."""
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid quiz JSON on line {line_number}: {e.msg}") from e
+
+
+def _iter_quiz_json(stream: IO[str], chunk_size: int, check_version: bool) -> Iterator[Any]:
+    """Yield the elements of the top-level "questions" array, skipping other keys.
+
+    Keys may come in any order, so a missing version is only noticed once the
+    whole object has been read.
+    """
+    buffer = _JsonBuffer(stream, chunk_size)
+    versioned = False
+    buffer.expect("{")
+    if not buffer.consume("}"):
+        while True:
+            key = buffer.decode()
+            if not isinstance(key, str):
+                raise buffer.error("expected a key")
+            buffer.expect(":")
+
+            if key == "questions":
+                buffer.expect("[")
+                if not buffer.consume("]"):
+                    while True:
+                        yield buffer.decode()
+                        if buffer.consume("]"):
+                            break
+                        buffer.expect(",")
+            elif key == "version":
+                version = buffer.decode()
+                if check_version and version != QUIZ_VERSION:
+                    raise ParsingError(
+                        f"Unsupported quiz version {version!r}, expected {QUIZ_VERSION!r}"
+                    )
+                versioned = True
+            else:
+                buffer.decode()
+
+            if buffer.consume("}"):
+                break
+            buffer.expect(",")
+
+    if buffer.peek():
+        raise buffer.error("unexpected data after the quiz")
+    if check_version and not versioned:
+        raise ParsingError(f"Quiz JSON has no version, expected {QUIZ_VERSION!r}")
+
+
+class _JsonBuffer:
+    """Sliding window over a text stream for decoding one JSON value at a time.
+
+    Text before the current position is dropped whenever more is read, so the
+    window holds at most one chunk plus the value being decoded.
+    """
+
+    def __init__(self, stream: IO[str], chunk_size: int) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._text = ""
+        self._pos = 0
+        self._offset = 0  # Characters dropped from the front of the window
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read another chunk; return False at end of input."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._offset += self._pos
+        self._text = self._text[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            match = _WHITESPACE.match(self._text, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos < len(self._text) or not self._fill():
+                return
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or "" at end of input."""
+        self._skip_whitespace()
+        return self._text[self._pos : self._pos + 1]
+
+    def consume(self, char: str) -> bool:
+        """Skip the next character if it is `char`."""
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def expect(self, char: str) -> None:
+        """Skip the next character, which must be `char`."""
+        if not self.consume(char):
+            raise self.error(f"expected {char!r}")
+
+    def decode(self) -> Any:
+        """Decode the next JSON value, reading more input until it is complete."""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._text, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ValueError(
+                    f"Invalid quiz JSON: {e.msg} at offset {self._offset + e.pos}"
+                ) from e
+
+            # A value ending with the window may be a number cut off mid-digits
+            if end == len(self._text) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def error(self, message: str) -> ValueError:
+        """Build an error for the current position."""
+        return ValueError(f"Invalid quiz JSON: {message} at offset {self._offset + self._pos}")
@@ -0,0 +1,101 @@
+"""Paragraph positions of the questions and choices of a parsed quiz.
+
+A SourceMap is a side table kept next to a Quiz rather than in it, so the
+quiz JSON is unchanged. Positions are paragraph indexes in the source
+document, counted from 0 and including empty paragraphs, as returned by
+`DocxExtractor.extract_with_positions`. Each is stored as a 32-bit unsigned
+integer in a flat array: four per question and one per choice, about 32
+bytes per question however long its text.
+"""
+
+import bisect
+from array import array
+from collections.abc import Sequence
+
+from question_parser.defaults import LABEL_CHOICES, QUESTION_ID_START
+
+
+class SourceMap:
+    """Where each question of a quiz, and each of its choices, came from.
+
+    Questions are looked up by id, which in a valid quiz runs sequentially
+    from QUESTION_ID_START.
+    """
+
+    __slots__ = ("_starts", "_text_starts", "_text_stops", "_stops", "_choices")
+
+    def __init__(self) -> None:
+        """Create an empty map."""
+        self._starts = array("I")  # 'Question N' header
+        self._text_starts = array("I")
+        self._text_stops = array("I")
+        self._stops = array("I")  # One past the last paragraph of the question
+        self._choices = array("I")  # LABEL_CHOICES entries per question, in label order
+
+    def append(self, start: int, text: range, stop: int, choices: Sequence[int]) -> None:
+        """Record the next question.
+
+        Args:
+            start: Paragraph of its 'Question N' header
+            text: Paragraphs of its text
+            stop: One past its last paragraph
+            choices: Paragraph of each choice, in LABEL_CHOICES order
+        """
+        self._starts.append(start)
+        self._text_starts.append(text.start)
+        self._text_stops.append(text.stop)
+        self._stops.append(stop)
+        self._choices.extend(choices)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the position arrays in bytes."""
+        arrays = (self._starts, self._text_starts, self._text_stops, self._stops, self._choices)
+        return sum(len(positions) * positions.itemsize for positions in arrays)
+
+    def question(self, question_id: int) -> range:
+        """Return the paragraphs of a question, from its header through its last paragraph.
+
+        Raises:
+            KeyError: If the quiz has no question with this id
+        """
+        index = self._index(question_id)
+        return range(self._starts[index], self._stops[index])
+
+    def text(self, question_id: int) -> range:
+        """Return the paragraphs of a question's text.
+
+        Raises:
+            KeyError: If the quiz has no question with this id
+        """
+        index = self._index(question_id)
+        return range(self._text_starts[index], self._text_stops[index])
+
+    def choice(self, question_id: int, label: str) -> int:
+        """Return the paragraph of a choice.
+
+        Raises:
+            KeyError: If the quiz has no question with this id, or the label
+                is not one of LABEL_CHOICES
+        """
+        if label not in LABEL_CHOICES:
+            raise KeyError(label)
+        return self._choices[
+            self._index(question_id) * len(LABEL_CHOICES) + LABEL_CHOICES.index(label)
+        ]
+
+    def find(self, paragraph: int) -> int | None:
+        """Return the id of the question containing a paragraph, if any."""
+        index = bisect.bisect_right(self._starts, paragraph) - 1
+        if index >= 0 and paragraph < self._stops[index]:
+            return QUESTION_ID_START + index
+        return None
+
+    def _index(self, question_id: int) -> int:
+        index = question_id - QUESTION_ID_START
+        if not 0 <= index < len(self._starts):
+            raise KeyError(question_id)
+        return index
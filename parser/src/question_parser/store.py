@@ -0,0 +1,257 @@
+"""Local question bank stored in SQLite."""
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+
+from pydantic import BaseModel, ConfigDict
+
+from question_parser.loader import load_quiz
+from question_parser.models import Question, Quiz
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    content_hash TEXT NOT NULL,
+    version TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sources_content_hash ON sources (content_hash);
+
+CREATE TABLE IF NOT EXISTS questions (
+    source_id INTEGER NOT NULL REFERENCES sources (id) ON DELETE CASCADE,
+    question_id INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    choices TEXT NOT NULL,
+    PRIMARY KEY (source_id, question_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS questions_question_id ON questions (question_id);
+CREATE INDEX IF NOT EXISTS questions_text_hash ON questions (text_hash);
+"""
+
+_SELECT_QUESTIONS = """
+SELECT sources.path, questions.question_id, questions.text, questions.choices
+FROM questions JOIN sources ON sources.id = questions.source_id
+"""
+
+
+class StoredQuestion(BaseModel):
+    """A question together with the file it was imported from.
+
+    Attributes:
+        source: Resolved path of the imported file
+        question: The stored question
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    source: str
+    question: Question
+
+
+class ImportResult(BaseModel):
+    """Outcome of importing a batch of files.
+
+    Attributes:
+        imported: Files whose content changed and were (re)imported
+        unchanged: Files skipped because their content hash was already stored
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    imported: list[str]
+    unchanged: list[str]
+
+
+def content_hash(data: bytes) -> str:
+    """Return the SHA-256 hex digest identifying a file's contents."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def text_hash(text: str) -> str:
+    """Return the hash used to look up questions by text.
+
+    Whitespace runs are folded and case is ignored, so reformatted copies of
+    a question share a hash.
+    """
+    return hashlib.sha256(" ".join(text.split()).casefold().encode()).hexdigest()
+
+
+class QuestionBank:
+    """Question bank in a SQLite database, indexed by file hash, question id and text.
+
+    Use as a context manager, or call `close` when done.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """Open or create a question bank.
+
+        Args:
+            path: Database file, or ":memory:" for a temporary bank
+        """
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "QuestionBank":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def import_quiz(self, source: str | Path, quiz: Quiz, file_hash: str) -> None:
+        """Store a quiz, replacing any questions previously imported from the same source.
+
+        Args:
+            source: File the quiz was parsed from
+            quiz: The parsed quiz
+            file_hash: Content hash of the source file
+        """
+        with self._conn:
+            self._replace(_source_key(source), quiz, file_hash)
+
+    def import_files(self, paths: Iterable[str | Path]) -> ImportResult:
+        """Parse and store DOCX or quiz JSON files whose contents changed.
+
+        Files are recognised by their ".json" suffix; anything else is read as
+        DOCX. All changed files are stored in one transaction, each as soon
+        as it is parsed, so only one parsed quiz is held in memory at a time
+        and a failing file leaves the bank unchanged. Other connections can
+        keep reading while the import runs; other writers wait until it
+        commits.
+
+        Args:
+            paths: Files to import
+
+        Returns:
+            Which files were imported and which were already up to date
+
+        Raises:
+            OSError: If a file cannot be read, e.g. FileNotFoundError
+            ValueError: If a changed file is not a valid DOCX file or quiz JSON
+            ParsingError: If a changed DOCX document cannot be parsed
+        """
+        known = dict(self._conn.execute("SELECT path, content_hash FROM sources"))
+        imported: list[str] = []
+        unchanged: list[str] = []
+
+        with self._conn:
+            for path in paths:
+                key = _source_key(path)
+                data = Path(path).read_bytes()
+                file_hash = content_hash(data)
+                if known.get(key) == file_hash:
+                    unchanged.append(key)
+                    continue
+
+                self._replace(key, load_quiz(path, data), file_hash)
+                known[key] = file_hash
+                imported.append(key)
+
+        return ImportResult(imported=imported, unchanged=unchanged)
+
+    def get_question(self, source: str | Path, question_id: int) -> Question | None:
+        """Return one question of an imported file, or None if it is not stored."""
+        row = self._conn.execute(
+            _SELECT_QUESTIONS + "WHERE sources.path = ? AND questions.question_id = ?",
+            (_source_key(source), question_id),
+        ).fetchone()
+        return _to_question(row) if row else None
+
+    def questions_for_source(self, source: str | Path) -> list[Question]:
+        """Return all questions of an imported file in id order."""
+        rows = self._conn.execute(
+            _SELECT_QUESTIONS + "WHERE sources.path = ? ORDER BY questions.question_id",
+            (_source_key(source),),
+        )
+        return [_to_question(row) for row in rows]
+
+    def find_by_id(self, question_id: int) -> list[StoredQuestion]:
+        """Return the question with this id from every imported file."""
+        rows = self._conn.execute(
+            _SELECT_QUESTIONS + "WHERE questions.question_id = ? ORDER BY sources.path",
+            (question_id,),
+        )
+        return [_to_stored(row) for row in rows]
+
+    def find_by_text(self, text: str) -> list[StoredQuestion]:
+        """Return every stored question whose text matches, ignoring case and spacing."""
+        rows = self._conn.execute(
+            _SELECT_QUESTIONS
+            + "WHERE questions.text_hash = ? ORDER BY sources.path, questions.question_id",
+            (text_hash(text),),
+        )
+        return [_to_stored(row) for row in rows]
+
+    def sources_with_hash(self, file_hash: str) -> list[str]:
+        """Return the imported files whose contents have this hash."""
+        rows = self._conn.execute(
+            "SELECT path FROM sources WHERE content_hash = ? ORDER BY path", (file_hash,)
+        )
+        return [path for (path,) in rows]
+
+    def count(self) -> int:
+        """Return the number of stored questions."""
+        (total,) = self._conn.execute("SELECT COUNT(*) FROM questions").fetchone()
+        return int(total)
+
+    def _replace(self, key: str, quiz: Quiz, file_hash: str) -> None:
+        """Write a quiz for a source; must run inside a transaction."""
+        self._conn.execute("DELETE FROM sources WHERE path = ?", (key,))
+        cursor = self._conn.execute(
+            "INSERT INTO sources (path, content_hash, version) VALUES (?, ?, ?)",
+            (key, file_hash, quiz.version),
+        )
+        source_id = cursor.lastrowid
+        self._conn.executemany(
+            "INSERT INTO questions (source_id, question_id, text, text_hash, choices) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                (
+                    source_id,
+                    question.id,
+                    question.text,
+                    text_hash(question.text),
+                    json.dumps(
+                        [[choice.label, choice.text] for choice in question.choices],
+                        separators=(",", ":"),
+                    ),
+                )
+                for question in quiz.questions
+            ),
+        )
+
+
+def _source_key(source: str | Path) -> str:
+    """Return the key a source file is stored under."""
+    return str(Path(source).resolve())
+
+
+def _to_question(row: tuple[str, int, str, str]) -> Question:
+    """Build a Question from a row of _SELECT_QUESTIONS."""
+    _, question_id, text, choices = row
+    return Question.model_validate(
+        {
+            "id": question_id,
+            "text": text,
+            "choices": [{"label": label, "text": choice} for label, choice in json.loads(choices)],
+        }
+    )
+
+
+def _to_stored(row: tuple[str, int, str, str]) -> StoredQuestion:
+    """Build a StoredQuestion from a row of _SELECT_QUESTIONS."""
+    return StoredQuestion(source=row[0], question=_to_question(row))
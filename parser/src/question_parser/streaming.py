@@ -0,0 +1,168 @@
+"""Bounded-memory conversion of DOCX quizzes to JSON.
+
+Extraction, parsing and serialization run as one pipeline: paragraphs are
+streamed out of the document XML, grouped into question blocks, validated
+one question at a time and written out immediately. Nothing proportional to
+the document size is kept in memory; buffers that could grow with it (a
+non-seekable input, the validated output) spill to temporary files once
+they exceed their share of the memory budget.
+"""
+
+import shutil
+import tempfile
+from types import TracebackType
+from typing import IO
+
+from pydantic_core import to_json
+
+from question_parser import hooks
+from question_parser.defaults import QUESTION_ID_START, QUIZ_VERSION
+from question_parser.errors import ParsingError
+from question_parser.extractor import DocxExtractor, DocxSource
+from question_parser.models import Question
+from question_parser.normalize import TextNormalizer
+from question_parser.parser import QuestionParser
+
+# Memory budget for buffers in bounded conversions
+DEFAULT_MAX_MEMORY = 64 * 1024 * 1024
+
+# Characters copied at a time from the spill file to the output
+_COPY_CHUNK_SIZE = 64 * 1024
+
+
+class QuizWriter:
+    """Write a quiz as JSON one question at a time.
+
+    The output is identical to `Quiz.model_dump_json()` for the same
+    questions. Question ids are checked as they arrive to run sequentially
+    from `first_id`, so with the default first id the written JSON always
+    validates as a Quiz; with any other it does not, since a Quiz starts at
+    QUESTION_ID_START. Errors are reported to hooks before being raised. Use
+    as a context manager, or call `close` to finish the document.
+    """
+
+    def __init__(
+        self,
+        output: IO[str],
+        version: str = QUIZ_VERSION,
+        first_id: int = QUESTION_ID_START,
+    ) -> None:
+        """Start a quiz document.
+
+        Args:
+            output: Text stream to write to
+            version: Quiz format version
+            first_id: Id the first question must have; other than
+                QUESTION_ID_START, e.g. for a range of a bank, the output is
+                not a loadable Quiz
+        """
+        self.output = output
+        self.version = version
+        self.first_id = first_id
+        self.count = 0
+        self._next_id = first_id
+        self._closed = False
+        output.write('{\n  "version": ')
+        output.write(to_json(version).decode())
+        output.write(',\n  "questions": [')
+
+    def __enter__(self) -> "QuizWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+
+    def write(self, question: Question) -> None:
+        """Append a question.
+
+        Args:
+            question: The next question; its id must follow the previous one
+
+        Raises:
+            ParsingError: If the question id is out of sequence
+        """
+        if question.id != self._next_id:
+            error = ParsingError(
+                f"Question IDs must be sequential starting from {self.first_id}, "
+                f"expected {self._next_id}, got {question.id}"
+            )
+            hooks.error(error)
+            raise error
+
+        encoded = question.model_dump_json(indent=2).replace("\n", "\n    ")
+        self.output.write(",\n    " if self.count else "\n    ")
+        self.output.write(encoded)
+        self.count += 1
+        self._next_id += 1
+
+    def close(self) -> None:
+        """Finish the document.
+
+        Raises:
+            ParsingError: If no questions were written
+        """
+        if self._closed:
+            return
+        if not self.count:
+            error = ParsingError("No valid questions found")
+            hooks.error(error)
+            raise error
+        self.output.write("\n  ]\n}")
+        self._closed = True
+
+
+def convert_bounded(
+    source: DocxSource,
+    output: IO[str],
+    max_memory: int = DEFAULT_MAX_MEMORY,
+    normalizer: TextNormalizer | None = None,
+) -> int:
+    """Convert a DOCX quiz to JSON while keeping buffers within a memory budget.
+
+    Validated questions are written to a spill file that stays in memory
+    until it outgrows half the budget and then moves to disk; the other half
+    bounds how much of a non-seekable input is buffered. The output only
+    receives the JSON once the whole document has converted, so a parsing
+    error never leaves a truncated document behind.
+
+    Args:
+        source: Path to the DOCX file, its contents as bytes, or a binary file object
+        output: Text stream the JSON is written to
+        max_memory: Budget in bytes for the input and output buffers
+        normalizer: Cleans the text of every paragraph; by default it is only stripped
+
+    Returns:
+        Number of questions written
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is not a valid DOCX file or the budget is not positive
+        ParsingError: If parsing fails due to invalid format; its paragraph
+            is the source position of the question's 'Question N' paragraph
+    """
+    if max_memory <= 0:
+        raise ValueError(f"Memory budget must be positive, got {max_memory}")
+    buffer_size = max(max_memory // 2, 1)
+
+    extractor = DocxExtractor(normalizer)
+    paragraphs = extractor.iter_paragraphs_with_positions(source, spool_size=buffer_size)
+    questions = QuestionParser().iter_questions_with_positions(paragraphs)
+
+    # Extraction, parsing and the writer report their own events and errors to hooks
+    with tempfile.SpooledTemporaryFile(
+        max_size=buffer_size, mode="w+", encoding="utf-8", newline=""
+    ) as spill:
+        with QuizWriter(spill) as writer:
+            for question in questions:
+                writer.write(question)
+
+        spill.seek(0)
+        shutil.copyfileobj(spill, output, _COPY_CHUNK_SIZE)
+
+    return writer.count
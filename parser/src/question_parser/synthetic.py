@@ -0,0 +1,108 @@
+"""Generate deterministic synthetic quiz documents for benchmarks and load tests."""
+
+import io
+import random
+
+from docx import Document
+from docx.oxml import OxmlElement
+
+from question_parser.defaults import LABEL_CHOICES, QUESTION_ID_START, QUESTION_KEYWORD
+
+_WORDS = (
+    "atom",
+    "binary",
+    "capital",
+    "delta",
+    "energy",
+    "fraction",
+    "gravity",
+    "harbor",
+    "island",
+    "journal",
+    "kernel",
+    "lattice",
+    "matrix",
+    "neutron",
+    "orbit",
+    "planet",
+    "quartz",
+    "river",
+    "signal",
+    "theory",
+    "update",
+    "vector",
+    "window",
+    "yield",
+    "zenith",
+)
+
+
+def synthetic_paragraphs(num_questions: int, seed: int = 0, labeled: bool = True) -> list[str]:
+    """Build the paragraphs of a synthetic quiz.
+
+    The same arguments always produce the same paragraphs.
+
+    Args:
+        num_questions: Number of questions to generate
+        seed: Seed for the word generator
+        labeled: Whether choices carry "A. " style labels
+
+    Returns:
+        List of paragraph strings in document order
+    """
+    rng = random.Random(seed)
+    paragraphs: list[str] = []
+
+    for question_id in range(QUESTION_ID_START, num_questions + QUESTION_ID_START):
+        paragraphs.append(f"{QUESTION_KEYWORD} {question_id}")
+        words = " ".join(rng.choices(_WORDS, k=rng.randint(6, 14)))
+        paragraphs.append(f"What is the {words}?")
+        for label in LABEL_CHOICES:
+            text = " ".join(rng.choices(_WORDS, k=rng.randint(1, 5))).capitalize()
+            paragraphs.append(f"{label}. {text}" if labeled else text)
+
+    return paragraphs
+
+
+def build_docx(paragraphs: list[str]) -> bytes:
+    """Write paragraphs to an in-memory DOCX file.
+
+    Paragraphs are inserted directly before the section properties, since
+    `Document.add_paragraph` searches the body on every call and becomes
+    quadratic for large documents.
+
+    Args:
+        paragraphs: Paragraph texts in document order
+
+    Returns:
+        The DOCX file contents
+    """
+    document = Document()
+    sect_pr = document.element.body.sectPr
+
+    for text in paragraphs:
+        paragraph = OxmlElement("w:p")
+        run = OxmlElement("w:r")
+        run_text = OxmlElement("w:t")
+        run_text.text = text
+        run.append(run_text)
+        paragraph.append(run)
+        sect_pr.addprevious(paragraph)
+
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def synthetic_docx(num_questions: int, seed: int = 0, labeled: bool = True) -> bytes:
+    """Build a synthetic quiz DOCX file in memory.
+
+    Args:
+        num_questions: Number of questions to generate
+        seed: Seed for the word generator
+        labeled: Whether choices carry "A. " style labels
+
+    Returns:
+        The DOCX file contents
+    """
+    return build_docx(synthetic_paragraphs(num_questions, seed=seed, labeled=labeled))
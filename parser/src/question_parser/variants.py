@@ -0,0 +1,132 @@
+"""Seeded, reproducible randomized quiz variants.
+
+Each variant shuffles the question order and the choices of every question,
+renumbers questions from QUESTION_ID_START and relabels choices in
+LABEL_CHOICES order. Variants are written as compact JSON objects that
+validate as a Quiz, plus an answer-key mapping back to the original:
+
+    {"variant": 0, "version": "1.0", "questions": [...],
+     "key": [[7, "CADB"], ...]}
+
+Entry i of "key" describes question i of the variant: it is original question
+7, and its choices labeled A, B, C, D were originally labeled C, A, D, B.
+"""
+
+import hashlib
+import itertools
+import json
+import struct
+from collections.abc import Iterator
+from typing import IO
+
+from question_parser.defaults import LABEL_CHOICES, QUESTION_ID_START
+from question_parser.models import Quiz
+
+_PERMUTATIONS = list(itertools.permutations(range(len(LABEL_CHOICES))))
+_PERMUTATION_COUNT = len(_PERMUTATIONS)
+
+
+class VariantGenerator:
+    """Generate shuffled variants of a quiz from a seed.
+
+    All JSON fragments are encoded once up front: the text of every
+    question, and its choices in every order. Emitting a variant only draws
+    random numbers and joins strings. The random numbers for variant i come
+    from SHAKE-128 of the seed and i, so any variant can be regenerated on
+    its own, on any platform or Python version.
+    """
+
+    def __init__(self, quiz: Quiz, seed: int = 0) -> None:
+        """Precompute the encoded quiz.
+
+        Args:
+            quiz: Quiz to generate variants of
+            seed: Seed shared by all variants
+        """
+        self.seed = seed
+        self._version = json.dumps(quiz.version)
+        self._count = len(quiz.questions)
+        # One 64-bit sort key per question, then one 32-bit choice-order draw per question
+        self._random_size = 12 * self._count
+        self._unpack = struct.Struct(f"<{self._count}Q{self._count}I").unpack
+        # Every question but the first is preceded by the comma separating it
+        self._id_prefixes = [
+            f'{"," if position else ""}{{"id":{question_id},'
+            for position, question_id in enumerate(
+                range(QUESTION_ID_START, self._count + QUESTION_ID_START)
+            )
+        ]
+
+        # The encoded text of each question, once. Then for each question and
+        # each permutation: the encoded choices and the answer-key entry
+        self._texts = [
+            f'"text":{json.dumps(question.text)},"choices":[' for question in quiz.questions
+        ]
+        self._choices: list[str] = []
+        self._keys: list[str] = []
+        for question in quiz.questions:
+            choices = [json.dumps(choice.text) for choice in question.choices]
+            original_labels = [choice.label for choice in question.choices]
+            for permutation in _PERMUTATIONS:
+                encoded = ",".join(
+                    f'{{"label":"{label}","text":{choices[source]}}}'
+                    for label, source in zip(LABEL_CHOICES, permutation, strict=True)
+                )
+                self._choices.append(f"{encoded}]}}")
+                mapping = "".join(original_labels[source] for source in permutation)
+                self._keys.append(f'[{question.id},"{mapping}"]')
+
+    def variant_json(self, index: int) -> str:
+        """Return variant `index` as a compact JSON object.
+
+        Args:
+            index: Variant number; the same seed and index always give the same variant
+
+        Returns:
+            The variant, on a single line
+        """
+        draws = self._unpack(
+            hashlib.shake_128(f"{self.seed}:{index}".encode()).digest(self._random_size)
+        )
+        order = sorted(range(self._count), key=draws.__getitem__)
+        # Index into the flattened per-(question, permutation) choice and key tables
+        slots = [
+            question * _PERMUTATION_COUNT + draw % _PERMUTATION_COUNT
+            for question, draw in zip(order, draws[self._count :], strict=True)
+        ]
+
+        questions = "".join(
+            itertools.chain.from_iterable(
+                zip(
+                    self._id_prefixes,
+                    map(self._texts.__getitem__, order),
+                    map(self._choices.__getitem__, slots),
+                    strict=True,
+                )
+            )
+        )
+        key = ",".join(map(self._keys.__getitem__, slots))
+        return (
+            f'{{"variant":{index},"version":{self._version},'
+            f'"questions":[{questions}],"key":[{key}]}}'
+        )
+
+    def iter_variants(self, count: int, start: int = 0) -> Iterator[str]:
+        """Yield `count` variants as compact JSON, starting at variant `start`."""
+        for index in range(start, start + count):
+            yield self.variant_json(index)
+
+    def write_ndjson(self, output: IO[str], count: int, start: int = 0) -> None:
+        """Write variants to a text stream, one JSON object per line."""
+        for variant in self.iter_variants(count, start):
+            output.write(variant)
+            output.write("\n")
+
+    def write_json(self, output: IO[str], count: int, start: int = 0) -> None:
+        """Write variants to a text stream as one compact JSON document."""
+        output.write(f'{{"seed":{self.seed},"variants":[')
+        for position, variant in enumerate(self.iter_variants(count, start)):
+            if position:
+                output.write(",")
+            output.write(variant)
+        output.write("]}\n")
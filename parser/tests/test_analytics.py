@@ -0,0 +1,158 @@
+"""Tests for vectorized answer analytics."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from question_parser.analytics import (  # noqa: E402
+    UNANSWERED,
+    AnswerAnalytics,
+    analyze_export,
+    iter_response_chunks,
+    load_responses,
+)
+from question_parser.models import Quiz  # noqa: E402
+
+
+def export_line(answers: dict[int, str]) -> str:
+    """Build one export line in the web app's quiz state shape."""
+    return json.dumps(
+        {"answers": [{"questionId": q, "selectedLabel": label} for q, label in answers.items()]}
+    )
+
+
+@pytest.fixture
+def export_lines() -> list[str]:
+    """Answers from four respondents to a two-question quiz."""
+    return [
+        export_line({1: "A", 2: "B"}),
+        export_line({1: "A", 2: "C"}),
+        export_line({1: "B"}),
+        export_line({1: "A", 2: "B"}),
+    ]
+
+
+def test_load_responses(export_lines: list[str]) -> None:
+    """Test that answers become label codes, with unanswered questions marked."""
+    responses = load_responses(export_lines, num_questions=2)
+
+    assert responses.dtype == np.int8
+    assert responses.tolist() == [[0, 1], [0, 2], [1, UNANSWERED], [0, 1]]
+
+
+def test_load_responses_drops_unknown_answers() -> None:
+    """Test that unknown question ids and labels are ignored."""
+    lines = [export_line({1: "Z", 2: "D", 7: "A"}), "", json.dumps({"answers": []})]
+
+    assert load_responses(lines, num_questions=2).tolist() == [[UNANSWERED, 3], [-1, -1]]
+
+
+def test_load_responses_drops_malformed_answers() -> None:
+    """Test that null labels, non-integer ids and missing fields are dropped."""
+    lines = [
+        json.dumps(
+            {
+                "answers": [
+                    {"questionId": 1, "selectedLabel": None},
+                    {"questionId": "2", "selectedLabel": "A"},
+                    {"questionId": True, "selectedLabel": "A"},
+                    {"questionId": 10**30, "selectedLabel": "A"},
+                    {"selectedLabel": "C"},
+                    {"questionId": 2, "selectedLabel": "D"},
+                ]
+            }
+        )
+    ]
+
+    assert load_responses(lines, 2).tolist() == [[UNANSWERED, 3]]
+
+
+def test_load_responses_skips_malformed_lines(tmp_path: Path) -> None:
+    """Test that lines that are not answer records are skipped instead of failing."""
+    export = tmp_path / "answers.ndjson"
+    lines = [
+        export_line({1: "A"}),
+        '{"answers": [{"questionId": 1',
+        "[1, 2]",
+        '"answers"',
+        json.dumps({"answers": {"questionId": 1}}),
+        json.dumps({"answers": [None, 5, {"questionId": 2, "selectedLabel": "B"}]}),
+    ]
+    export.write_text("\n".join(lines) + "\n")
+
+    assert load_responses(export, num_questions=2).tolist() == [[0, UNANSWERED], [UNANSWERED, 1]]
+
+
+def test_load_responses_from_file(tmp_path: Path, export_lines: list[str]) -> None:
+    """Test loading an NDJSON export from disk."""
+    export = tmp_path / "answers.ndjson"
+    export.write_text("\n".join(export_lines) + "\n")
+
+    assert load_responses(export, num_questions=2).shape == (4, 2)
+
+
+def test_iter_response_chunks_bounded(export_lines: list[str]) -> None:
+    """Test that streaming yields chunks no larger than the chunk size."""
+    chunks = list(iter_response_chunks(export_lines, num_questions=2, chunk_size=3))
+
+    assert [chunk.shape[0] for chunk in chunks] == [3, 1]
+
+
+def test_choice_distribution(valid_quiz: Quiz, export_lines: list[str]) -> None:
+    """Test per-question label counts, shares and response counts."""
+    analytics = analyze_export(export_lines, valid_quiz)
+
+    assert analytics.respondents == 4
+    assert analytics.response_counts().tolist() == [4, 3]
+    assert analytics.choice_counts.tolist() == [[3, 1, 0, 0], [0, 2, 1, 0]]
+    np.testing.assert_allclose(analytics.choice_distribution()[0], [0.75, 0.25, 0, 0])
+
+
+def test_streaming_matches_single_pass(valid_quiz: Quiz, export_lines: list[str]) -> None:
+    """Test that chunked accumulation gives the same results as one matrix."""
+    key = {1: "A", 2: "B"}
+    streamed = analyze_export(export_lines, valid_quiz, answer_key=key, chunk_size=1)
+    whole = AnswerAnalytics(valid_quiz, answer_key=key)
+    whole.add(load_responses(export_lines, num_questions=2))
+
+    np.testing.assert_array_equal(streamed.choice_counts, whole.choice_counts)
+    np.testing.assert_allclose(streamed.discrimination(), whole.discrimination())
+
+
+def test_discrimination_matches_item_rest_correlation(valid_quiz: Quiz) -> None:
+    """Test discrimination against a direct correlation of item and rest scores."""
+    rng = np.random.default_rng(0)
+    responses = rng.integers(-1, 4, size=(200, 2)).astype(np.int8)
+    key = {1: "A", 2: "C"}
+    analytics = AnswerAnalytics(valid_quiz, answer_key=key)
+    analytics.add(responses)
+
+    correct = (responses == np.array([0, 2])).astype(float)
+    rest = correct.sum(axis=1)[:, None] - correct
+    expected = [np.corrcoef(correct[:, i], rest[:, i])[0, 1] for i in range(2)]
+
+    np.testing.assert_allclose(analytics.discrimination(), expected)
+    np.testing.assert_allclose(analytics.difficulty(), correct.mean(axis=0))
+
+
+def test_discrimination_requires_key(valid_quiz: Quiz) -> None:
+    """Test that key-based statistics fail clearly without an answer key."""
+    with pytest.raises(ValueError, match="answer key is required"):
+        AnswerAnalytics(valid_quiz).discrimination()
+
+
+def test_invalid_answer_key(valid_quiz: Quiz) -> None:
+    """Test that answer keys are checked against the quiz."""
+    with pytest.raises(ValueError, match="unknown question 9"):
+        AnswerAnalytics(valid_quiz, answer_key={9: "A"})
+    with pytest.raises(ValueError, match="invalid label 'E'"):
+        AnswerAnalytics(valid_quiz, answer_key={1: "E"})
+
+
+def test_add_wrong_shape(valid_quiz: Quiz) -> None:
+    """Test that response matrices must match the quiz."""
+    with pytest.raises(ValueError, match="Expected responses with 2 columns"):
+        AnswerAnalytics(valid_quiz).add(np.zeros((3, 5), dtype=np.int8))
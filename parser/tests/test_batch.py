@@ -0,0 +1,93 @@
+"""Tests for parallel batch conversion."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from question_parser import batch
+from question_parser.batch import convert_batch
+from question_parser.extractor import DocxExtractor
+from question_parser.parser import QuestionParser
+from question_parser.synthetic import synthetic_docx
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def documents(tmp_path: Path) -> list[Path]:
+    """Write synthetic documents of different sizes."""
+    paths = []
+    for index in range(6):
+        path = tmp_path / f"quiz-{index}.docx"
+        path.write_bytes(synthetic_docx(5 + index * 7, seed=index))
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_convert_batch_matches_sequential(documents: list[Path], mode: batch.BatchMode) -> None:
+    """Test that both pool modes give the sequential results, in input order."""
+    results = convert_batch(documents, mode=mode, workers=3)
+
+    parser = QuestionParser()
+    extractor = DocxExtractor()
+    assert [result.source for result in results] == [str(path) for path in documents]
+    assert [result.quiz for result in results] == [
+        parser.parse(extractor.extract(path)) for path in documents
+    ]
+    assert all(result.ok for result in results)
+
+
+def test_convert_batch_shares_instances_between_threads(documents: list[Path]) -> None:
+    """Test that many threads sharing one extractor and parser agree with each other."""
+    results = convert_batch(documents * 10, mode="thread", workers=16)
+
+    for index, result in enumerate(results):
+        assert result.quiz == results[index % len(documents)].quiz
+
+
+def test_convert_batch_reports_failures(tmp_path: Path) -> None:
+    """Test that bad documents are reported without stopping the batch."""
+    invalid = tmp_path / "invalid.docx"
+    invalid.write_text("not a zip")
+    sources = [
+        FIXTURES_DIR / "valid_quiz.docx",
+        tmp_path / "missing.docx",
+        invalid,
+        FIXTURES_DIR / "unlabeled_quiz.docx",
+    ]
+
+    results = convert_batch(sources, mode="thread")
+
+    assert results[0].ok
+    assert "File not found" in (results[1].error or "")
+    assert "Invalid DOCX file" in (results[2].error or "")
+    assert results[3].ok
+    assert results[1].quiz is None
+
+
+def test_convert_batch_auto_mode(monkeypatch: pytest.MonkeyPatch, documents: list[Path]) -> None:
+    """Test that auto mode uses threads only without a GIL."""
+    used: list[str] = []
+
+    class RecordingPool(ThreadPoolExecutor):
+        def __init__(self, max_workers: int) -> None:
+            used.append(type(self).__name__)
+            super().__init__(max_workers)
+
+    monkeypatch.setattr(batch, "ThreadPoolExecutor", type("Thread", (RecordingPool,), {}))
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", type("Process", (RecordingPool,), {}))
+
+    for gil in (True, False):
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda gil=gil: gil, raising=False)
+        assert all(result.ok for result in convert_batch(documents, workers=2))
+
+    assert used == ["Process", "Thread"]
+
+
+def test_convert_batch_rejects_non_positive_workers(documents: list[Path]) -> None:
+    """Test that the number of workers must be positive."""
+    with pytest.raises(ValueError, match="must be positive"):
+        convert_batch(documents, workers=0)
@@ -0,0 +1,77 @@
+"""Tests for the benchmark runner and regression gate."""
+
+import pytest
+
+from question_parser.benchmark import (
+    BenchmarkResult,
+    Corpus,
+    Metric,
+    find_regressions,
+    run_benchmark,
+)
+
+
+def make_result(qps: float, peak: float, questions: int = 10) -> BenchmarkResult:
+    """Build a result with a throughput and a memory metric."""
+    return BenchmarkResult(
+        corpus=Corpus(questions=questions, seed=0, size_bytes=1000),
+        metrics={
+            "convert.questions_per_second": Metric(
+                value=qps, unit="questions/s", higher_is_better=True
+            ),
+            "convert.peak_memory_bytes": Metric(value=peak, unit="bytes", higher_is_better=False),
+        },
+    )
+
+
+def test_run_benchmark_metrics() -> None:
+    """Test that a run records throughput and peak memory for its corpus."""
+    result = run_benchmark(num_questions=10, repeat=1)
+
+    assert result.corpus.questions == 10
+    assert result.corpus.size_bytes > 0
+    assert result.metrics["convert.questions_per_second"].value > 0
+    assert result.metrics["convert.megabytes_per_second"].value > 0
+    assert result.metrics["convert.peak_memory_bytes"].value > 0
+    assert result.metrics["parse.questions_per_second"].value > 0
+    assert result.metrics["check.questions_per_second"].value > 0
+    assert result.metrics["extract.paragraphs_per_second"].value > 0
+    assert result.metrics["extract_normalized.paragraphs_per_second"].value > 0
+    assert result.metrics["parse_bulk.questions_per_second"].value > 0
+    assert result.metrics["batch_thread.questions_per_second"].value > 0
+    assert result.metrics["batch_process.questions_per_second"].value > 0
+
+
+def test_find_regressions_within_threshold() -> None:
+    """Test that changes within the threshold pass the gate."""
+    baseline = make_result(qps=1000, peak=100)
+    current = make_result(qps=950, peak=105)
+
+    assert find_regressions(baseline, current, threshold=0.1) == []
+
+
+def test_find_regressions_throughput_drop() -> None:
+    """Test that a throughput drop beyond the threshold is reported."""
+    baseline = make_result(qps=1000, peak=100)
+    current = make_result(qps=700, peak=100)
+
+    regressions = find_regressions(baseline, current, threshold=0.1)
+
+    assert [r.metric for r in regressions] == ["convert.questions_per_second"]
+    assert regressions[0].change == pytest.approx(-0.3)
+
+
+def test_find_regressions_memory_growth() -> None:
+    """Test that lower-is-better metrics regress when they grow."""
+    baseline = make_result(qps=1000, peak=100)
+    current = make_result(qps=2000, peak=150)
+
+    regressions = find_regressions(baseline, current, threshold=0.1)
+
+    assert [r.metric for r in regressions] == ["convert.peak_memory_bytes"]
+
+
+def test_find_regressions_corpus_mismatch() -> None:
+    """Test that runs on different corpora cannot be compared."""
+    with pytest.raises(ValueError, match="Corpus mismatch"):
+        find_regressions(make_result(1000, 100, questions=10), make_result(1000, 100, questions=20))
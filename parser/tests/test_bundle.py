@@ -0,0 +1,68 @@
+"""Tests for content-hashed quiz bundles."""
+
+import gzip
+import hashlib
+import json
+import stat
+from pathlib import Path
+
+import pytest
+
+from question_parser import bundle
+from question_parser.bundle import MANIFEST_NAME, BundleManifest, write_bundle
+from question_parser.models import Quiz
+
+
+def test_write_bundle(valid_quiz: Quiz, tmp_path: Path) -> None:
+    """Test that the quiz, its gzip sibling and the manifest are written."""
+    json_text = valid_quiz.model_dump_json()
+    digest = hashlib.sha256(json_text.encode()).hexdigest()
+
+    manifest = write_bundle(json_text, tmp_path / "dist")
+
+    quiz_file = tmp_path / "dist" / manifest.file
+    assert manifest.file == f"quiz.{digest[:16]}.json"
+    assert manifest.sha256 == digest
+    assert manifest.size == len(json_text.encode())
+    assert "gzip" in manifest.encodings
+    assert quiz_file.read_text() == json_text
+    assert gzip.decompress(Path(f"{quiz_file}.gz").read_bytes()).decode() == json_text
+    stored = BundleManifest.model_validate_json((tmp_path / "dist" / MANIFEST_NAME).read_text())
+    assert stored == manifest
+    assert stat.S_IMODE(quiz_file.stat().st_mode) == 0o644
+
+
+def test_write_bundle_is_deterministic(valid_quiz: Quiz, tmp_path: Path) -> None:
+    """Test that the same quiz always produces byte-identical files."""
+    json_text = valid_quiz.model_dump_json()
+    first = write_bundle(json_text, tmp_path / "a")
+    second = write_bundle(json_text, tmp_path / "b")
+
+    assert first == second
+    for suffix in ("", ".gz"):
+        assert (tmp_path / "a" / f"{first.file}{suffix}").read_bytes() == (
+            tmp_path / "b" / f"{second.file}{suffix}"
+        ).read_bytes()
+
+
+def test_write_bundle_keeps_previous_files(valid_quiz: Quiz, tmp_path: Path) -> None:
+    """Test that a new bundle repoints the manifest but leaves old files for cached clients."""
+    old = write_bundle(valid_quiz.model_dump_json(), tmp_path)
+    new_quiz = Quiz(questions=valid_quiz.questions[:1])
+    new = write_bundle(new_quiz.model_dump_json(), tmp_path)
+
+    assert old.file != new.file
+    assert (tmp_path / old.file).exists()
+    assert json.loads((tmp_path / MANIFEST_NAME).read_text())["file"] == new.file
+
+
+def test_write_bundle_without_brotli(
+    valid_quiz: Quiz, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that only gzip is written when brotli is not installed."""
+    monkeypatch.setattr(bundle, "brotli", None)
+
+    manifest = write_bundle(valid_quiz.model_dump_json(), tmp_path)
+
+    assert manifest.encodings == ["gzip"]
+    assert not (tmp_path / f"{manifest.file}.br").exists()
@@ -1,10 +1,13 @@
 """Tests for the CLI."""
 
+import json
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from question_parser.cli import main
+from question_parser.synthetic import build_docx, synthetic_docx
 
 
 def test_cli_valid_file(tmp_path: Path) -> None:
@@ -54,6 +57,23 @@ def test_cli_empty_document(tmp_path: Path) -> None:
     assert "Error:" in result.output
 
 
+@pytest.mark.parametrize("options", [[], ["--max-memory", "64K"], ["merge", "-o", "out.json"]])
+def test_cli_validation_error(tmp_path: Path, options: list[str]) -> None:
+    """Test that a question failing model validation is reported as a parsing error."""
+    input_file = tmp_path / "quiz.docx"
+    input_file.write_bytes(build_docx(["Question 0", "Text", "A. 1", "B. 2", "C. 3", "D. 4"]))
+    if options[:1] == ["merge"]:
+        args = [*options[:2], str(tmp_path / options[2]), str(input_file)]
+    else:
+        args = [str(input_file), *options]
+
+    result = CliRunner().invoke(main, args)
+
+    assert result.exit_code == 1
+    assert "Question 0: Question ID must be positive" in result.output
+    assert "Unexpected error" not in result.output
+
+
 def test_cli_unlabeled_choices() -> None:
     """Test CLI with unlabeled choices (like CLD assessment format)."""
     runner = CliRunner()
@@ -65,3 +85,305 @@ def test_cli_unlabeled_choices() -> None:
     assert "What color is the sky?" in result.output
     assert '"label": "A"' in result.output
     assert '"text": "Blue"' in result.output
+
+
+def test_cli_memory_report(tmp_path: Path) -> None:
+    """Test CLI writes a per-stage memory report when requested."""
+    runner = CliRunner()
+    input_file = Path("tests/fixtures/valid_quiz.docx")
+    report_file = tmp_path / "memory.json"
+
+    result = runner.invoke(main, [str(input_file), "--memory-report", str(report_file)])
+
+    assert result.exit_code == 0
+    assert "What is the capital of France?" in result.output
+    report = json.loads(report_file.read_text())
+    assert [s["name"] for s in report["stages"]] == ["load", "paragraphs", "models", "serialize"]
+
+
+def test_cli_max_memory_matches_default(tmp_path: Path) -> None:
+    """Test that bounded-memory mode writes the same JSON, from a file or stdin."""
+    runner = CliRunner()
+    input_file = Path("tests/fixtures/valid_quiz.docx")
+    output_file = tmp_path / "quiz.json"
+
+    default = runner.invoke(main, [str(input_file)])
+    to_file = runner.invoke(main, [str(input_file), "--max-memory", "64K", "-o", str(output_file)])
+    from_stdin = runner.invoke(main, ["-", "--max-memory", "1M"], input=input_file.read_bytes())
+
+    assert to_file.exit_code == 0
+    assert from_stdin.exit_code == 0
+    assert output_file.read_text() + "\n" == default.output
+    assert from_stdin.output == default.output
+
+
+def test_cli_max_memory_invalid(tmp_path: Path) -> None:
+    """Test that bad sizes and conflicting options are usage errors."""
+    runner = CliRunner()
+    input_file = "tests/fixtures/valid_quiz.docx"
+
+    bad_size = runner.invoke(main, [input_file, "--max-memory", "lots"])
+    with_report = runner.invoke(
+        main, [input_file, "--max-memory", "1M", "--memory-report", str(tmp_path / "r.json")]
+    )
+
+    assert bad_size.exit_code == 2
+    assert "is not a size" in bad_size.output
+    assert with_report.exit_code == 2
+    assert "cannot be combined" in with_report.output
+
+
+def test_cli_check(tmp_path: Path) -> None:
+    """Test that --check reports problems without writing JSON."""
+    runner = CliRunner()
+    invalid_file = tmp_path / "invalid.docx"
+    invalid_file.write_text("Not a valid DOCX file")
+
+    valid = runner.invoke(main, ["tests/fixtures/valid_quiz.docx", "--check"])
+    invalid = runner.invoke(main, [str(invalid_file), "--check"])
+    conflicting = runner.invoke(
+        main, ["tests/fixtures/valid_quiz.docx", "--check", "-o", str(tmp_path / "q.json")]
+    )
+
+    assert valid.exit_code == 0
+    assert valid.output == "tests/fixtures/valid_quiz.docx: OK, 2 questions\n"
+    assert invalid.exit_code == 1
+    assert "Invalid DOCX file" in invalid.output
+    assert conflicting.exit_code == 2
+
+
+def test_cli_bundle(tmp_path: Path) -> None:
+    """Test that --bundle writes a manifest pointing at the hashed quiz file."""
+    runner = CliRunner()
+    bundle_dir = tmp_path / "public"
+
+    result = runner.invoke(main, ["tests/fixtures/valid_quiz.docx", "--bundle", str(bundle_dir)])
+
+    assert result.exit_code == 0
+    manifest = json.loads((bundle_dir / "quiz-manifest.json").read_text())
+    quiz = json.loads((bundle_dir / manifest["file"]).read_text())
+    assert quiz["questions"][0]["text"] == "What is the capital of France?"
+
+
+def test_cli_normalize(tmp_path: Path) -> None:
+    """Test that --normalize lets headers with invisible characters parse."""
+    runner = CliRunner()
+    input_file = tmp_path / "quiz.docx"
+    input_file.write_bytes(
+        build_docx(["Question\u200b 1", "Text", "A. One", "B. Two", "C. Three", "D. Four"])
+    )
+
+    plain = runner.invoke(main, [str(input_file)])
+    normalized = runner.invoke(main, [str(input_file), "--normalize"])
+    checked = runner.invoke(main, [str(input_file), "--normalize", "--check"])
+
+    assert plain.exit_code == 1
+    assert normalized.exit_code == 0
+    assert json.loads(normalized.output)["questions"][0]["id"] == 1
+    assert checked.exit_code == 0
+
+
+def test_cli_bench_records_then_gates(tmp_path: Path) -> None:
+    """Test that bench writes a baseline first and compares against it afterwards."""
+    runner = CliRunner()
+    baseline = tmp_path / "baseline.json"
+    args = ["bench", str(baseline), "--questions", "5", "--repeat", "1"]
+
+    first = runner.invoke(main, args)
+    assert first.exit_code == 0
+    assert json.loads(baseline.read_text())["corpus"]["questions"] == 5
+
+    second = runner.invoke(main, [*args, "--threshold", "1000"])
+    assert second.exit_code == 0
+    assert "Regression" not in second.output
+
+
+def test_cli_bench_fails_on_regression(tmp_path: Path) -> None:
+    """Test that bench exits non-zero when the baseline is out of reach."""
+    runner = CliRunner()
+    baseline = tmp_path / "baseline.json"
+    runner.invoke(main, ["bench", str(baseline), "--questions", "5", "--repeat", "1"])
+
+    data = json.loads(baseline.read_text())
+    data["metrics"]["convert.questions_per_second"]["value"] *= 1000
+    baseline.write_text(json.dumps(data))
+
+    result = runner.invoke(main, ["bench", str(baseline), "--repeat", "1"])
+
+    assert result.exit_code == 1
+    assert "Regression: convert.questions_per_second" in result.output
+
+
+def test_cli_reads_stdin() -> None:
+    """Test CLI reads DOCX bytes from stdin when the input is -."""
+    runner = CliRunner()
+    data = Path("tests/fixtures/valid_quiz.docx").read_bytes()
+
+    result = runner.invoke(main, ["-"], input=data)
+
+    assert result.exit_code == 0
+    assert "What is the capital of France?" in result.output
+
+
+def test_cli_invalid_stdin() -> None:
+    """Test CLI reports stdin contents that are not a DOCX file."""
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["-"], input=b"not a docx")
+
+    assert result.exit_code == 1
+    assert "Invalid DOCX file" in result.output
+
+
+def test_cli_variants(tmp_path: Path) -> None:
+    """Test CLI writes seeded variants as NDJSON."""
+    runner = CliRunner()
+    input_file = Path("tests/fixtures/valid_quiz.docx")
+    output_file = tmp_path / "variants.ndjson"
+
+    result = runner.invoke(
+        main, ["variants", str(input_file), "-n", "3", "--seed", "4", "-o", str(output_file)]
+    )
+
+    assert result.exit_code == 0
+    lines = output_file.read_text().splitlines()
+    assert len(lines) == 3
+    assert {q["text"] for q in json.loads(lines[0])["questions"]} == {
+        "What is the capital of France?",
+        "What is 2 + 2?",
+    }
+
+
+def test_cli_variants_invalid_input() -> None:
+    """Test CLI variants fails gracefully on a document without questions."""
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["variants", "tests/fixtures/with_empty_paragraphs.docx"])
+
+    assert result.exit_code == 1
+    assert "Error:" in result.output
+
+
+def test_cli_loadtest(tmp_path: Path) -> None:
+    """Test that loadtest prints a summary and writes the JSON report."""
+    runner = CliRunner()
+    report_path = tmp_path / "report.json"
+
+    result = runner.invoke(
+        main,
+        [
+            "loadtest",
+            "--target",
+            "http",
+            "-n",
+            "4",
+            "-c",
+            "2",
+            "--size",
+            "2",
+            "-o",
+            str(report_path),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "p95" in result.output
+    report = json.loads(report_path.read_text())
+    assert report["requests"] == 4
+    assert report["errors"] == 0
+
+
+def test_cli_loadtest_url_requires_http_target() -> None:
+    """Test that --url is rejected for the in-process target."""
+    result = CliRunner().invoke(main, ["loadtest", "--url", "http://127.0.0.1:1/parse"])
+
+    assert result.exit_code == 2
+    assert "--target http" in result.output
+
+
+def test_cli_merge(tmp_path: Path) -> None:
+    """Test that merge writes the renumbered bank and its provenance."""
+    runner = CliRunner()
+    first = tmp_path / "first.docx"
+    second = tmp_path / "second.docx"
+    first.write_bytes(synthetic_docx(2))
+    second.write_bytes(synthetic_docx(3, seed=1))
+    output = tmp_path / "bank.json"
+
+    result = runner.invoke(main, ["merge", str(first), str(second), "-o", str(output), "-j", "2"])
+
+    assert result.exit_code == 0
+    assert [q["id"] for q in json.loads(output.read_text())["questions"]] == [1, 2, 3, 4, 5]
+    provenance = json.loads((tmp_path / "bank.provenance.json").read_text())
+    assert [source["first_id"] for source in provenance["sources"]] == [1, 3]
+
+
+def test_cli_merge_leaves_no_partial_output(tmp_path: Path) -> None:
+    """Test that a failed merge writes neither the bank nor a partial file."""
+    runner = CliRunner()
+    good = tmp_path / "good.docx"
+    bad = tmp_path / "bad.docx"
+    good.write_bytes(synthetic_docx(2))
+    bad.write_bytes(build_docx(["Question 1", "Text", "A. One"]))
+    output = tmp_path / "bank.json"
+
+    result = runner.invoke(main, ["merge", str(good), str(bad), "-o", str(output)])
+
+    assert result.exit_code == 1
+    assert "bad.docx: Question 1 has 1 choices" in result.output
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["bad.docx", "good.docx"]
+
+
+def test_cli_questions_range(tmp_path: Path) -> None:
+    """Test that --questions writes only the range, keeping its ids."""
+    runner = CliRunner()
+    input_file = tmp_path / "quiz.docx"
+    input_file.write_bytes(synthetic_docx(10))
+    cache = tmp_path / "index"
+
+    results = [
+        runner.invoke(main, [str(input_file), "--questions", "4-6"]),
+        runner.invoke(main, [str(input_file), "--questions", "4-6", "--index-cache", str(cache)]),
+        runner.invoke(main, [str(input_file), "--questions", "9"]),
+    ]
+
+    assert [result.exit_code for result in results] == [0, 0, 0]
+    assert [q["id"] for q in json.loads(results[0].output)["questions"]] == [4, 5, 6]
+    assert results[1].output == results[0].output
+    assert len(list(cache.iterdir())) == 1
+    assert [q["id"] for q in json.loads(results[2].output)["questions"]] == [9]
+
+
+def test_cli_questions_range_errors(tmp_path: Path) -> None:
+    """Test that bad ranges and options are rejected."""
+    runner = CliRunner()
+    input_file = tmp_path / "quiz.docx"
+    input_file.write_bytes(synthetic_docx(3))
+
+    bad_range = runner.invoke(main, [str(input_file), "--questions", "5-2"])
+    not_found = runner.invoke(main, [str(input_file), "--questions", "4-5"])
+    no_range = runner.invoke(main, [str(input_file), "--index-cache", str(tmp_path)])
+
+    assert bad_range.exit_code == 2
+    assert not_found.exit_code == 1
+    assert "Question 4 not found" in not_found.output
+    assert no_range.exit_code == 2
+
+
+@pytest.mark.parametrize(
+    "options",
+    [[], ["--check"], ["--max-memory", "64K"], ["--questions", "1-1"], ["merge", "-o", "out.json"]],
+)
+def test_cli_error_names_paragraph(tmp_path: Path, options: list[str]) -> None:
+    """Test that parsing errors name the document paragraph they occurred at."""
+    input_file = tmp_path / "quiz.docx"
+    input_file.write_bytes(build_docx(["Title", "", "Question 1", "Text", "A. One", "B. Two"]))
+    if options[:1] == ["merge"]:
+        args = [*options[:2], str(tmp_path / options[2]), str(input_file)]
+    else:
+        args = [str(input_file), *options]
+
+    result = CliRunner().invoke(main, args)
+
+    assert result.exit_code == 1
+    assert "(paragraph 3)" in result.output
@@ -0,0 +1,153 @@
+"""Tests for the structural quiz diff."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from question_parser.cli import main
+from question_parser.diff import diff_quizzes, format_diff
+from question_parser.models import Choice, Question, Quiz
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _question(question_id: int, text: str, choices: str = "ABCD") -> Question:
+    """Build a question whose choice texts are derived from `choices`."""
+    return Question(
+        id=question_id,
+        text=text,
+        choices=[
+            Choice(label=label, text=f"Choice {value}")  # type: ignore[arg-type]
+            for label, value in zip("ABCD", choices, strict=True)
+        ],
+    )
+
+
+def _quiz(*questions: tuple[str, str]) -> Quiz:
+    """Build a quiz from (text, choices) pairs, numbered in order."""
+    return Quiz(
+        questions=[_question(i, text, choices) for i, (text, choices) in enumerate(questions, 1)]
+    )
+
+
+def test_identical_quizzes_have_no_changes(valid_quiz: Quiz) -> None:
+    """Test that a quiz compared with itself reports nothing."""
+    diff = diff_quizzes(valid_quiz, valid_quiz)
+
+    assert not diff.has_changes
+    assert diff.unchanged == 2
+
+
+def test_insertion_renumbers_without_moves() -> None:
+    """Test that inserting a question is one addition, not a move of every later one."""
+    old = _quiz(("One", "ABCD"), ("Two", "ABCD"), ("Three", "ABCD"))
+    new = _quiz(("New", "ABCD"), ("One", "ABCD"), ("Two", "ABCD"), ("Three", "ABCD"))
+
+    diff = diff_quizzes(old, new)
+
+    assert [q.text for q in diff.added] == ["New"]
+    assert diff.moved == []
+    assert diff.removed == []
+    assert diff.unchanged == 3
+
+
+def test_reordered_question_is_moved() -> None:
+    """Test that a question moved to another position is reported as moved."""
+    old = _quiz(("One", "ABCD"), ("Two", "ABCD"), ("Three", "ABCD"), ("Four", "ABCD"))
+    new = _quiz(("Two", "ABCD"), ("Three", "ABCD"), ("Four", "ABCD"), ("One", "ABCD"))
+
+    diff = diff_quizzes(old, new)
+
+    assert [(m.old_id, m.new_id) for m in diff.moved] == [(1, 4)]
+    assert diff.unchanged == 3
+
+
+def test_edits_are_aligned_by_text_then_choices() -> None:
+    """Test that text and choice edits are matched even when renumbered."""
+    old = _quiz(("Keep", "ABCD"), ("Same text", "ABCD"), ("Old text", "EFGH"))
+    new = _quiz(("New text", "EFGH"), ("Keep", "ABCD"), ("Same text", "ABXD"))
+
+    diff = diff_quizzes(old, new)
+
+    edits = {(e.old_id, e.new_id): e for e in diff.edited}
+    text_edit = edits[(3, 1)]
+    assert text_edit.text is not None
+    assert (text_edit.text.old, text_edit.text.new) == ("Old text", "New text")
+    assert text_edit.choices == []
+    choice_edit = edits[(2, 3)]
+    assert choice_edit.text is None
+    assert [(c.label, c.old, c.new) for c in choice_edit.choices] == [("C", "Choice C", "Choice X")]
+    assert diff.added == diff.removed == []
+
+
+def test_rewritten_question_matches_by_id() -> None:
+    """Test that a question with edited text and choices is an edit at the same id."""
+    old = _quiz(("Keep", "ABCD"), ("What is the capital of France?", "ABCD"))
+    new = _quiz(("Keep", "ABCD"), ("What is the capital city of France?", "WXYZ"))
+
+    diff = diff_quizzes(old, new)
+
+    assert not diff.added and not diff.removed
+    assert len(diff.edited) == 1
+    assert diff.edited[0].text is not None
+    assert len(diff.edited[0].choices) == 4
+
+
+def test_replaced_question_is_removed_and_added() -> None:
+    """Test that an unrelated question taking a deleted question's id is not an edit."""
+    old = _quiz(("Keep", "ABCD"), ("What is the capital of France?", "ABCD"))
+    new = _quiz(("Keep", "ABCD"), ("How many legs does a spider have?", "AWXY"))
+
+    diff = diff_quizzes(old, new)
+
+    assert not diff.edited
+    assert [question.id for question in diff.removed] == [2]
+    assert [question.id for question in diff.added] == [2]
+
+
+def test_unrelated_question_with_same_choices_is_not_an_edit() -> None:
+    """Test that sharing choices does not pair questions whose texts are unrelated."""
+    old = _quiz(("Keep", "ABCD"), ("What is the capital of France?", "EFGH"))
+    moved = _quiz(("How many legs does a spider have?", "EFGH"), ("Keep", "ABCD"))
+    same_id = _quiz(("Keep", "ABCD"), ("How many legs does a spider have?", "EFGX"))
+
+    for new in (moved, same_id):
+        diff = diff_quizzes(old, new)
+
+        assert not diff.edited
+        assert [question.text for question in diff.removed] == ["What is the capital of France?"]
+        assert [question.text for question in diff.added] == ["How many legs does a spider have?"]
+
+
+def test_format_diff() -> None:
+    """Test the compact text rendering."""
+    old = _quiz(("One", "ABCD"), ("Gone", "EFGH"))
+    new = _quiz(("One", "ABCX"), ("Fresh", "IJKL"), ("Added", "MNOP"))
+
+    text = format_diff(diff_quizzes(old, new))
+
+    assert "~ Question 1: choice D\n    - Choice D\n    + Choice X" in text
+    assert "- Question 2: Gone" in text
+    assert text.splitlines()[-1] == "2 added, 1 removed, 0 moved, 1 edited, 0 unchanged"
+
+
+def test_cli_diff(tmp_path: Path) -> None:
+    """Test the diff command on DOCX and JSON, with diff-style exit codes."""
+    runner = CliRunner()
+    docx = FIXTURES_DIR / "valid_quiz.docx"
+    same = runner.invoke(main, ["parse", str(docx)])
+    old_json = tmp_path / "old.json"
+    old_json.write_text(same.output)
+    data = json.loads(same.output)
+    data["questions"][1]["text"] = "What is 3 + 1?"
+    new_json = tmp_path / "new.json"
+    new_json.write_text(json.dumps(data))
+
+    unchanged = runner.invoke(main, ["diff", str(docx), str(old_json)])
+    changed = runner.invoke(main, ["diff", str(docx), str(new_json), "--format", "json"])
+
+    assert unchanged.exit_code == 0
+    assert unchanged.output.strip() == "0 added, 0 removed, 0 moved, 0 edited, 2 unchanged"
+    assert changed.exit_code == 1
+    assert json.loads(changed.output)["edited"][0]["text"]["new"] == "What is 3 + 1?"
@@ -1,14 +1,37 @@
 """Tests for the DocxExtractor."""
 
+import io
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
+from docx import Document
+from docx.enum.text import WD_BREAK
+from docx.oxml import OxmlElement
 
-from question_parser.extractor import DocxExtractor
+from question_parser.extractor import DocxExtractor, DocxSource
+from question_parser.normalize import TextNormalizer
+from question_parser.synthetic import build_docx
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+class Pipe(io.RawIOBase):
+    """Readable stream that cannot seek, like stdin."""
+
+    def __init__(self, data: bytes) -> None:
+        self._buffer = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def readinto(self, b: bytearray) -> int:  # type: ignore[override]
+        return self._buffer.readinto(b)
+
+
 def test_extract_valid_quiz() -> None:
     """Test extracting paragraphs from a valid quiz DOCX."""
     extractor = DocxExtractor()
@@ -73,3 +96,183 @@ def test_extract_sample_document() -> None:
             marker = " [LABELED CHOICE]"
         print(f"{i:3d}: {paragraphs[i]}{marker}")
     print("=" * 80 + "\n")
+
+
+def test_load_and_paragraphs_match_extract() -> None:
+    """Test that the two extraction steps give the same result as extract."""
+    extractor = DocxExtractor()
+    document = extractor.load(FIXTURES_DIR / "valid_quiz.docx")
+
+    assert extractor.paragraphs(document) == extractor.extract(FIXTURES_DIR / "valid_quiz.docx")
+
+
+@pytest.mark.parametrize(
+    "open_source",
+    [
+        lambda data: FIXTURES_DIR / "valid_quiz.docx",
+        lambda data: data,
+        lambda data: io.BytesIO(data),
+        lambda data: io.BufferedReader(Pipe(data)),
+    ],
+    ids=["path", "bytes", "file", "pipe"],
+)
+def test_load_matches_streaming_for_every_source(
+    open_source: Callable[[bytes], DocxSource],
+) -> None:
+    """Test that load reads every kind of source the streaming path reads."""
+    extractor = DocxExtractor()
+    data = (FIXTURES_DIR / "valid_quiz.docx").read_bytes()
+
+    document = extractor.load(open_source(data))
+
+    assert extractor.paragraphs(document) == list(extractor.iter_paragraphs(open_source(data)))
+
+
+def test_extract_from_bytes() -> None:
+    """Test extracting paragraphs from DOCX contents in memory."""
+    extractor = DocxExtractor()
+    data = (FIXTURES_DIR / "valid_quiz.docx").read_bytes()
+
+    assert extractor.extract(data) == extractor.extract(FIXTURES_DIR / "valid_quiz.docx")
+    assert extractor.extract(memoryview(data)) == extractor.extract(data)
+    assert extractor.extract(bytearray(data)) == extractor.extract(data)
+
+
+def test_extract_from_file_object() -> None:
+    """Test extracting paragraphs from an open binary file."""
+    extractor = DocxExtractor()
+
+    with open(FIXTURES_DIR / "valid_quiz.docx", "rb") as f:
+        paragraphs = extractor.extract(f)
+
+    assert paragraphs[0] == "Question 1"
+    assert len(paragraphs) == 12
+
+
+def test_extract_from_non_seekable_stream() -> None:
+    """Test that streams which cannot seek, like stdin, are still readable."""
+
+    data = (FIXTURES_DIR / "valid_quiz.docx").read_bytes()
+
+    assert len(DocxExtractor().extract(io.BufferedReader(Pipe(data)))) == 12
+
+
+def test_extract_invalid_bytes() -> None:
+    """Test that ValueError is raised for in-memory contents that are not DOCX."""
+    extractor = DocxExtractor()
+
+    with pytest.raises(ValueError, match="Invalid DOCX file: <9 bytes>"):
+        extractor.extract(b"not a zip")
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        FIXTURES_DIR / "valid_quiz.docx",
+        FIXTURES_DIR / "unlabeled_quiz.docx",
+        FIXTURES_DIR / "with_empty_paragraphs.docx",
+        Path(__file__).parent.parent.parent / "sample-data" / "SAMPLE-DOCUMENT.docx",
+    ],
+)
+def test_iter_paragraphs_matches_extract(path: Path) -> None:
+    """Test that streaming yields exactly the paragraphs extract returns."""
+    extractor = DocxExtractor()
+
+    assert list(extractor.iter_paragraphs(path)) == extractor.extract(path)
+
+
+def test_iter_paragraphs_non_seekable_stream() -> None:
+    """Test that a non-seekable stream is spooled, even past the spool size."""
+    path = FIXTURES_DIR / "valid_quiz.docx"
+    extractor = DocxExtractor()
+
+    paragraphs = list(
+        extractor.iter_paragraphs(io.BufferedReader(Pipe(path.read_bytes())), spool_size=16)
+    )
+
+    assert paragraphs == extractor.extract(path)
+
+
+def test_iter_paragraphs_errors(tmp_path: Path) -> None:
+    """Test that streaming raises the same errors as extract."""
+    extractor = DocxExtractor()
+    invalid_file = tmp_path / "invalid.docx"
+    invalid_file.write_text("Not a valid DOCX file")
+
+    with pytest.raises(FileNotFoundError, match="File not found"):
+        list(extractor.iter_paragraphs("nonexistent.docx"))
+    with pytest.raises(ValueError, match="Invalid DOCX file"):
+        list(extractor.iter_paragraphs(invalid_file))
+
+
+def test_iter_paragraphs_text_matches_python_docx(tmp_path: Path) -> None:
+    """Test that tabs, breaks, hyphens, hyperlinks and tables read as in python-docx."""
+    document = Document()
+    document.add_paragraph("Tab\there\nline break")
+    run = document.add_paragraph("Before page").add_run("after")
+    run.add_break(WD_BREAK.PAGE)
+    run.add_text("end")
+    run._r.append(OxmlElement("w:noBreakHyphen"))
+    paragraph = document.add_paragraph("Link: ")
+    hyperlink = OxmlElement("w:hyperlink")
+    hyperlink.append(paragraph.add_run("example.com")._r)
+    paragraph._p.append(hyperlink)
+    document.add_table(rows=1, cols=1).cell(0, 0).text = "In a table"
+    path = tmp_path / "special.docx"
+    document.save(str(path))
+    extractor = DocxExtractor()
+
+    paragraphs = list(extractor.iter_paragraphs(path))
+
+    assert paragraphs == extractor.extract(path)
+    assert paragraphs == ["Tab\there\nline break", "Before pageafterend-", "Link: example.com"]
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        FIXTURES_DIR / "with_empty_paragraphs.docx",
+        Path(__file__).parent.parent.parent / "sample-data" / "SAMPLE-DOCUMENT.docx",
+    ],
+)
+def test_iter_paragraphs_resumes_at_offsets(path: Path) -> None:
+    """Test that streaming from each reported offset yields the rest of the document."""
+    extractor = DocxExtractor()
+    paragraphs = list(extractor.iter_paragraphs(path))
+
+    located = list(extractor.iter_paragraphs_with_positions(path))
+
+    offsets = list(extractor.iter_paragraph_offsets(path))
+
+    assert [(position, text) for _, position, text in offsets] == located
+    for index, (offset, position, _) in enumerate(offsets):
+        assert list(extractor.iter_paragraphs(path, offset=offset)) == paragraphs[index:]
+        resumed = extractor.iter_paragraphs_with_positions(path, offset=offset, position=position)
+        assert list(resumed) == located[index:]
+
+
+def test_iter_paragraphs_rejects_offset_before_body() -> None:
+    """Test that an offset inside the document header is refused."""
+    with pytest.raises(ValueError, match="not in the document body"):
+        list(DocxExtractor().iter_paragraphs(FIXTURES_DIR / "valid_quiz.docx", offset=1))
+
+
+def test_normalizer_applies_to_both_extraction_paths() -> None:
+    """Test that a normalizer cleans paragraphs in extract and iter_paragraphs alike."""
+    data = build_docx(["\ufeffQuestion\u200b 1", "Caf\u00e9\u00a0\u201cquiz\u201d", "  "])
+    extractor = DocxExtractor(TextNormalizer())
+
+    assert extractor.extract(data) == ["Question 1", 'Caf\u00e9 "quiz"']
+    assert list(extractor.iter_paragraphs(data)) == extractor.extract(data)
+
+
+def test_extract_with_positions_counts_empty_paragraphs() -> None:
+    """Test that positions index all body paragraphs, empty ones included."""
+    data = build_docx(["Title", "", "Question 1", "  ", "Text"])
+
+    paragraphs, positions = DocxExtractor().extract_with_positions(data)
+
+    assert paragraphs == DocxExtractor().extract(data)
+    assert list(positions) == [0, 2, 4]
+    streamed = DocxExtractor().iter_paragraphs_with_positions(data)
+    assert list(streamed) == list(zip(positions, paragraphs, strict=True))
@@ -0,0 +1,140 @@
+"""Tests for instrumentation hooks."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from question_parser import hooks
+from question_parser.errors import ParsingError, QuestionParserError
+from question_parser.extractor import DocxExtractor
+from question_parser.parser import QuestionParser
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class RecordingObserver(hooks.Observer):
+    """Observer that records every call it receives."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, ...]] = []
+
+    def on_start(self, event: str) -> None:
+        self.calls.append(("start", event))
+
+    def on_end(self, event: str, seconds: float) -> None:
+        assert seconds >= 0
+        self.calls.append(("end", event))
+
+    def on_count(self, name: str, value: int) -> None:
+        self.calls.append(("count", name, str(value)))
+
+    def on_error(self, error: QuestionParserError) -> None:
+        self.calls.append(("error", error.message))
+
+
+def test_timed_without_observers_is_shared_null_context() -> None:
+    """Test that timing costs no allocation when nobody is observing."""
+    assert hooks.timed(hooks.EVENT_EXTRACT) is hooks.timed(hooks.EVENT_VALIDATE)
+
+
+def test_observing_registers_and_removes() -> None:
+    """Test that the observing context only reports events inside the block."""
+    observer = RecordingObserver()
+
+    with hooks.observing(observer):
+        hooks.count("things", 3)
+    hooks.count("things", 5)
+
+    assert observer.calls == [("count", "things", "3")]
+
+
+def test_remove_unknown_observer() -> None:
+    """Test that removing an observer that was never added is a no-op."""
+    hooks.remove_observer(RecordingObserver())
+
+
+def test_full_pipeline_events(valid_quiz_paragraphs: list[str]) -> None:
+    """Test the events emitted by extraction, parsing and serialization."""
+    observer = RecordingObserver()
+
+    with hooks.observing(observer):
+        paragraphs = DocxExtractor().extract(FIXTURES_DIR / "valid_quiz.docx")
+        QuestionParser().parse(paragraphs).model_dump_json()
+
+    assert observer.calls == [
+        ("start", hooks.EVENT_EXTRACT),
+        ("end", hooks.EVENT_EXTRACT),
+        ("count", hooks.COUNT_PARAGRAPHS, "12"),
+        ("start", hooks.EVENT_PARSE_QUESTION),
+        ("end", hooks.EVENT_PARSE_QUESTION),
+        ("start", hooks.EVENT_PARSE_QUESTION),
+        ("end", hooks.EVENT_PARSE_QUESTION),
+        ("start", hooks.EVENT_VALIDATE),
+        ("end", hooks.EVENT_VALIDATE),
+        ("count", hooks.COUNT_QUESTIONS, "2"),
+        ("start", hooks.EVENT_SERIALIZE),
+        ("end", hooks.EVENT_SERIALIZE),
+    ]
+
+
+def test_parsing_error_reported(parser: QuestionParser) -> None:
+    """Test that parsing errors reach observers before being raised."""
+    observer = RecordingObserver()
+
+    with hooks.observing(observer), pytest.raises(ParsingError):
+        parser.parse(["Some random text"])
+
+    assert observer.calls[-1] == ("error", "No valid questions found")
+
+
+def test_streaming_pipeline_events() -> None:
+    """Test that streaming extraction and parsing emit the same events as extract and parse."""
+    observer = RecordingObserver()
+
+    with hooks.observing(observer):
+        paragraphs = DocxExtractor().iter_paragraphs(FIXTURES_DIR / "valid_quiz.docx")
+        questions = list(QuestionParser().iter_questions(paragraphs))
+
+    assert len(questions) == 2
+    assert observer.calls == [
+        ("start", hooks.EVENT_EXTRACT),
+        ("start", hooks.EVENT_PARSE_QUESTION),
+        ("end", hooks.EVENT_PARSE_QUESTION),
+        # The last question is parsed once the paragraphs run out
+        ("end", hooks.EVENT_EXTRACT),
+        ("count", hooks.COUNT_PARAGRAPHS, "12"),
+        ("start", hooks.EVENT_PARSE_QUESTION),
+        ("end", hooks.EVENT_PARSE_QUESTION),
+        ("count", hooks.COUNT_QUESTIONS, "2"),
+    ]
+
+
+def test_timed_items_excludes_consumer_time() -> None:
+    """Test that a timed stream only counts the time spent producing items."""
+    durations: list[float] = []
+
+    class DurationObserver(hooks.Observer):
+        def on_end(self, event: str, seconds: float) -> None:
+            durations.append(seconds)
+
+    with hooks.observing(DurationObserver()):
+        for _ in hooks.timed_items(hooks.EVENT_EXTRACT, range(3)):
+            time.sleep(0.05)
+
+    assert len(durations) == 1
+    assert durations[0] < 0.05
+
+
+def test_streaming_and_check_errors_reported(parser: QuestionParser) -> None:
+    """Test that iter_questions and check report parsing errors to observers."""
+    paragraphs = ["Question 1", "Text", "A. One", "B. Two"]
+    observer = RecordingObserver()
+
+    with hooks.observing(observer):
+        with pytest.raises(ParsingError):
+            list(parser.iter_questions(paragraphs))
+        parser.check(paragraphs)
+
+    errors = [call for call in observer.calls if call[0] == "error"]
+    assert errors == [("error", "Question 1 has 2 choices, expected 4")] * 2
@@ -0,0 +1,89 @@
+"""Tests for the offline load-testing harness."""
+
+import http.client
+import json
+from urllib.parse import urlsplit
+
+import pytest
+
+from question_parser.loadtest import (
+    http_target,
+    in_process_target,
+    parse_server,
+    run_load_test,
+    synthetic_payloads,
+)
+
+
+def test_in_process_load_test() -> None:
+    """Test that every request is counted and latencies are ordered."""
+    report = run_load_test(in_process_target(), synthetic_payloads([2, 5]), 12, 3)
+
+    assert report.target == "in-process"
+    assert report.requests == 12
+    assert report.errors == 0
+    assert report.requests_per_second > 0
+    assert 0 < report.p50_ms <= report.p95_ms <= report.p99_ms <= report.max_ms
+
+
+def test_http_load_test_counts_errors() -> None:
+    """Test that requests the server rejects are reported as errors."""
+    payloads = [*synthetic_payloads([3]), b"not a docx"]
+
+    with parse_server() as url:
+        report = run_load_test(http_target(url), payloads, 10, 4, name=url)
+
+    assert report.target == url
+    assert report.errors == 5
+    assert report.error_rate == 0.5
+
+
+def test_parse_server_responses() -> None:
+    """Test that the stand-in server returns quiz JSON, errors and 404s."""
+    with parse_server() as url:
+        parts = urlsplit(url)
+        connection = http.client.HTTPConnection(parts.hostname or "", parts.port)
+        responses = []
+        for path, body in [
+            (parts.path, synthetic_payloads([2])[0]),
+            (parts.path, b"not a docx"),
+            ("/other", b""),
+        ]:
+            connection.request("POST", path, body=body)
+            response = connection.getresponse()
+            responses.append((response.status, json.loads(response.read())))
+        connection.close()
+
+    assert responses[0][0] == 200
+    assert len(responses[0][1]["questions"]) == 2
+    assert responses[1][0] == 422
+    assert "Invalid DOCX file" in responses[1][1]["error"]
+    assert responses[2][0] == 404
+
+
+def test_parse_server_keeps_connection_after_404() -> None:
+    """Test that a rejected request's body is not read as the next request."""
+    with parse_server() as url:
+        parts = urlsplit(url)
+        connection = http.client.HTTPConnection(parts.hostname or "", parts.port)
+        statuses = []
+        for path in ("/other", parts.path):
+            connection.request("POST", path, body=synthetic_payloads([2])[0])
+            response = connection.getresponse()
+            response.read()
+            statuses.append(response.status)
+        connection.close()
+
+    assert statuses == [404, 200]
+
+
+def test_run_load_test_rejects_bad_arguments() -> None:
+    """Test that payloads, requests and concurrency are required."""
+    target = in_process_target()
+
+    with pytest.raises(ValueError, match="payload"):
+        run_load_test(target, [], 1, 1)
+    with pytest.raises(ValueError, match="must be positive"):
+        run_load_test(target, [b""], 1, 0)
+    with pytest.raises(ValueError, match="http://"):
+        http_target("https://example.com/parse")
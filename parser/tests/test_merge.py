@@ -0,0 +1,92 @@
+"""Tests for merging quiz documents into one bank."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from question_parser.errors import ParsingError
+from question_parser.extractor import DocxExtractor
+from question_parser.merge import merge_quizzes
+from question_parser.models import Quiz
+from question_parser.parser import QuestionParser
+from question_parser.synthetic import build_docx, synthetic_docx
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def inputs(tmp_path: Path) -> list[Path]:
+    """Write DOCX inputs of different sizes and one quiz JSON input."""
+    paths = []
+    for index, size in enumerate([3, 5, 2]):
+        path = tmp_path / f"quiz-{index}.docx"
+        path.write_bytes(synthetic_docx(size, seed=index))
+        paths.append(path)
+
+    json_path = tmp_path / "quiz.json"
+    quiz = QuestionParser().parse(DocxExtractor().extract(FIXTURES_DIR / "valid_quiz.docx"))
+    json_path.write_text(quiz.model_dump_json())
+    paths.insert(1, json_path)
+    return paths
+
+
+def _expected_questions(inputs: list[Path]) -> list[tuple[str, list[tuple[str, str]]]]:
+    """Return the text and choices of every input question, in merge order."""
+    questions = []
+    for path in inputs:
+        if path.suffix == ".json":
+            quiz = Quiz.model_validate_json(path.read_text())
+        else:
+            quiz = QuestionParser().parse(DocxExtractor().extract(path))
+        questions.extend((q.text, [(c.label, c.text) for c in q.choices]) for q in quiz.questions)
+    return questions
+
+
+@pytest.mark.parametrize(("workers", "mode"), [(1, "auto"), (2, "thread"), (2, "process")])
+def test_merge_renumbers_in_input_order(inputs: list[Path], workers: int, mode: str) -> None:
+    """Test that questions keep input order and are numbered from the start."""
+    output = io.StringIO()
+
+    report = merge_quizzes(inputs, output, workers=workers, mode=mode)  # type: ignore[arg-type]
+
+    quiz = Quiz.model_validate_json(output.getvalue())
+    assert [q.id for q in quiz.questions] == list(range(1, len(quiz.questions) + 1))
+    assert [
+        (q.text, [(c.label, c.text) for c in q.choices]) for q in quiz.questions
+    ] == _expected_questions(inputs)
+    assert report.questions == len(quiz.questions)
+    assert [source.questions for source in report.sources] == [3, 2, 5, 2]
+
+
+def test_merge_report_locates_questions(inputs: list[Path]) -> None:
+    """Test that every merged id maps back to its file and original id."""
+    report = merge_quizzes(inputs, io.StringIO())
+
+    assert report.locate(1) == (str(inputs[0]), 1)
+    assert report.locate(4) == (str(inputs[1]), 1)
+    assert report.locate(10) == (str(inputs[2]), 5)
+    assert report.locate(12) == (str(inputs[3]), 2)
+    for question_id in (0, 13):
+        with pytest.raises(KeyError):
+            report.locate(question_id)
+
+
+def test_merge_names_the_failing_input(tmp_path: Path, inputs: list[Path]) -> None:
+    """Test that a parsing error says which input it came from."""
+    broken = tmp_path / "broken.docx"
+    broken.write_bytes(
+        build_docx(["Question 2", "Text", "A. One", "B. Two", "C. Three", "D. Four"])
+    )
+
+    for workers in (1, 2):
+        with pytest.raises(ParsingError, match=rf"^{broken}: .*expected 1, got 2"):
+            merge_quizzes([*inputs, broken], io.StringIO(), workers=workers, mode="thread")
+
+
+def test_merge_rejects_bad_arguments(inputs: list[Path]) -> None:
+    """Test that inputs and a positive number of workers are required."""
+    with pytest.raises(ValueError, match="At least one input"):
+        merge_quizzes([], io.StringIO())
+    with pytest.raises(ValueError, match="must be positive"):
+        merge_quizzes(inputs, io.StringIO(), workers=0)
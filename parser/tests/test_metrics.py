@@ -0,0 +1,62 @@
+"""Tests for the in-memory metrics collector and Prometheus exporter."""
+
+import pytest
+
+from question_parser import hooks
+from question_parser.errors import ParsingError
+from question_parser.metrics import ERRORS_COUNTER, Histogram, HistogramCollector, prometheus_text
+from question_parser.parser import QuestionParser
+
+
+def test_histogram_buckets() -> None:
+    """Test that values land in the first bucket whose bound they do not exceed."""
+    histogram = Histogram(buckets=(1.0, 0.1))
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.buckets == (0.1, 1.0)
+    assert histogram.bucket_counts == [2, 1, 1]
+    assert histogram.cumulative_counts() == [2, 3, 4]
+    assert histogram.count == 4
+    assert histogram.total == 2.65
+
+
+def test_collector_records_parse(parser: QuestionParser, valid_quiz_paragraphs: list[str]) -> None:
+    """Test that a registered collector sees durations, counts and errors."""
+    collector = HistogramCollector()
+
+    with hooks.observing(collector):
+        parser.parse(valid_quiz_paragraphs)
+        with pytest.raises(ParsingError):
+            parser.parse([])
+
+    assert collector.histograms[hooks.EVENT_PARSE_QUESTION].count == 2
+    assert collector.histograms[hooks.EVENT_VALIDATE].count == 1
+    assert collector.counters == {hooks.COUNT_QUESTIONS: 2, ERRORS_COUNTER: 1}
+
+
+def test_prometheus_text_format() -> None:
+    """Test the exposition text for a histogram and a counter."""
+    collector = HistogramCollector(buckets=(0.1, 1.0))
+    collector.on_end("extract", 0.05)
+    collector.on_end("extract", 0.5)
+    collector.on_count("paragraphs", 12)
+
+    assert prometheus_text(collector, namespace="qp") == (
+        "# HELP qp_extract_seconds Duration of extract events in seconds.\n"
+        "# TYPE qp_extract_seconds histogram\n"
+        'qp_extract_seconds_bucket{le="0.1"} 1\n'
+        'qp_extract_seconds_bucket{le="1.0"} 2\n'
+        'qp_extract_seconds_bucket{le="+Inf"} 2\n'
+        "qp_extract_seconds_sum 0.55\n"
+        "qp_extract_seconds_count 2\n"
+        "# HELP qp_paragraphs_total Total paragraphs.\n"
+        "# TYPE qp_paragraphs_total counter\n"
+        "qp_paragraphs_total 12\n"
+    )
+
+
+def test_prometheus_text_empty() -> None:
+    """Test that an empty collector exports nothing."""
+    assert prometheus_text(HistogramCollector()) == ""
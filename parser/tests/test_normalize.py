@@ -0,0 +1,35 @@
+"""Tests for paragraph text normalization."""
+
+import pytest
+
+from question_parser.normalize import TextNormalizer
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("  Plain text  ", "Plain text"),
+        ("Question​ 12", "Question 12"),
+        ("﻿Question 12", "Question 12"),
+        ("A． Full-width １２", "A. Full-width 12"),
+        ("“Smart” — it’s", '"Smart" - it\'s'),
+        ("5\u2033 tall, 3\u2032 wide", "5\" tall, 3' wide"),
+        ("Non\u2011breaking and small\ufe58dash", "Non-breaking and small-dash"),
+        ("Soft­hyphen", "Softhyphen"),
+        ("Line one\nline two\tand  tab", "Line one line two and tab"),
+    ],
+)
+def test_default_normalizer(text: str, expected: str) -> None:
+    """Test that the defaults clean the characters Word documents carry."""
+    assert TextNormalizer()(text) == expected
+
+
+def test_normalizer_options() -> None:
+    """Test that normalization form, folding and mapping are configurable."""
+    keep_form = TextNormalizer(form=None)
+    keep_whitespace = TextNormalizer(fold_whitespace=False)
+    custom = TextNormalizer(mapping={"*": None, "’": "'"})
+
+    assert keep_form("１ ’") == "１ '"
+    assert keep_whitespace("  one\n two  ") == "one\n two"
+    assert custom("**Bold** it’s “quoted”") == "Bold it's “quoted”"
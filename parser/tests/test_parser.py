@@ -1,10 +1,12 @@
 """Tests for the QuestionParser."""
 
+from collections.abc import Iterator
+
 import pytest
 
 from question_parser.defaults import CHOICES_PER_QUESTION
 from question_parser.errors import ParsingError
-from question_parser.parser import QuestionParser
+from question_parser.parser import QuestionParser, RawQuestion
 
 
 def test_parse_valid_quiz(parser: QuestionParser, valid_quiz_paragraphs: list[str]) -> None:
@@ -158,3 +160,326 @@ def test_parse_multiple_unlabeled_questions(parser: QuestionParser) -> None:
     assert quiz.questions[0].choices[1].text == "4"
     assert quiz.questions[1].choices[0].label == "A"
     assert quiz.questions[1].choices[0].text == "Paris"
+
+
+def test_parse_bulk_matches_per_object(valid_quiz_paragraphs: list[str]) -> None:
+    """Test that bulk validation builds the same Quiz as per-object construction."""
+    bulk_parser = QuestionParser(bulk_validation=True)
+
+    assert bulk_parser.parse(valid_quiz_paragraphs) == QuestionParser().parse(valid_quiz_paragraphs)
+
+
+def test_parse_bulk_unlabeled_choices(parser: QuestionParser) -> None:
+    """Test that bulk validation assigns labels to unlabeled choices."""
+    paragraphs = ["Question 1", "What color is the sky?", "Blue", "Purple", "Green", "Red"]
+
+    quiz = QuestionParser(bulk_validation=True).parse(paragraphs)
+
+    assert quiz == parser.parse(paragraphs)
+
+
+def test_parse_bulk_error_names_question() -> None:
+    """Test that bulk validation errors are mapped back to question ids."""
+    paragraphs = [
+        "Question 1",
+        "What is 1 + 1?",
+        "A. 1",
+        "B. 2",
+        "C. 3",
+        "D. 4",
+        "Question 0",
+        "What is 0?",
+        "A. 0",
+        "B. 1",
+        "C. 2",
+        "D. 3",
+    ]
+
+    with pytest.raises(ParsingError, match="Question 0: Question ID must be positive"):
+        QuestionParser(bulk_validation=True).parse(paragraphs)
+
+
+def test_parse_bulk_quiz_level_error(valid_question_paragraphs: list[str]) -> None:
+    """Test that quiz-wide validation errors become ParsingError in bulk mode."""
+    paragraphs = [*valid_question_paragraphs, *valid_question_paragraphs]
+
+    with pytest.raises(ParsingError, match="Invalid quiz: Question IDs must be sequential"):
+        QuestionParser(bulk_validation=True).parse(paragraphs)
+
+
+@pytest.mark.parametrize("bulk_validation", [False, True])
+@pytest.mark.parametrize(
+    ("ids", "message"),
+    [
+        ([1, 0], "Question 0: Question ID must be positive"),
+        ([1, 3], "Invalid quiz: Question IDs must be sequential"),
+    ],
+)
+def test_parse_validation_error_is_parsing_error(
+    bulk_validation: bool, ids: list[int], message: str
+) -> None:
+    """Test that both validation modes raise ParsingError for the same document."""
+    paragraphs = [
+        line
+        for question_id in ids
+        for line in (f"Question {question_id}", "Text", "A. 1", "B. 2", "C. 3", "D. 4")
+    ]
+
+    with pytest.raises(ParsingError, match=message):
+        QuestionParser(bulk_validation=bulk_validation).parse(paragraphs)
+
+
+def test_iter_questions_validation_error_is_parsing_error(parser: QuestionParser) -> None:
+    """Test that streamed questions failing validation raise ParsingError."""
+    paragraphs = ["Question 0", "Text", "A. 1", "B. 2", "C. 3", "D. 4"]
+
+    with pytest.raises(ParsingError, match="Question 0: Question ID must be positive"):
+        list(parser.iter_questions(paragraphs))
+
+
+def test_parse_bulk_parsing_error() -> None:
+    """Test that structural errors are still raised before validation in bulk mode."""
+    paragraphs = ["Question 1", "Text", "A. Paris", "B. London"]
+
+    with pytest.raises(ParsingError, match=f"has 2 choices, expected {CHOICES_PER_QUESTION}"):
+        QuestionParser(bulk_validation=True).parse(paragraphs)
+
+
+def test_parse_raw_questions(parser: QuestionParser, valid_question_paragraphs: list[str]) -> None:
+    """Test that raw parsing returns ids, text and labeled choices without models."""
+    raw = parser.parse_raw_questions(valid_question_paragraphs)
+
+    assert raw == [
+        (
+            1,
+            "What is the capital of France?",
+            [("A", "Paris"), ("B", "London"), ("C", "Berlin"), ("D", "Madrid")],
+        )
+    ]
+
+
+def test_iter_raw_questions_is_lazy(
+    parser: QuestionParser, valid_question_paragraphs: list[str]
+) -> None:
+    """Test that a question is yielded as soon as the next one starts."""
+
+    def paragraphs() -> Iterator[str]:
+        yield from valid_question_paragraphs
+        yield "Question 2"
+        raise AssertionError("read past the next question header")
+
+    raw = next(parser.iter_raw_questions(paragraphs()))
+
+    assert raw[0] == 1
+    assert raw[1] == "What is the capital of France?"
+
+
+def test_iter_questions_matches_parse(
+    parser: QuestionParser, valid_quiz_paragraphs: list[str]
+) -> None:
+    """Test that streaming questions yields the same questions as parse."""
+    assert list(parser.iter_questions(iter(valid_quiz_paragraphs))) == (
+        parser.parse(valid_quiz_paragraphs).questions
+    )
+
+
+def test_question_without_choices_does_not_swallow_next(parser: QuestionParser) -> None:
+    """Test that a question missing its choices is reported, not merged with the next."""
+    paragraphs = [
+        "Question 1",
+        "Orphaned question",
+        "Question 2",
+        "What is 2 + 2?",
+        "A. 3",
+        "B. 4",
+        "C. 5",
+        "D. 6",
+    ]
+
+    with pytest.raises(ParsingError, match="Question 1 has 0 choices"):
+        parser.parse(paragraphs)
+
+
+def test_check_valid_quiz(parser: QuestionParser, valid_quiz_paragraphs: list[str]) -> None:
+    """Test that a well-formed document has no problems."""
+    result = parser.check(valid_quiz_paragraphs)
+
+    assert result.ok
+    assert result.questions == 2
+
+
+def test_check_reports_every_problem(parser: QuestionParser) -> None:
+    """Test that check keeps going after the first problem, naming each question."""
+    paragraphs = [
+        "Question 1",
+        "Too few choices",
+        "A. One",
+        "B. Two",
+        "Question 2",
+        "Fine",
+        "A. One",
+        "B. Two",
+        "C. Three",
+        "D. Four",
+        "Question 4",
+        "Skipped a number",
+        "A. One",
+        "B. Two",
+        "C. Three",
+        "D. Four",
+        "Question 5",
+    ]
+
+    result = parser.check(paragraphs)
+
+    assert result.questions == 4
+    assert result.problems == [
+        "Question 1 has 2 choices, expected 4",
+        "Question 4: Question IDs must be sequential starting from 1, expected 3",
+        "Question 5 has no text",
+    ]
+
+
+def test_check_matches_parse_errors(parser: QuestionParser) -> None:
+    """Test that check flags the documents parse rejects."""
+    for paragraphs in ([], ["No questions here"], ["Question 0", "Text", "A", "B", "C", "D"]):
+        result = parser.check(paragraphs)
+
+        assert not result.ok
+        with pytest.raises(ParsingError):
+            parser.parse(paragraphs)
+
+
+def test_parse_with_sources(parser: QuestionParser) -> None:
+    """Test that source positions follow labels when choices are out of order."""
+    paragraphs = [
+        "Question 1",
+        "Which is largest?",
+        "B. Two",
+        "A. One",
+        "C. Three",
+        "D. Four",
+        "Question 2",
+        "Pick one",
+        "Red",
+        "Green",
+        "Blue",
+        "Yellow",
+    ]
+    positions = [2, 3, 5, 6, 7, 8, 10, 11, 12, 13, 15, 16]
+
+    quiz, sources = parser.parse_with_sources(paragraphs, positions)
+
+    assert quiz == parser.parse(paragraphs)
+    assert sources.question(1) == range(2, 9)
+    assert sources.text(1) == range(3, 4)
+    assert [sources.choice(1, label) for label in "ABCD"] == [6, 5, 7, 8]
+    assert [sources.choice(2, label) for label in "ABCD"] == [12, 13, 15, 16]
+    assert sources.find(9) is None  # Empty paragraph between questions
+    assert sources.find(14) == 2
+
+
+def test_parse_with_sources_defaults_to_list_indexes(
+    parser: QuestionParser, valid_quiz_paragraphs: list[str]
+) -> None:
+    """Test that positions default to indexes in the paragraph list."""
+    _, sources = parser.parse_with_sources(valid_quiz_paragraphs)
+
+    assert sources.question(2) == range(6, 12)
+    assert sources.choice(2, "B") == 9
+
+
+def test_parse_with_sources_rejects_mismatched_positions(
+    parser: QuestionParser, valid_quiz_paragraphs: list[str]
+) -> None:
+    """Test that positions must match the paragraphs one to one."""
+    with pytest.raises(ValueError, match="Got 3 positions for 12 paragraphs"):
+        parser.parse_with_sources(valid_quiz_paragraphs, [0, 1, 2])
+
+
+def test_parsing_error_paragraph(parser: QuestionParser) -> None:
+    """Test that a question's parsing error names the paragraph of its header."""
+    paragraphs = ["Title", "Question 1", "Text", "A. One", "B. Two"]
+
+    with pytest.raises(ParsingError) as parsed:
+        parser.parse(paragraphs)
+    with pytest.raises(ParsingError) as located:
+        parser.parse_with_sources(paragraphs, [0, 4, 5, 6, 8])
+
+    assert parsed.value.paragraph is None  # parse is not given source positions
+    assert located.value.paragraph == 4
+
+
+def test_streamed_errors_are_located(parser: QuestionParser) -> None:
+    """Test that streaming parses and checks locate problems by source position."""
+    located = [(0, "Title"), (3, "Question 1"), (4, "Text"), (6, "A. One"), (7, "B. Two")]
+
+    with pytest.raises(ParsingError) as streamed:
+        list(parser.iter_questions_with_positions(located))
+    with pytest.raises(ParsingError) as plain:
+        list(parser.iter_questions(paragraph for _, paragraph in located))
+    checked = parser.check_with_positions(located)
+
+    assert streamed.value.paragraph == 3
+    assert plain.value.paragraph is None
+    assert checked.paragraphs == [3]
+    assert parser.check(paragraph for _, paragraph in located).paragraphs == [None]
+
+
+def _line_scan(parser: QuestionParser, paragraphs: list[str]) -> list[RawQuestion]:
+    """Parse like the line scanner the block parser replaced.
+
+    Each question is parsed from the whole rest of the document, so its text
+    can read on past later 'Question N' headers.
+    """
+    questions: list[RawQuestion] = []
+    i = 0
+    while i < len(paragraphs):
+        match = parser.question_pattern.match(paragraphs[i])
+        if match:
+            raw_question, first_choice = parser._parse_question(paragraphs[i:], int(match.group(1)))
+            questions.append(raw_question)
+            i += first_choice + len(raw_question[2])
+        else:
+            i += 1
+    return questions
+
+
+@pytest.mark.parametrize(
+    "paragraphs",
+    [
+        ["Title", "Question 1", "Two", "lines", "A. 1", "B. 2", "C. 3", "D. 4", "Note"],
+        ["Question 1", "Sky?", "Blue", "Red", "Green", "Gray", "", "Question 2", "Grass?"]
+        + ["Green", "Red", "Blue", "Gray"],
+        ["Question 1", "Text", "A. 1", "B. 2", "C. 3", "D. 4", "Question 2", "Text"]
+        + ["A. 1", "B. 2", "C. 3", "D. 4"],
+    ],
+)
+def test_block_parse_matches_line_scan(parser: QuestionParser, paragraphs: list[str]) -> None:
+    """Test that blocks split questions like the line scanner for well-formed documents."""
+    assert parser.parse_raw_questions(paragraphs) == _line_scan(parser, paragraphs)
+
+
+def test_unlabeled_question_stops_at_next_header(parser: QuestionParser) -> None:
+    """Test that an unlabeled question no longer reads on into a labeled one."""
+    paragraphs = ["Question 1", "Sky?", "Blue", "Red", "Green", "Gray", "Question 2", "Text"]
+    paragraphs += ["A. 1", "B. 2", "C. 3", "D. 4"]
+    choices = [("A", "1"), ("B", "2"), ("C", "3"), ("D", "4")]
+
+    assert _line_scan(parser, paragraphs) == [
+        (1, "Sky?\nBlue\nRed\nGreen\nGray\nQuestion 2\nText", choices)
+    ]
+    assert parser.parse_raw_questions(paragraphs) == [
+        (1, "Sky?", [("A", "Blue"), ("B", "Red"), ("C", "Green"), ("D", "Gray")]),
+        (2, "Text", choices),
+    ]
+
+
+def test_header_after_header_has_no_text(parser: QuestionParser) -> None:
+    """Test that a header is no longer read as the text of the header before it."""
+    paragraphs = ["Question 1", "Question 2", "Text", "A. 1", "B. 2", "C. 3", "D. 4"]
+    choices = [("A", "1"), ("B", "2"), ("C", "3"), ("D", "4")]
+
+    assert _line_scan(parser, paragraphs) == [(1, "Question 2\nText", choices)]
+    with pytest.raises(ParsingError, match="Question 1 has no text"):
+        parser.parse_raw_questions(paragraphs)
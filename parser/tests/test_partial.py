@@ -0,0 +1,110 @@
+"""Tests for parsing a range of questions."""
+
+from pathlib import Path
+
+import pytest
+
+from question_parser.errors import ParsingError
+from question_parser.extractor import DocxExtractor
+from question_parser.normalize import TextNormalizer
+from question_parser.parser import QuestionParser
+from question_parser.partial import (
+    IndexCache,
+    build_question_index,
+    index_key,
+    parse_question_range,
+)
+from question_parser.synthetic import build_docx, synthetic_docx, synthetic_paragraphs
+
+
+@pytest.fixture(scope="module")
+def bank() -> bytes:
+    """A 60-question synthetic document."""
+    return synthetic_docx(60)
+
+
+@pytest.mark.parametrize(("start", "end"), [(1, 1), (7, 12), (55, 60), (58, 99)])
+@pytest.mark.parametrize("cached", [False, True])
+def test_range_matches_full_parse(bank: bytes, start: int, end: int, cached: bool) -> None:
+    """Test that a range holds the same questions as the full parse, cut at the end."""
+    quiz = QuestionParser().parse(DocxExtractor().extract(bank))
+
+    questions = parse_question_range(bank, start, end, cache=IndexCache() if cached else None)
+
+    assert questions == quiz.questions[start - 1 : end]
+
+
+def test_range_skips_questions_outside_it() -> None:
+    """Test that broken questions before and after the range are not parsed."""
+    broken = ["Question 1", "Text", "A. Only one choice"]
+    paragraphs = [*broken, *synthetic_paragraphs(4)[6:18], "Question 4", "No choices"]
+    data = build_docx(paragraphs)
+
+    for cache in (None, IndexCache()):
+        questions = parse_question_range(data, 2, 3, cache=cache)
+        assert [question.id for question in questions] == [2, 3]
+
+
+def test_index_cache_stores_on_disk(tmp_path: Path, bank: bytes) -> None:
+    """Test that an index written by one cache is read back by another."""
+    key = index_key(bank)
+    IndexCache(tmp_path).put(key, build_question_index(bank))
+
+    index = IndexCache(tmp_path).get(key)
+
+    assert index is not None
+    assert sorted(index.offsets) == list(range(1, 61))
+    assert IndexCache(tmp_path).get(index_key(bank + b"x")) is None
+    assert key != index_key(bank, TextNormalizer())
+
+
+def test_index_key_follows_normalizer_settings(bank: bytes) -> None:
+    """Test that differently configured normalizers do not share indexes."""
+    keys = {
+        index_key(bank, normalizer)
+        for normalizer in (
+            TextNormalizer(),
+            TextNormalizer(form="NFC"),
+            TextNormalizer(fold_whitespace=False),
+            TextNormalizer(mapping={"*": None}),
+        )
+    }
+
+    assert len(keys) == 4
+    assert index_key(bank, TextNormalizer()) == index_key(bank, TextNormalizer())
+
+
+def test_index_cache_evicts_least_recently_used(bank: bytes) -> None:
+    """Test that the in-memory cache keeps only its most recent entries."""
+    cache = IndexCache(max_entries=2)
+    index = build_question_index(bank)
+    for key in ("a", "b"):
+        cache.put(key, index)
+    cache.get("a")
+    cache.put("c", index)
+
+    assert cache.get("a") is index
+    assert cache.get("b") is None
+    assert cache.get("c") is index
+
+
+def test_range_errors(bank: bytes) -> None:
+    """Test that empty ranges and missing questions are reported."""
+    with pytest.raises(ValueError, match="Invalid question range"):
+        parse_question_range(bank, 5, 4)
+    with pytest.raises(ValueError, match="Invalid question range"):
+        parse_question_range(bank, 0, 4)
+    for cache in (None, IndexCache()):
+        with pytest.raises(ParsingError, match="Question 61 not found"):
+            parse_question_range(bank, 61, 70, cache=cache)
+
+
+def test_range_errors_are_located() -> None:
+    """Test that an error in a range read from the index names its source position."""
+    paragraphs = [*synthetic_paragraphs(2), "", "Question 3", "Text", "A. Only one choice"]
+    data = build_docx(paragraphs)
+
+    for cache in (None, IndexCache()):
+        with pytest.raises(ParsingError) as error:
+            parse_question_range(data, 3, 3, cache=cache)
+        assert error.value.paragraph == paragraphs.index("Question 3")
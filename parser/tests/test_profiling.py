@@ -0,0 +1,73 @@
+"""Tests for memory profiling."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from question_parser.profiling import (
+    STAGE_LOAD,
+    STAGE_MODELS,
+    STAGE_PARAGRAPHS,
+    STAGE_SERIALIZE,
+    MemoryProfiler,
+    MemoryReport,
+    profile_conversion,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def test_profile_conversion_reports_each_stage() -> None:
+    """Test that every pipeline stage is measured in order."""
+    json_output, report = profile_conversion(FIXTURES_DIR / "valid_quiz.docx")
+
+    assert "What is the capital of France?" in json_output
+    assert [s.name for s in report.stages] == [
+        STAGE_LOAD,
+        STAGE_PARAGRAPHS,
+        STAGE_MODELS,
+        STAGE_SERIALIZE,
+    ]
+    assert report.peak_bytes == max(s.peak_bytes for s in report.stages)
+    assert report.peak_bytes > 0
+
+
+def test_profile_conversion_top_sites_limited() -> None:
+    """Test that the number of allocation sites per stage is capped."""
+    _, report = profile_conversion(FIXTURES_DIR / "valid_quiz.docx", top=3)
+
+    load = report.stages[0]
+    assert 0 < len(load.top_allocations) <= 3
+    sizes = [site.size_bytes for site in load.top_allocations]
+    assert sizes == sorted(sizes, reverse=True)
+
+
+def test_profiler_stage_measures_allocation() -> None:
+    """Test that a stage sees memory allocated inside it."""
+    with MemoryProfiler() as profiler, profiler.stage("allocate"):
+        data = bytearray(1_000_000)
+
+    report = profiler.report()
+    assert report.stages[0].retained_bytes >= 1_000_000
+    assert report.stages[0].peak_bytes >= 1_000_000
+    assert len(data) == 1_000_000
+
+
+def test_profiler_stage_outside_context() -> None:
+    """Test that stages require the profiler to be entered."""
+    profiler = MemoryProfiler()
+
+    with (
+        pytest.raises(RuntimeError, match="outside of the profiler context"),
+        profiler.stage("orphan"),
+    ):
+        pass
+
+
+def test_memory_report_round_trips_json() -> None:
+    """Test that reports serialize to JSON that can be loaded back for diffing."""
+    _, report = profile_conversion(FIXTURES_DIR / "valid_quiz.docx", top=2)
+
+    data = json.loads(report.model_dump_json())
+    assert MemoryReport.model_validate(data) == report
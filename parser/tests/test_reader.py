@@ -0,0 +1,104 @@
+"""Tests for the streaming quiz reader."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from question_parser.errors import ParsingError
+from question_parser.models import Quiz
+from question_parser.reader import iter_questions
+
+
+def test_iter_questions_matches_model_validate(valid_quiz: Quiz, tmp_path: Path) -> None:
+    """Test that reading parser output yields the same questions as Quiz."""
+    path = tmp_path / "quiz.json"
+    path.write_text(valid_quiz.model_dump_json())
+
+    assert list(iter_questions(path)) == valid_quiz.questions
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_iter_questions_any_chunk_size(valid_quiz: Quiz, chunk_size: int) -> None:
+    """Test that values split across chunks, including numbers, are decoded whole."""
+    text = json.dumps(
+        {"questions": valid_quiz.model_dump()["questions"], "count": 12345, "version": "1.0"}
+    )
+
+    questions = list(iter_questions(io.StringIO(text), chunk_size=chunk_size))
+
+    assert questions == valid_quiz.questions
+
+
+def test_iter_questions_is_incremental(valid_quiz: Quiz) -> None:
+    """Test that the first question is available before the file is read to the end."""
+    questions = valid_quiz.model_dump()["questions"]
+    stream = io.StringIO(json.dumps({"questions": questions * 2000}))
+
+    first = next(iter_questions(stream, validate=False, chunk_size=1024))
+
+    assert first == valid_quiz.questions[0]
+    assert stream.tell() < len(stream.getvalue()) // 100
+
+
+def test_iter_questions_ndjson(valid_quiz: Quiz, tmp_path: Path) -> None:
+    """Test that .ndjson files are read one question per line."""
+    path = tmp_path / "quiz.ndjson"
+    path.write_text("\n".join(q.model_dump_json() for q in valid_quiz.questions) + "\n\n")
+
+    assert list(iter_questions(path)) == valid_quiz.questions
+
+
+def test_iter_questions_without_validation(valid_quiz: Quiz) -> None:
+    """Test that validation can be skipped for trusted input."""
+    data = valid_quiz.model_dump()
+    data["questions"][0]["choices"][0]["label"] = "Z"
+    data["questions"][1]["id"] = 7
+
+    questions = list(iter_questions(io.StringIO(json.dumps(data)), validate=False))
+
+    assert questions[0].choices[0].label == "Z"
+    assert questions[1].id == 7
+    with pytest.raises(ValidationError):
+        list(iter_questions(io.StringIO(json.dumps(data))))
+
+
+def test_iter_questions_checks_sequence(valid_quiz: Quiz) -> None:
+    """Test that validation checks ids are sequential and the quiz is not empty."""
+    reversed_quiz = {"version": "1.0", "questions": valid_quiz.model_dump()["questions"][::-1]}
+
+    with pytest.raises(ValueError, match="expected 1, got 2"):
+        list(iter_questions(io.StringIO(json.dumps(reversed_quiz))))
+    with pytest.raises(ValueError, match="at least one question"):
+        list(iter_questions(io.StringIO('{"version": "1.0", "questions": []}')))
+
+
+@pytest.mark.parametrize(
+    ("version", "message"),
+    [
+        ({"version": "2.0"}, "Unsupported quiz version '2.0'"),
+        ({"version": None}, "Unsupported quiz version None"),
+        ({}, "Quiz JSON has no version"),
+    ],
+)
+def test_iter_questions_checks_version(
+    valid_quiz: Quiz, version: dict[str, object], message: str
+) -> None:
+    """Test that validation rejects quiz JSON of a missing or unsupported version."""
+    text = json.dumps({"questions": valid_quiz.model_dump()["questions"], **version})
+
+    with pytest.raises(ParsingError, match=message):
+        list(iter_questions(io.StringIO(text)))
+    assert list(iter_questions(io.StringIO(text), validate=False)) == valid_quiz.questions
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"questions": [{"id": 1,', '{"questions" [', '["questions"]', '{"questions": []} x'],
+)
+def test_iter_questions_invalid_json(text: str) -> None:
+    """Test that malformed JSON raises ValueError."""
+    with pytest.raises(ValueError, match="Invalid quiz JSON"):
+        list(iter_questions(io.StringIO(text), validate=False))
@@ -0,0 +1,47 @@
+"""Tests for the source position map."""
+
+import pytest
+
+from question_parser.sourcemap import SourceMap
+
+
+@pytest.fixture
+def sources() -> SourceMap:
+    """A map of two questions, the first preceded by a title paragraph."""
+    sources = SourceMap()
+    sources.append(2, range(3, 5), 10, [6, 7, 8, 9])
+    sources.append(10, range(11, 12), 16, [12, 13, 14, 15])
+    return sources
+
+
+def test_lookups(sources: SourceMap) -> None:
+    """Test that questions, texts and choices are looked up by id."""
+    assert len(sources) == 2
+    assert sources.question(1) == range(2, 10)
+    assert sources.text(1) == range(3, 5)
+    assert sources.choice(1, "A") == 6
+    assert sources.choice(2, "D") == 15
+
+
+def test_unknown_ids_and_labels(sources: SourceMap) -> None:
+    """Test that unknown question ids and choice labels raise KeyError."""
+    for question_id in (0, 3):
+        with pytest.raises(KeyError):
+            sources.question(question_id)
+    with pytest.raises(KeyError):
+        sources.choice(1, "E")
+
+
+def test_find(sources: SourceMap) -> None:
+    """Test that find returns the question containing a paragraph."""
+    assert sources.find(0) is None
+    assert sources.find(2) == 1
+    assert sources.find(9) == 1
+    assert sources.find(10) == 2
+    assert sources.find(15) == 2
+    assert sources.find(16) is None
+
+
+def test_nbytes(sources: SourceMap) -> None:
+    """Test that each question takes 32 bytes of positions."""
+    assert sources.nbytes == 64
@@ -0,0 +1,132 @@
+"""Tests for the SQLite question bank."""
+
+import shutil
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from question_parser import store
+from question_parser.errors import ParsingError
+from question_parser.models import Quiz
+from question_parser.store import QuestionBank, content_hash, text_hash
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def bank() -> Iterator[QuestionBank]:
+    """An empty in-memory question bank."""
+    with QuestionBank() as bank:
+        yield bank
+
+
+def test_import_quiz_and_lookup(bank: QuestionBank, valid_quiz: Quiz) -> None:
+    """Test storing a quiz and reading questions back as models."""
+    bank.import_quiz("bank.json", valid_quiz, file_hash="abc")
+
+    assert bank.count() == 2
+    assert bank.get_question("bank.json", 2) == valid_quiz.questions[1]
+    assert bank.get_question("bank.json", 3) is None
+    assert bank.questions_for_source("bank.json") == valid_quiz.questions
+    assert bank.sources_with_hash("abc") == [str(Path("bank.json").resolve())]
+
+
+def test_import_quiz_replaces_previous(bank: QuestionBank, valid_quiz: Quiz) -> None:
+    """Test that re-importing a source replaces its questions."""
+    bank.import_quiz("bank.json", valid_quiz, file_hash="abc")
+    smaller = Quiz(questions=valid_quiz.questions[:1])
+
+    bank.import_quiz("bank.json", smaller, file_hash="def")
+
+    assert bank.count() == 1
+    assert bank.sources_with_hash("abc") == []
+
+
+def test_find_by_text_ignores_case_and_spacing(bank: QuestionBank, valid_quiz: Quiz) -> None:
+    """Test text lookup across sources."""
+    bank.import_quiz("a.json", valid_quiz, file_hash="a")
+    bank.import_quiz("b.json", valid_quiz, file_hash="b")
+
+    found = bank.find_by_text("  what is the CAPITAL of   France? ")
+
+    assert [Path(f.source).name for f in found] == ["a.json", "b.json"]
+    assert found[0].question == valid_quiz.questions[0]
+
+
+def test_find_by_id(bank: QuestionBank, valid_quiz: Quiz) -> None:
+    """Test question id lookup across sources."""
+    bank.import_quiz("a.json", valid_quiz, file_hash="a")
+    bank.import_quiz("b.json", valid_quiz, file_hash="b")
+
+    assert [f.question.text for f in bank.find_by_id(2)] == ["What is 2 + 2?"] * 2
+
+
+def test_import_files_skips_unchanged(tmp_path: Path, valid_quiz: Quiz) -> None:
+    """Test that only files whose content hash changed are re-imported."""
+    docx = tmp_path / "quiz.docx"
+    shutil.copy(FIXTURES_DIR / "valid_quiz.docx", docx)
+    json_file = tmp_path / "quiz.json"
+    json_file.write_text(valid_quiz.model_dump_json())
+
+    with QuestionBank(tmp_path / "bank.db") as bank:
+        first = bank.import_files([docx, json_file])
+        second = bank.import_files([docx, json_file])
+        json_file.write_text(Quiz(questions=valid_quiz.questions[:1]).model_dump_json())
+        third = bank.import_files([docx, json_file])
+
+        assert first.imported == [str(docx.resolve()), str(json_file.resolve())]
+        assert second.imported == []
+        assert len(second.unchanged) == 2
+        assert third.imported == [str(json_file.resolve())]
+        assert bank.count() == 3
+        assert bank.sources_with_hash(content_hash(docx.read_bytes())) == [str(docx.resolve())]
+
+
+def test_import_files_is_atomic(tmp_path: Path, bank: QuestionBank) -> None:
+    """Test that a file that fails to parse rolls back the whole batch."""
+    docx = tmp_path / "quiz.docx"
+    shutil.copy(FIXTURES_DIR / "valid_quiz.docx", docx)
+    broken = tmp_path / "broken.docx"
+    shutil.copy(FIXTURES_DIR / "with_empty_paragraphs.docx", broken)
+
+    with pytest.raises(ParsingError):
+        bank.import_files([docx, broken])
+
+    assert bank.count() == 0
+
+
+def test_import_files_stores_each_quiz_as_parsed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that each file is stored before the next is parsed, without blocking readers."""
+    paths = []
+    for name in ("first.docx", "second.docx"):
+        paths.append(tmp_path / name)
+        shutil.copy(FIXTURES_DIR / "valid_quiz.docx", paths[-1])
+    load_quiz = store.load_quiz
+    # (questions seen by the importing connection, questions committed) at each parse
+    counts: list[tuple[int, int]] = []
+
+    with QuestionBank(tmp_path / "bank.db") as bank:
+
+        def load_and_count(path: str | Path, data: bytes) -> Quiz:
+            with closing(sqlite3.connect(tmp_path / "bank.db", timeout=0)) as reader:
+                (committed,) = reader.execute("SELECT COUNT(*) FROM questions").fetchone()
+            counts.append((bank.count(), committed))
+            return load_quiz(path, data)
+
+        monkeypatch.setattr(store, "load_quiz", load_and_count)
+        result = bank.import_files(paths)
+
+        assert len(result.imported) == 2
+        assert counts == [(0, 0), (2, 0)]
+        assert bank.count() == 4
+
+
+def test_text_hash_normalizes() -> None:
+    """Test that the text hash folds whitespace and case only."""
+    assert text_hash("A  b\nC") == text_hash("a b c")
+    assert text_hash("a b c") != text_hash("a b d")
@@ -0,0 +1,114 @@
+"""Tests for bounded-memory conversion."""
+
+import io
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from question_parser.errors import ParsingError
+from question_parser.extractor import DocxExtractor
+from question_parser.models import Choice, Question, Quiz
+from question_parser.parser import QuestionParser
+from question_parser.streaming import QuizWriter, convert_bounded
+from question_parser.synthetic import build_docx, synthetic_docx
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def test_quiz_writer_matches_model_dump(valid_quiz: Quiz) -> None:
+    """Test that the writer produces exactly Quiz.model_dump_json()."""
+    unicode_question = Question(
+        id=3,
+        text='Qu\'est-ce que "ça"?\nLigne deux\t😀',
+        choices=[
+            Choice(label=label, text=f"{label} — é") for label in "ABCD"  # type: ignore[arg-type]
+        ],
+    )
+    quiz = Quiz(questions=[*valid_quiz.questions, unicode_question])
+    output = io.StringIO()
+
+    with QuizWriter(output) as writer:
+        for question in quiz.questions:
+            writer.write(question)
+
+    assert output.getvalue() == quiz.model_dump_json()
+    assert Quiz.model_validate_json(output.getvalue()) == quiz
+
+
+def test_quiz_writer_rejects_out_of_sequence_ids(valid_question_2: Question) -> None:
+    """Test that ids must follow on from the first id."""
+    writer = QuizWriter(io.StringIO())
+
+    with pytest.raises(ParsingError, match="expected 1, got 2"):
+        writer.write(valid_question_2)
+
+
+def test_quiz_writer_names_its_first_id(valid_question_2: Question) -> None:
+    """Test that sequence errors name the writer's first id, not QUESTION_ID_START."""
+    writer = QuizWriter(io.StringIO(), first_id=10)
+
+    with pytest.raises(ParsingError, match="starting from 10, expected 10, got 2"):
+        writer.write(valid_question_2)
+
+
+def test_quiz_writer_rejects_empty_quiz() -> None:
+    """Test that a quiz without questions cannot be finished."""
+    with pytest.raises(ParsingError, match="No valid questions found"):
+        QuizWriter(io.StringIO()).close()
+
+
+@pytest.mark.parametrize("name", ["valid_quiz.docx", "unlabeled_quiz.docx"])
+def test_convert_bounded_matches_parse(name: str) -> None:
+    """Test that bounded conversion gives the same JSON as the in-memory pipeline."""
+    path = FIXTURES_DIR / name
+    output = io.StringIO()
+
+    count = convert_bounded(path, output, max_memory=1024)
+
+    quiz = QuestionParser().parse(DocxExtractor().extract(path))
+    assert count == len(quiz.questions)
+    assert output.getvalue() == quiz.model_dump_json()
+
+
+def test_convert_bounded_writes_nothing_on_error() -> None:
+    """Test that a parsing error leaves the output untouched."""
+    data = build_docx(["Question 1", "Text", "A. One", "B. Two", "C. Three", "D. Four"] * 2)
+    output = io.StringIO()
+
+    with pytest.raises(ParsingError, match="expected 2, got 1"):
+        convert_bounded(data, output)
+
+    assert output.getvalue() == ""
+
+
+def test_convert_bounded_rejects_non_positive_budget() -> None:
+    """Test that the memory budget must be positive."""
+    with pytest.raises(ValueError, match="must be positive"):
+        convert_bounded(FIXTURES_DIR / "valid_quiz.docx", io.StringIO(), max_memory=0)
+
+
+def _peak_memory(tmp_path: Path, num_questions: int) -> int:
+    """Return the traced peak of a bounded conversion of a synthetic document."""
+    source = tmp_path / f"quiz-{num_questions}.docx"
+    source.write_bytes(synthetic_docx(num_questions))
+
+    with open(tmp_path / f"quiz-{num_questions}.json", "w", encoding="utf-8") as output:
+        tracemalloc.start()
+        try:
+            convert_bounded(source, output, max_memory=256 * 1024)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return peak
+
+
+def test_convert_bounded_memory_is_constant(tmp_path: Path) -> None:
+    """Test that peak memory does not grow with document size."""
+    small = _peak_memory(tmp_path, 300)
+    large = _peak_memory(tmp_path, 3000)
+
+    # Ten times the questions, but the same ceiling: the spill buffer and
+    # per-question working set dominate, not the document
+    assert large < small * 1.5
+    assert large < 1024 * 1024
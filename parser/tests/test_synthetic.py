@@ -0,0 +1,31 @@
+"""Tests for synthetic quiz generation."""
+
+from pathlib import Path
+
+from question_parser.defaults import CHOICES_PER_QUESTION
+from question_parser.extractor import DocxExtractor
+from question_parser.parser import QuestionParser
+from question_parser.synthetic import synthetic_docx, synthetic_paragraphs
+
+
+def test_synthetic_paragraphs_deterministic() -> None:
+    """Test that the same seed always gives the same paragraphs."""
+    assert synthetic_paragraphs(5, seed=3) == synthetic_paragraphs(5, seed=3)
+    assert synthetic_paragraphs(5, seed=3) != synthetic_paragraphs(5, seed=4)
+
+
+def test_synthetic_paragraphs_parse(parser: QuestionParser) -> None:
+    """Test that labeled and unlabeled synthetic quizzes parse."""
+    for labeled in (True, False):
+        quiz = parser.parse(synthetic_paragraphs(3, labeled=labeled))
+
+        assert len(quiz.questions) == 3
+        assert all(len(q.choices) == CHOICES_PER_QUESTION for q in quiz.questions)
+
+
+def test_synthetic_docx_round_trip(tmp_path: Path) -> None:
+    """Test that the generated DOCX extracts back to the same paragraphs."""
+    docx_path = tmp_path / "synthetic.docx"
+    docx_path.write_bytes(synthetic_docx(4, seed=1))
+
+    assert DocxExtractor().extract(docx_path) == synthetic_paragraphs(4, seed=1)
@@ -0,0 +1,71 @@
+"""Tests for the quiz variant generator."""
+
+import io
+import json
+
+from question_parser.defaults import LABEL_CHOICES, QUESTION_ID_START
+from question_parser.models import Quiz
+from question_parser.parser import QuestionParser
+from question_parser.synthetic import synthetic_paragraphs
+from question_parser.variants import VariantGenerator
+
+
+def make_quiz(num_questions: int) -> Quiz:
+    """Build a synthetic quiz."""
+    return QuestionParser().parse(synthetic_paragraphs(num_questions))
+
+
+def test_variant_is_valid_quiz() -> None:
+    """Test that a variant validates as a Quiz with renumbered questions."""
+    variant = Quiz.model_validate_json(VariantGenerator(make_quiz(10), seed=1).variant_json(0))
+
+    assert [q.id for q in variant.questions] == list(
+        range(QUESTION_ID_START, 10 + QUESTION_ID_START)
+    )
+    assert all([c.label for c in q.choices] == list(LABEL_CHOICES) for q in variant.questions)
+
+
+def test_variant_key_maps_back_to_original() -> None:
+    """Test that the answer-key mapping recovers the original question and choices."""
+    quiz = make_quiz(10)
+    data = json.loads(VariantGenerator(quiz, seed=5).variant_json(3))
+    originals = {q.id: q for q in quiz.questions}
+
+    for question, (original_id, original_labels) in zip(
+        data["questions"], data["key"], strict=True
+    ):
+        original = originals[original_id]
+        assert question["text"] == original.text
+        original_choices = {c.label: c.text for c in original.choices}
+        for choice, original_label in zip(question["choices"], original_labels, strict=True):
+            assert choice["text"] == original_choices[original_label]
+
+
+def test_variants_reproducible_and_distinct() -> None:
+    """Test that variants depend only on the seed and index."""
+    quiz = make_quiz(10)
+    generator = VariantGenerator(quiz, seed=7)
+
+    assert generator.variant_json(2) == VariantGenerator(quiz, seed=7).variant_json(2)
+    assert generator.variant_json(2) != generator.variant_json(3)
+    assert generator.variant_json(2) != VariantGenerator(quiz, seed=8).variant_json(2)
+    assert list(generator.iter_variants(2, start=5)) == [
+        generator.variant_json(5),
+        generator.variant_json(6),
+    ]
+
+
+def test_write_ndjson_and_json() -> None:
+    """Test the two output formats."""
+    generator = VariantGenerator(make_quiz(3), seed=0)
+    ndjson = io.StringIO()
+    document = io.StringIO()
+
+    generator.write_ndjson(ndjson, 4)
+    generator.write_json(document, 4)
+
+    lines = ndjson.getvalue().splitlines()
+    assert [json.loads(line)["variant"] for line in lines] == [0, 1, 2, 3]
+    data = json.loads(document.getvalue())
+    assert data["seed"] == 0
+    assert [json.loads(line) for line in lines] == data["variants"]
@@ -38,6 +38,24 @@ const mockQuiz: Quiz = {
   ],
 }
 
+const notFound = {
+  ok: false,
+  status: 404,
+  statusText: 'Not Found',
+  headers: new Headers({ 'content-type': 'text/plain' }),
+} as Response
+
+const jsonHeaders = new Headers({ 'content-type': 'application/json' })
+
+/**
+ * Serve the quiz from /quiz.json, with no bundle manifest deployed.
+ */
+function mockQuizJson(response: Partial<Response>): void {
+  vi.mocked(global.fetch).mockImplementation(async (input) =>
+    input === '/quiz-manifest.json' ? notFound : (response as Response),
+  )
+}
+
 describe('useQuiz', () => {
   beforeEach(() => {
     localStorage.clear()
@@ -52,10 +70,10 @@ describe('useQuiz', () => {
 
   describe('loadQuiz', () => {
     it('should load quiz from /quiz.json', async () => {
-      vi.mocked(global.fetch).mockResolvedValueOnce({
+      mockQuizJson({
         ok: true,
         json: async () => mockQuiz,
-      } as Response)
+      })
 
       const { loadQuiz, quiz, loading, error } = useQuiz()
 
@@ -69,13 +87,111 @@ describe('useQuiz', () => {
       expect(loading.value).toBe(false)
       expect(error.value).toBeNull()
       expect(quiz.value).toEqual(mockQuiz)
+      expect(global.fetch).toHaveBeenLastCalledWith('/quiz.json')
+    })
+
+    it('should load the hashed quiz file named by the bundle manifest', async () => {
+      vi.mocked(global.fetch).mockImplementation(async (input) => {
+        if (input === '/quiz-manifest.json') {
+          return {
+            ok: true,
+            headers: jsonHeaders,
+            json: async () => ({ file: 'quiz.0123456789abcdef.json' }),
+          } as Response
+        }
+        if (input === '/quiz.0123456789abcdef.json') {
+          return { ok: true, json: async () => mockQuiz } as Response
+        }
+        return notFound
+      })
+
+      const { loadQuiz, quiz, error } = useQuiz()
+
+      await loadQuiz()
+
+      expect(error.value).toBeNull()
+      expect(quiz.value).toEqual(mockQuiz)
+      expect(global.fetch).toHaveBeenCalledWith('/quiz-manifest.json', { cache: 'no-cache' })
+    })
+
+    it('should fall back to /quiz.json when the manifest path serves the app page', async () => {
+      // Vite's dev server and SPA hosts answer unknown paths with index.html and status 200
+      vi.mocked(global.fetch).mockImplementation(async (input) => {
+        if (input === '/quiz-manifest.json') {
+          return {
+            ok: true,
+            headers: new Headers({ 'content-type': 'text/html' }),
+            json: async () => JSON.parse('<!DOCTYPE html>'),
+          } as Response
+        }
+        return { ok: true, json: async () => mockQuiz } as Response
+      })
+
+      const { loadQuiz, quiz, error } = useQuiz()
+
+      await loadQuiz()
+
+      expect(error.value).toBeNull()
+      expect(quiz.value).toEqual(mockQuiz)
+      expect(global.fetch).toHaveBeenLastCalledWith('/quiz.json')
+    })
+
+    it('should fall back to /quiz.json when the manifest is not valid JSON', async () => {
+      vi.mocked(global.fetch).mockImplementation(async (input) => {
+        if (input === '/quiz-manifest.json') {
+          return {
+            ok: true,
+            headers: jsonHeaders,
+            json: async () => JSON.parse('{"file":'),
+          } as Response
+        }
+        return { ok: true, json: async () => mockQuiz } as Response
+      })
+
+      const { loadQuiz, quiz, error } = useQuiz()
+
+      await loadQuiz()
+
+      expect(error.value).toBeNull()
+      expect(quiz.value).toEqual(mockQuiz)
+      expect(global.fetch).toHaveBeenLastCalledWith('/quiz.json')
+    })
+
+    it('should fall back to /quiz.json when the manifest request fails', async () => {
+      vi.mocked(global.fetch).mockImplementation(async (input) => {
+        if (input === '/quiz-manifest.json') {
+          throw new TypeError('Failed to fetch')
+        }
+        return { ok: true, json: async () => mockQuiz } as Response
+      })
+
+      const { loadQuiz, quiz, error } = useQuiz()
+
+      await loadQuiz()
+
+      expect(error.value).toBeNull()
+      expect(quiz.value).toEqual(mockQuiz)
+      expect(global.fetch).toHaveBeenLastCalledWith('/quiz.json')
+    })
+
+    it('should fall back to /quiz.json when the manifest request is rejected', async () => {
+      vi.mocked(global.fetch).mockImplementation(async (input) =>
+        input === '/quiz-manifest.json'
+          ? ({ ...notFound, status: 403, statusText: 'Forbidden' } as Response)
+          : ({ ok: true, json: async () => mockQuiz } as Response),
+      )
+
+      const { loadQuiz, quiz, error } = useQuiz()
+
+      await loadQuiz()
+
+      expect(error.value).toBeNull()
+      expect(quiz.value).toEqual(mockQuiz)
+      expect(global.fetch).toHaveBeenLastCalledWith('/quiz.json')
     })
 
     it('should handle fetch errors', async () => {
-      vi.mocked(global.fetch).mockResolvedValueOnce({
-        ok: false,
-        statusText: 'Not Found',
-      } as Response)
+      mockQuizJson(notFound)
 
       const { loadQuiz, quiz, error } = useQuiz()
 
@@ -86,7 +202,7 @@ describe('useQuiz', () => {
     })
 
     it('should handle network errors', async () => {
-      vi.mocked(global.fetch).mockRejectedValueOnce(new Error('Network error'))
+      vi.mocked(global.fetch).mockRejectedValue(new Error('Network error'))
 
       const { loadQuiz, error } = useQuiz()
 
@@ -99,10 +215,10 @@ describe('useQuiz', () => {
   describe('navigation', () => {
     beforeEach(async () => {
       localStorage.clear()
-      vi.mocked(global.fetch).mockResolvedValue({
+      mockQuizJson({
         ok: true,
         json: async () => mockQuiz,
-      } as Response)
+      })
     })
 
     it('should start at first question', async () => {
@@ -192,10 +308,10 @@ describe('useQuiz', () => {
   describe('answer tracking', () => {
     beforeEach(async () => {
       localStorage.clear()
-      vi.mocked(global.fetch).mockResolvedValue({
+      mockQuizJson({
         ok: true,
         json: async () => mockQuiz,
-      } as Response)
+      })
     })
 
     it('should track selected answers', async () => {
@@ -257,10 +373,10 @@ describe('useQuiz', () => {
   describe('computed properties', () => {
     beforeEach(async () => {
       localStorage.clear()
-      vi.mocked(global.fetch).mockResolvedValue({
+      mockQuizJson({
         ok: true,
         json: async () => mockQuiz,
-      } as Response)
+      })
     })
 
     it('should calculate total questions', async () => {
@@ -314,10 +430,10 @@ describe('useQuiz', () => {
   describe('restart', () => {
     beforeEach(async () => {
       localStorage.clear()
-      vi.mocked(global.fetch).mockResolvedValue({
+      mockQuizJson({
         ok: true,
         json: async () => mockQuiz,
-      } as Response)
+      })
     })
 
     it('should reset quiz state', async () => {
@@ -355,10 +471,10 @@ describe('useQuiz', () => {
 
   describe('localStorage persistence', () => {
     it('should restore state from localStorage', async () => {
-      vi.mocked(global.fetch).mockResolvedValue({
+      mockQuizJson({
         ok: true,
         json: async () => mockQuiz,
-      } as Response)
+      })
 
       // First instance
       const quiz1 = useQuiz()
@@ -6,6 +6,38 @@ import { ref, computed } from 'vue'
 import type { Quiz, Question, QuizState, ChoiceLabel } from '@/types'
 import { useLocalStorage } from './useLocalStorage'
 
+// Written by `question-parser --bundle`; points at the content-hashed quiz file
+const QUIZ_MANIFEST_URL = '/quiz-manifest.json'
+// Plain quiz file, used when no bundle manifest is deployed
+const QUIZ_URL = '/quiz.json'
+
+interface QuizManifest {
+  file: string
+}
+
+/**
+ * Resolve the URL of the current quiz file.
+ * The manifest is revalidated on every load; the hashed file it names never
+ * changes, so it can be served from cache. Falls back to the plain quiz file
+ * whenever no usable manifest is deployed: the request fails or is rejected,
+ * or the server answers with an HTML page instead, as the Vite dev server and
+ * SPA hosts do for unknown paths. Errors loading the quiz itself still surface.
+ */
+async function resolveQuizUrl(): Promise<string> {
+  try {
+    const response = await fetch(QUIZ_MANIFEST_URL, { cache: 'no-cache' })
+    const contentType = response.headers.get('content-type') ?? ''
+    if (!response.ok || !contentType.includes('json')) {
+      return QUIZ_URL
+    }
+
+    const manifest: QuizManifest = await response.json()
+    return typeof manifest.file === 'string' ? `/${manifest.file}` : QUIZ_URL
+  } catch {
+    return QUIZ_URL
+  }
+}
+
 function getInitialState(): QuizState {
   return {
     currentQuestionIndex: 0,
@@ -57,7 +89,7 @@ export function useQuiz() {
     error.value = null
 
     try {
-      const response = await fetch('/quiz.json')
+      const response = await fetch(await resolveQuizUrl())
       if (!response.ok) {
         throw new Error(`Failed to load quiz: ${response.statusText}`)
       }